@@ -4,24 +4,42 @@ Clash Royale Tournament Finder
 A web app to find and filter CR tournaments
 """
 
+import cProfile
+import gzip
+import hashlib
+import itertools
 import json
 import os
 import time
 import threading
 import logging
 import queue
+import multiprocessing
+import atexit
 import asyncio
 import aiohttp
 import certifi
 import ssl
-from logging.handlers import RotatingFileHandler
+import pstats
+import socket
+import sqlite3
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from datetime import datetime, timezone
-from collections import defaultdict
-from urllib.parse import quote
-from flask import Flask, render_template, jsonify, request, session, redirect, url_for, send_from_directory, Response, stream_with_context
+from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import quote, urlparse
+from flask import Flask, render_template, jsonify, request, session, redirect, url_for, send_from_directory, Response, stream_with_context, g, has_request_context
 from functools import wraps
 import secrets
 
+import pool_worker
+
+try:
+    import orjson
+except ImportError:  # optional faster JSON backend
+    orjson = None
+
 app = Flask(__name__)
 
 # =============================================================================
@@ -55,34 +73,1070 @@ def login_required(f):
 # LOGGING SETUP
 # =============================================================================
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-LOGS_DIR = os.path.join(BASE_DIR, 'logs')
+LOGS_DIR = os.environ.get('CR_FINDER_LOGS_DIR') or os.path.join(BASE_DIR, 'logs')
 os.makedirs(LOGS_DIR, exist_ok=True)
 
 LOG_FILE = os.path.join(LOGS_DIR, 'tournament_finder.log')
 
+LOG_LEVEL = getattr(logging, os.environ.get('LOG_LEVEL', 'INFO').upper(), logging.INFO)
+
+# Spawned pool workers (crawl shards, JSON decoding) import this module too, but
+# the log file, the tournament store and the shared backend belong to the
+# serving process. Under `python app.py` the workers import it as __mp_main__.
+IN_POOL_WORKER = pool_worker.IN_POOL_WORKER or __name__ == '__mp_main__'
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler with a bounded queue that drops records instead of blocking.
+
+    Request threads only format and enqueue; file rotation and console I/O
+    happen on the QueueListener thread. When the listener falls behind (slow
+    disk, rotation), new records are counted in `dropped` and discarded.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Many request threads can overflow at once; += alone would lose counts.
+            with self._dropped_lock:
+                self.dropped += 1
+
+
 # Create logger
 logger = logging.getLogger('TournamentFinder')
-logger.setLevel(logging.DEBUG)
+logger.setLevel(LOG_LEVEL)
 
 # Avoid duplicated log lines if the module gets imported multiple times.
-if not logger.handlers:
+if not logger.handlers and IN_POOL_WORKER:
+    # Workers log to the inherited stderr only; one rotating writer per file.
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(LOG_LEVEL)
+    console_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s', datefmt='%H:%M:%S'))
+    logger.addHandler(console_handler)
+elif not logger.handlers:
     # File handler (rotating, max 5MB, keep 3 backups)
     file_handler = RotatingFileHandler(LOG_FILE, maxBytes=5*1024*1024, backupCount=3)
-    file_handler.setLevel(logging.INFO)
+    file_handler.setLevel(LOG_LEVEL)
     file_format = logging.Formatter('%(asctime)s %(levelname)s %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
     file_handler.setFormatter(file_format)
 
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
+    console_handler.setLevel(LOG_LEVEL)
     console_format = logging.Formatter('%(asctime)s %(levelname)s %(message)s', datefmt='%H:%M:%S')
     console_handler.setFormatter(console_format)
 
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Route everything through a bounded queue so log I/O stays off request threads
+    _log_queue = queue.Queue(maxsize=int(os.environ.get('LOG_QUEUE_SIZE', 10000)))
+    _queue_handler = DroppingQueueHandler(_log_queue)
+    _queue_handler.setLevel(LOG_LEVEL)
+    log_listener = QueueListener(_log_queue, file_handler, console_handler, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+    logger.addHandler(_queue_handler)
+
+log_queue_handler = logger.handlers[0]
+
+# Per-tournament debug lines are sampled: at most this many rows per request.
+LOG_SAMPLE_ROWS = int(os.environ.get('LOG_SAMPLE_ROWS', 5))
+
+
+def log_sampled_tournaments(label, tournaments):
+    """Log a handful of tournaments at DEBUG; free when DEBUG is off."""
+    if not tournaments or not logger.isEnabledFor(logging.DEBUG):
+        return
+    step = max(1, len(tournaments) // max(1, LOG_SAMPLE_ROWS))
+    sample = tournaments[::step][:LOG_SAMPLE_ROWS]
+    logger.debug("%s (%s of %s): %s", label, len(sample), len(tournaments), "; ".join(
+        f"{t.get('tag')} \"{t.get('name')}\" {t.get('capacity')}/{t.get('maxCapacity')}" for t in sample
+    ))
+
 
 # =============================================================================
+# STRUCTURED EVENT LOG
+# =============================================================================
+EVENTS_FILE = os.path.join(LOGS_DIR, 'events.jsonl')
+EVENTS_INDEX_FILE = os.path.join(LOGS_DIR, 'events.idx')
+EVENT_LOG_BACKUPS = int(os.environ.get('EVENT_LOG_BACKUPS', 5))
+EVENT_LOG_QUEUE_SIZE = int(os.environ.get('EVENT_LOG_QUEUE_SIZE', 1000))
+# Files of processes that stopped writing this long ago are deleted.
+EVENT_LOG_RETENTION_HOURS = float(os.environ.get('EVENT_LOG_RETENTION_HOURS', 7 * 24))
+
+
+def normalize_tag(tag):
+    """Canonical tournament tag form used as the event index key ("#ABC123")."""
+    tag = str(tag or '').strip().upper()
+    if tag and not tag.startswith('#'):
+        tag = '#' + tag
+    return tag
+
+
+class TournamentEventLog:
+    """JSON-lines event log with an on-disk index from tournament tag to file offsets.
+
+    record() only enqueues into a bounded queue (batches that do not fit are
+    counted in `dropped`); a daemon thread appends the events and the index
+    lines ("TAG\tOFFSET"), so request threads never touch the disk.
+
+    Every process writes its own pair of files ("events.<pid>.jsonl" and
+    "events.<pid>.idx" for the paths given), so offsets stay exact under
+    several gunicorn workers, and keeps `backups` rotated generations (.1,
+    .2, ...). lookup(tag) reads the new index lines of every process's files
+    and seeks straight to the indexed events instead of scanning.
+    """
+
+    def __init__(self, path, index_path, max_bytes=20 * 1024 * 1024, backups=EVENT_LOG_BACKUPS,
+                 queue_size=EVENT_LOG_QUEUE_SIZE, retention_hours=EVENT_LOG_RETENTION_HOURS):
+        self.base_path = path
+        self.base_index_path = index_path
+        self.path = self._process_path(path, os.getpid())
+        self.index_path = self._process_path(index_path, os.getpid())
+        self.max_bytes = max_bytes
+        self.backups = max(1, backups)
+        self.retention_hours = retention_hours
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._indexes = {}  # {(st_dev, st_ino) of an index file: [bytes read, {tag: [offsets]}]}
+        self._thread = None
+
+    @staticmethod
+    def _process_path(path, pid):
+        root, ext = os.path.splitext(path)
+        return f"{root}.{pid}{ext}"
+
+    def record(self, event, tags=()):
+        """Queue one event dict, indexed under every tag in `tags`."""
+        self.record_many([(event, tags)])
+
+    def record_many(self, entries):
+        """Queue (event, tags) pairs to be written together, or drop them if the writer is behind."""
+        if not entries:
+            return
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(list(entries))
+        except queue.Full:
+            with self._lock:
+                self.dropped += len(entries)
+
+    def flush(self, timeout=5.0):
+        """Block until everything queued so far is on disk (used by tests)."""
+        done = threading.Event()
+        self._ensure_writer()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def lookup(self, tag, limit=200):
+        """Return up to `limit` most recent events indexed under `tag`, oldest first."""
+        tag = normalize_tag(tag)
+        sources = []
+        with self._lock:
+            live = set()
+            for events_path, index_path in self._generations():
+                try:
+                    stat = os.stat(index_path)
+                    mtime = os.path.getmtime(events_path)
+                except OSError:
+                    continue
+                # Keyed by inode: rotation renames files without invalidating what was read.
+                key = (stat.st_dev, stat.st_ino)
+                live.add(key)
+                entry = self._indexes.get(key)
+                if entry is None or stat.st_size < entry[0]:
+                    entry = self._indexes[key] = [0, defaultdict(list)]
+                self._read_index(index_path, entry)
+                offsets = entry[1].get(tag)
+                if offsets:
+                    sources.append((mtime, events_path, list(offsets)))
+            for key in set(self._indexes) - live:
+                del self._indexes[key]
+
+        events = []
+        for _, path, offsets in sorted(sources):
+            try:
+                with open(path, 'rb') as f:
+                    size = os.fstat(f.fileno()).st_size
+                    for offset in offsets:
+                        if offset >= size:
+                            continue
+                        f.seek(offset)
+                        line = f.readline()
+                        try:
+                            events.append(json.loads(line))
+                        except ValueError:
+                            continue
+            except OSError:
+                continue
+        # Files of several processes interleave in time.
+        events.sort(key=lambda e: e.get('ts') or '')
+        return events[-limit:] if limit else events
+
+    def _generations(self):
+        """(events path, index path) of every process's files, current and rotated."""
+        directory = os.path.dirname(self.base_path) or '.'
+        root, ext = os.path.splitext(os.path.basename(self.base_path))
+        index_root, index_ext = os.path.splitext(self.base_index_path)
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            return []
+        paths = []
+        for name in names:
+            if not name.startswith(root + '.'):
+                continue
+            pid, sep, generation = name[len(root) + 1:].partition(ext)
+            if not (sep and pid.isdigit()) or (generation and not generation[1:].isdigit()):
+                continue
+            paths.append((os.path.join(directory, name), f"{index_root}.{pid}{index_ext}{generation}"))
+        return paths
+
+    @staticmethod
+    def _read_index(index_path, entry):
+        # Caller holds self._lock. Only whole lines count; a partial one is read next time.
+        try:
+            with open(index_path, 'rb') as f:
+                f.seek(entry[0])
+                data = f.read()
+        except OSError:
+            return
+        end = data.rfind(b'\n') + 1
+        for line in data[:end].decode('utf-8', errors='replace').splitlines():
+            tag, _, offset = line.partition('\t')
+            if offset.isdigit():
+                entry[1][tag].append(int(offset))
+        entry[0] += end
+
+    def _ensure_writer(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='event-log-writer', daemon=True)
+                self._thread.start()
+
+    def _prune_stale(self):
+        """Delete the files of processes that have not written for retention_hours."""
+        if self.retention_hours <= 0:
+            return
+        cutoff = time.time() - self.retention_hours * 3600
+        for events_path, index_path in self._generations():
+            try:
+                if os.path.getmtime(events_path) < cutoff:
+                    os.remove(events_path)
+                    os.remove(index_path)
+            except OSError:
+                continue
+
+    def _rotate_if_needed(self):
+        try:
+            if os.path.getsize(self.path) < self.max_bytes:
+                return
+        except OSError:
+            return
+        for path in (self.path, self.index_path):
+            for generation in range(self.backups - 1, 0, -1):
+                if os.path.exists(f"{path}.{generation}"):
+                    os.replace(f"{path}.{generation}", f"{path}.{generation + 1}")
+            if os.path.exists(path):
+                os.replace(path, path + '.1')
+
+    def _write(self, entries):
+        self._rotate_if_needed()
+        new_offsets = []
+        with open(self.path, 'ab') as f:
+            for event, tags in entries:
+                offset = f.tell()
+                f.write(json.dumps(event, separators=(',', ':'), ensure_ascii=False).encode('utf-8') + b'\n')
+                for tag in tags:
+                    new_offsets.append((normalize_tag(tag), offset))
+        if not new_offsets:
+            return
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            f.write(''.join(f"{tag}\t{offset}\n" for tag, offset in new_offsets))
+
+    def _run(self):
+        try:
+            self._prune_stale()
+        except Exception as e:
+            logger.error(f"Failed to prune old event logs: {e}")
+        while True:
+            item = self._queue.get()
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            try:
+                self._write(item)
+            except Exception as e:
+                logger.error(f"Failed to write event log: {e}")
+
+
+event_log = TournamentEventLog(EVENTS_FILE, EVENTS_INDEX_FILE)
+
+
+def tournament_event_fields(t):
+    """Compact per-tournament snapshot stored in crawl/search events."""
+    return {
+        "tag": t.get('tag'),
+        "name": t.get('name'),
+        "status": t.get('status'),
+        "players": t.get('capacity', 0),
+        "maxPlayers": t.get('maxCapacity', 0),
+        "gameModeId": t.get('gameMode', {}).get('id'),
+    }
+
+
+# Status of every tag in this process's previous crawl.
+_LAST_SEEN_STATUS = {}
+
+
+def seen_events(ts, tournaments):
+    """'seen' events for the tags of a crawl ({tag: tournament}) that are new or changed status.
+
+    Logging every tournament on every crawl would fill the event log with
+    repeats and rotate real history out within hours.
+    """
+    global _LAST_SEEN_STATUS
+    previous = _LAST_SEEN_STATUS
+    _LAST_SEEN_STATUS = {tag: t.get('status') for tag, t in tournaments.items()}
+    return [({"ts": ts, "event": "seen", **tournament_event_fields(t)}, (tag,))
+            for tag, t in tournaments.items()
+            if tag not in previous or previous[tag] != t.get('status')]
+
+# =============================================================================
+# TOURNAMENT STORE (optional SQLite copy of the crawl, with history)
+# =============================================================================
+TOURNAMENT_DB_PATH = os.environ.get('TOURNAMENT_DB_PATH', '')
+TOURNAMENT_HISTORY_HOURS = float(os.environ.get('TOURNAMENT_HISTORY_HOURS', 72))
+
+TOURNAMENT_DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawls (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    total INTEGER NOT NULL,
+    live INTEGER NOT NULL,
+    fill_rate REAL,
+    stats TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_crawls_ts ON crawls(ts);
+CREATE TABLE IF NOT EXISTS tournaments (
+    tag TEXT PRIMARY KEY,
+    crawl_id INTEGER NOT NULL,
+    type TEXT,
+    status TEXT,
+    game_mode_id TEXT,
+    level_cap INTEGER,
+    capacity INTEGER NOT NULL,
+    max_capacity INTEGER NOT NULL,
+    end_ts REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tournaments_crawl ON tournaments(crawl_id);
+CREATE INDEX IF NOT EXISTS idx_tournaments_status ON tournaments(status);
+CREATE INDEX IF NOT EXISTS idx_tournaments_mode ON tournaments(game_mode_id);
+CREATE INDEX IF NOT EXISTS idx_tournaments_level_cap ON tournaments(level_cap);
+CREATE INDEX IF NOT EXISTS idx_tournaments_end ON tournaments(end_ts);
+CREATE TABLE IF NOT EXISTS snapshots (
+    tag TEXT NOT NULL,
+    crawl_id INTEGER NOT NULL,
+    status TEXT,
+    players INTEGER NOT NULL,
+    max_players INTEGER NOT NULL,
+    PRIMARY KEY (tag, crawl_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_snapshots_crawl ON snapshots(crawl_id);
+"""
+
+
+def estimated_end_ts(t):
+    """Epoch seconds a tournament ends (or ended), from the best time fields it has."""
+    ended = parse_cr_time(t.get('endedTime'))
+    if ended:
+        return ended.timestamp()
+    start = parse_cr_time(t.get('startedTime'))
+    if start:
+        return start.timestamp() + (t.get('duration') or 0)
+    created = parse_cr_time(t.get('createdTime'))
+    if created:
+        return created.timestamp() + (t.get('preparationDuration') or 0) + (t.get('duration') or 0)
+    return None
+
+
+class TournamentStore:
+    """SQLite (WAL) copy of the latest crawl plus a per-tournament change history.
+
+    record_crawl() upserts every tournament by tag and appends a snapshot row
+    only for tournaments whose status or player count changed, so a tag's
+    history is a step series. The non-time /api/tournaments filters run as
+    indexed SQL against the latest crawl. Every gunicorn worker can read the
+    file while one writes; connections are per thread.
+    """
+
+    def __init__(self, path, history_hours=TOURNAMENT_HISTORY_HOURS):
+        self.path = path
+        self.history_hours = history_hours
+        self._local = threading.local()
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript(TOURNAMENT_DB_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _rows(tournaments):
+        """(tag, type, status, game_mode_id, level_cap, capacity, max_capacity, end_ts, data) per tournament."""
+        rows = []
+        for t in tournaments:
+            if not t.get('tag'):
+                continue
+            mode_id = t.get('gameMode', {}).get('id')
+            level_cap = t.get('levelCap')
+            rows.append((
+                t['tag'], t.get('type'), t.get('status'),
+                str(mode_id) if mode_id is not None else None,
+                level_cap if isinstance(level_cap, int) else None,
+                t.get('capacity', 0) or 0, t.get('maxCapacity', 0) or 0,
+                estimated_end_ts(t),
+                json.dumps(t, separators=(',', ':'), ensure_ascii=False),
+            ))
+        return rows
+
+    def record_crawl(self, tournaments, fetched_at_ts, stats):
+        """Store one finished crawl; returns its crawl id."""
+        rows = self._rows(tournaments)
+        live = sum(1 for row in rows if row[2] == 'inProgress')
+        rates = [row[5] / row[6] for row in rows if row[6]]
+        fill_rate = sum(rates) / len(rates) if rates else None
+
+        conn = self._connect()
+        with conn:
+            previous = {
+                row['tag']: (row['status'], row['capacity'], row['max_capacity'])
+                for row in conn.execute('SELECT tag, status, capacity, max_capacity FROM tournaments')
+            }
+            crawl_id = conn.execute(
+                'INSERT INTO crawls (ts, total, live, fill_rate, stats) VALUES (?, ?, ?, ?, ?)',
+                (fetched_at_ts, len(rows), live, fill_rate, json.dumps(stats, separators=(',', ':'))),
+            ).lastrowid
+            conn.executemany(
+                'INSERT INTO tournaments (tag, crawl_id, type, status, game_mode_id, level_cap, capacity,'
+                ' max_capacity, end_ts, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'
+                ' ON CONFLICT(tag) DO UPDATE SET crawl_id=excluded.crawl_id, type=excluded.type,'
+                ' status=excluded.status, game_mode_id=excluded.game_mode_id, level_cap=excluded.level_cap,'
+                ' capacity=excluded.capacity, max_capacity=excluded.max_capacity, end_ts=excluded.end_ts,'
+                ' data=excluded.data',
+                [(row[0], crawl_id) + row[1:] for row in rows],
+            )
+            conn.executemany(
+                'INSERT INTO snapshots (tag, crawl_id, status, players, max_players) VALUES (?, ?, ?, ?, ?)',
+                [(row[0], crawl_id, row[2], row[5], row[6]) for row in rows
+                 if previous.get(row[0]) != (row[2], row[5], row[6])],
+            )
+            self._prune(conn, crawl_id, fetched_at_ts - self.history_hours * 3600)
+        return crawl_id
+
+    def update_tournaments(self, tournaments, crawl_id):
+        """Overwrite refreshed tournaments of crawl `crawl_id` in place.
+
+        Tags a newer crawl has taken over are left alone. A status or player
+        change becomes (or replaces) the tag's snapshot for `crawl_id`.
+        """
+        rows = self._rows(tournaments)
+        conn = self._connect()
+        with conn:
+            current = {
+                row['tag']: (row['status'], row['capacity'], row['max_capacity'])
+                for row in conn.execute(
+                    f"SELECT tag, status, capacity, max_capacity FROM tournaments"
+                    f" WHERE crawl_id = ? AND tag IN ({','.join('?' * len(rows))})",
+                    [crawl_id] + [row[0] for row in rows])
+            }
+            rows = [row for row in rows if row[0] in current]
+            conn.executemany(
+                'UPDATE tournaments SET type=?, status=?, game_mode_id=?, level_cap=?, capacity=?,'
+                ' max_capacity=?, end_ts=?, data=? WHERE tag = ? AND crawl_id = ?',
+                [row[1:] + (row[0], crawl_id) for row in rows],
+            )
+            conn.executemany(
+                'INSERT OR REPLACE INTO snapshots (tag, crawl_id, status, players, max_players) VALUES (?, ?, ?, ?, ?)',
+                [(row[0], crawl_id, row[2], row[5], row[6]) for row in rows
+                 if current[row[0]] != (row[2], row[5], row[6])],
+            )
+
+    @staticmethod
+    def _prune(conn, latest_crawl_id, cutoff_ts):
+        old = [row[0] for row in conn.execute('SELECT id FROM crawls WHERE ts < ? AND id != ?',
+                                              (cutoff_ts, latest_crawl_id))]
+        if old:
+            conn.executemany('DELETE FROM snapshots WHERE crawl_id = ?', [(crawl_id,) for crawl_id in old])
+            conn.executemany('DELETE FROM crawls WHERE id = ?', [(crawl_id,) for crawl_id in old])
+        conn.execute('DELETE FROM tournaments WHERE crawl_id != ? AND (end_ts IS NULL OR end_ts < ?)',
+                     (latest_crawl_id, cutoff_ts))
+
+    def latest_crawl(self):
+        """(id, ts, stats) of the newest stored crawl, or None."""
+        row = self._connect().execute('SELECT id, ts, stats FROM crawls ORDER BY id DESC LIMIT 1').fetchone()
+        return (row['id'], row['ts'], json.loads(row['stats'])) if row else None
+
+    def load_latest(self):
+        """(tournaments, fetched_at_ts, stats, crawl id) of the newest stored crawl, or None."""
+        latest = self.latest_crawl()
+        if latest is None:
+            return None
+        crawl_id, ts, stats = latest
+        rows = self._connect().execute('SELECT data FROM tournaments WHERE crawl_id = ?', (crawl_id,))
+        return [json.loads(row['data']) for row in rows], ts, stats, crawl_id
+
+    def crawl_tournaments(self, crawl_id, tags=None):
+        """Tournaments of crawl `crawl_id` (only `tags`, if given).
+
+        Once a newer crawl (another worker sharing the file) has taken the
+        rows over, the newest crawl's tournaments are returned instead.
+        """
+        latest = self.latest_crawl()
+        if latest is None:
+            return []
+        sql = 'SELECT data FROM tournaments WHERE crawl_id = ?'
+        params = [crawl_id if crawl_id == latest[0] else latest[0]]
+        if tags is not None:
+            tags = list(tags)
+            sql += f" AND tag IN ({','.join('?' * len(tags))})"
+            params += tags
+        return [json.loads(row['data']) for row in self._connect().execute(sql, params)]
+
+    def crawl_total(self, crawl_id):
+        """How many tournaments crawl `crawl_id` found."""
+        row = self._connect().execute('SELECT total FROM crawls WHERE id = ?', (crawl_id,)).fetchone()
+        return row['total'] if row else 0
+
+    def query(self, filters, crawl_id=None):
+        """Tournaments of the latest crawl matching the non-time `filters`.
+
+        Returns None when `crawl_id` is given and is no longer the latest crawl.
+        """
+        latest = self.latest_crawl()
+        if latest is None or (crawl_id is not None and latest[0] != crawl_id):
+            return None
+        where = ['crawl_id = ?']
+        params = [latest[0]]
+
+        t_type = filters.get('tournament_type', 'all')
+        if t_type in ('open', 'password'):
+            where.append('type = ?')
+            params.append('open' if t_type == 'open' else 'passwordProtected')
+        if filters.get('status') in ('inProgress', 'inPreparation'):
+            where.append('status = ?')
+            params.append(filters['status'])
+        game_modes = [str(m) for m in filters.get('game_modes') or []]
+        if game_modes:
+            where.append(f"game_mode_id IN ({','.join('?' * len(game_modes))})")
+            params.extend(game_modes)
+        level_caps = filters.get('level_caps') or []
+        if level_caps:
+            caps = [int(c) for c in level_caps if str(c).lstrip('-').isdigit()]
+            where.append(f"level_cap IN ({','.join('?' * len(caps))})" if caps else '0')
+            params.extend(caps)
+        if filters.get('min_players'):
+            where.append('capacity >= ?')
+            params.append(filters['min_players'])
+        if filters.get('max_players'):
+            where.append('capacity <= ?')
+            params.append(filters['max_players'])
+
+        rows = self._connect().execute(
+            f"SELECT data FROM tournaments WHERE {' AND '.join(where)} ORDER BY rowid", params)
+        return [json.loads(row['data']) for row in rows]
+
+    def history(self, tag=None, since_ts=0):
+        """Change points of one tournament, or per-crawl totals when `tag` is None."""
+        conn = self._connect()
+        if tag is None:
+            rows = conn.execute('SELECT ts, total, live, fill_rate FROM crawls WHERE ts >= ? ORDER BY ts',
+                                (since_ts,))
+            return [{"ts": row['ts'], "tournaments": row['total'], "live": row['live'],
+                     "fillRate": row['fill_rate']} for row in rows]
+        rows = conn.execute(
+            'SELECT c.ts, s.status, s.players, s.max_players FROM snapshots s'
+            ' JOIN crawls c ON c.id = s.crawl_id WHERE s.tag = ? AND c.ts >= ? ORDER BY c.ts',
+            (tag, since_ts))
+        return [{"ts": row['ts'], "status": row['status'], "players": row['players'],
+                 "maxPlayers": row['max_players'],
+                 "fillRate": row['players'] / row['max_players'] if row['max_players'] else None}
+                for row in rows]
+
+
+_TOURNAMENT_STORE = TournamentStore(TOURNAMENT_DB_PATH) if TOURNAMENT_DB_PATH and not IN_POOL_WORKER else None
+
+# =============================================================================
+# SHARED CACHE BACKEND (crawl lock, and search/detail caches across instances)
+# =============================================================================
+CACHE_BACKEND_URL = os.environ.get('CACHE_BACKEND_URL', '')
+# The holder renews its lease every third of the TTL, so a crashed crawler
+# frees the lock within one TTL instead of after a whole crawl.
+CRAWL_LOCK_TTL_SECONDS = int(os.environ.get('CRAWL_LOCK_TTL_SECONDS', 120))
+CRAWL_LOCK_POLL_SECONDS = float(os.environ.get('CRAWL_LOCK_POLL_SECONDS', 1.0))
+# Longest wait on a peer's crawl (one request timeout) before serving the
+# newest cache we have, or crawling without the lock if there is none.
+CRAWL_LOCK_WAIT_SECONDS = float(os.environ.get('CRAWL_LOCK_WAIT_SECONDS', 180))
+CRAWL_LOCK_KEY = 'cr-finder:lock:crawl'
+SEARCH_CACHE_KEY = 'cr-finder:search'
+SEARCH_CACHE_STAMP_KEY = 'cr-finder:search:ts'  # revised_at_ts of SEARCH_CACHE_KEY, cheap to poll
+DETAIL_CACHE_KEY_PREFIX = 'cr-finder:detail:'
+
+RESP_UNLOCK_SCRIPT = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) else return 0 end"
+RESP_RENEW_SCRIPT = ("if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('pexpire', KEYS[1], ARGV[2])"
+                     " else return 0 end")
+
+
+class CacheBackendError(Exception):
+    """The cache backend was unreachable or rejected a command."""
+
+
+class LocalCacheBackend:
+    """In-process key-value store with expiry and lease locks (the default).
+
+    It is not `shared`: the search and detail caches already live in this
+    process, so only the crawl lock goes through it.
+    """
+
+    shared = False
+    remote = False
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {}  # key -> (expires_at, value)
+
+    def _live(self, key):
+        # Caller holds self._lock.
+        entry = self._data.get(key)
+        if entry and entry[0] <= time.time():
+            del self._data[key]
+            return None
+        return entry
+
+    def get(self, key):
+        with self._lock:
+            entry = self._live(key)
+        return entry[1] if entry else None
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._data[key] = (time.time() + ttl, value)
+
+    def acquire_lock(self, name, ttl):
+        """Lease `name` for `ttl` seconds; returns the release token, or None if it is held."""
+        token = secrets.token_hex(16)
+        with self._lock:
+            if self._live(name):
+                return None
+            self._data[name] = (time.time() + ttl, token)
+        return token
+
+    def release_lock(self, name, token):
+        """Release `name` only if `token` still holds it."""
+        with self._lock:
+            entry = self._live(name)
+            if not entry or entry[1] != token:
+                return False
+            del self._data[name]
+            return True
+
+    def renew_lock(self, name, token, ttl):
+        """Extend the lease on `name` to `ttl` seconds from now if `token` still holds it."""
+        with self._lock:
+            entry = self._live(name)
+            if not entry or entry[1] != token:
+                return False
+            self._data[name] = (time.time() + ttl, token)
+            return True
+
+
+class RespCacheBackend:
+    """Shared cache on a Redis-protocol server: redis://[:password@]host[:port][/db].
+
+    Locks are SET NX PX leases holding a random token, released (and renewed)
+    with an atomic compare-and-delete (-pexpire) so a holder whose lease expired
+    can't free or extend a peer's lock. Connections are per thread.
+    """
+
+    shared = True
+    remote = True
+
+    def __init__(self, url, timeout=5.0):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or '127.0.0.1'
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.strip('/') or 0)
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connect(self):
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._local.conn = (sock, sock.makefile('rb'))
+        if self.password:
+            self._roundtrip('AUTH', self.password)
+        if self.db:
+            self._roundtrip('SELECT', self.db)
+        return self._local.conn
+
+    def _close(self):
+        conn = getattr(self._local, 'conn', None)
+        self._local.conn = None
+        if conn is not None:
+            for closable in reversed(conn):
+                try:
+                    closable.close()
+                except OSError:
+                    pass
+
+    def _roundtrip(self, *args):
+        sock, reader = getattr(self._local, 'conn', None) or self._connect()
+        parts = [b'*%d\r\n' % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode('utf-8')
+            parts += [b'$%d\r\n' % len(data), data, b'\r\n']
+        sock.sendall(b''.join(parts))
+        return self._read_reply(reader)
+
+    def _read_reply(self, reader):
+        line = reader.readline()
+        if not line.endswith(b'\r\n'):
+            raise EOFError('connection closed')
+        kind, rest = line[:1], line[1:-2]
+        if kind == b'+':
+            return rest.decode('utf-8')
+        if kind == b'-':
+            raise CacheBackendError(rest.decode('utf-8', 'replace'))
+        if kind == b':':
+            return int(rest)
+        if kind == b'$':
+            if int(rest) < 0:
+                return None
+            data = reader.read(int(rest) + 2)
+            if len(data) != int(rest) + 2:
+                raise EOFError('connection closed')
+            return data[:-2]
+        if kind == b'*':
+            return None if int(rest) < 0 else [self._read_reply(reader) for _ in range(int(rest))]
+        raise CacheBackendError(f"Unexpected reply: {line[:40]!r}")
+
+    def command(self, *args, idempotent=True):
+        """Send one command and return its reply, reconnecting once if the connection dropped.
+
+        Commands that are not idempotent are never resent: once one may have
+        reached the server, a lost reply raises CacheBackendError. A PING first
+        keeps them off connections that died while idle.
+        """
+        if not idempotent:
+            self.command('PING')
+            try:
+                return self._roundtrip(*args)
+            except (OSError, EOFError) as e:
+                self._close()
+                raise CacheBackendError(f"{self.host}:{self.port}: no reply to {args[0]}: {e}") from e
+        for attempt in range(2):
+            try:
+                return self._roundtrip(*args)
+            except (OSError, EOFError) as e:
+                self._close()
+                if attempt:
+                    raise CacheBackendError(f"{self.host}:{self.port}: {e}") from e
+
+    def get(self, key):
+        return self.command('GET', key)
+
+    def set(self, key, value, ttl):
+        self.command('SET', key, value, 'PX', max(1, int(ttl * 1000)))
+
+    def acquire_lock(self, name, ttl):
+        token = secrets.token_hex(16)
+        reply = self.command('SET', name, token, 'NX', 'PX', max(1, int(ttl * 1000)), idempotent=False)
+        return token if reply == 'OK' else None
+
+    def release_lock(self, name, token):
+        return self.command('EVAL', RESP_UNLOCK_SCRIPT, 1, name, token, idempotent=False) == 1
+
+    def renew_lock(self, name, token, ttl):
+        return self.command('EVAL', RESP_RENEW_SCRIPT, 1, name, token, max(1, int(ttl * 1000))) == 1
+
+
+def make_cache_backend(url):
+    """Backend for CACHE_BACKEND_URL: in-process when empty, else a Redis-protocol server."""
+    if not url:
+        return LocalCacheBackend()
+    if urlparse(url).scheme in ('redis', 'resp'):
+        return RespCacheBackend(url)
+    raise ValueError(f"Unsupported CACHE_BACKEND_URL: {url}")
+
+
+_CACHE_BACKEND = make_cache_backend('' if IN_POOL_WORKER else CACHE_BACKEND_URL)
+
+
+def _backend_call(method, *args, default=None):
+    """Call the cache backend, degrading to `default` (and a log line) when it fails."""
+    try:
+        return method(*args)
+    except CacheBackendError as e:
+        logger.warning(f"Cache backend {type(_CACHE_BACKEND).__name__} failed: {e}")
+        return default
+
+
+async def _backend_call_async(method, *args, default=None):
+    """_backend_call() that keeps network round-trips off the event loop."""
+    if _CACHE_BACKEND.remote:
+        return await asyncio.to_thread(_backend_call, method, *args, default=default)
+    return _backend_call(method, *args, default=default)
+
+# =============================================================================
+# METRICS (Prometheus text exposition, served at /metrics)
+# =============================================================================
+class _Metric:
+    def __init__(self, name, help_text, kind, label_names=()):
+        self.name = name
+        self.help_text = help_text
+        self.kind = kind
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.label_names)
+
+    def _label_str(self, key, extra=()):
+        pairs = list(zip(self.label_names, key)) + list(extra)
+        if not pairs:
+            return ''
+        escaped = (
+            f'{name}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+            for name, value in pairs
+        )
+        return '{' + ','.join(escaped) + '}'
+
+    def header(self):
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    def __init__(self, name, help_text, label_names=()):
+        super().__init__(name, help_text, 'counter', label_names)
+        self._values = defaultdict(float)
+
+    def inc(self, amount=1, **labels):
+        with self._lock:
+            self._values[self._key(labels)] += amount
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def export(self, reset=False):
+        """Samples by label key (see merge_metric_samples)."""
+        with self._lock:
+            values = dict(self._values)
+            if reset:
+                self._values.clear()
+        return values
+
+    def merge(self, values):
+        with self._lock:
+            for key, value in values.items():
+                self._values[key] += value
+
+    def render(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [f"{self.name}{self._label_str(k)} {v:g}" for k, v in items]
+
+
+class Gauge(_Metric):
+    """Gauge whose samples come from a callback at scrape time.
+
+    `kind='counter'` exposes a monotonic value owned by someone else the same way.
+    """
+
+    def __init__(self, name, help_text, collect, label_names=(), kind='gauge'):
+        super().__init__(name, help_text, kind, label_names)
+        self._collect = collect
+
+    def render(self):
+        lines = self.header()
+        for labels, value in self._collect():
+            if value is not None:
+                lines.append(f"{self.name}{self._label_str(self._key(labels))} {value:g}")
+        return lines
+
+
+class Histogram(_Metric):
+    def __init__(self, name, help_text, buckets, label_names=()):
+        super().__init__(name, help_text, 'histogram', label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series["counts"][i] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    def export(self, reset=False):
+        with self._lock:
+            series = {k: dict(v, counts=list(v["counts"])) for k, v in self._series.items()}
+            if reset:
+                self._series.clear()
+        return series
+
+    def merge(self, series):
+        with self._lock:
+            for key, other in series.items():
+                mine = self._series.get(key)
+                if mine is None:
+                    mine = self._series[key] = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+                mine["counts"] = [a + b for a, b in zip(mine["counts"], other["counts"])]
+                mine["sum"] += other["sum"]
+                mine["count"] += other["count"]
+
+    def render(self):
+        with self._lock:
+            items = sorted((k, dict(v, counts=list(v["counts"]))) for k, v in self._series.items())
+        lines = self.header()
+        for key, series in items:
+            for bound, count in zip(self.buckets, series["counts"]):
+                lines.append(f"{self.name}_bucket{self._label_str(key, [('le', f'{bound:g}')])} {count}")
+            lines.append(f"{self.name}_bucket{self._label_str(key, [('le', '+Inf')])} {series['count']}")
+            lines.append(f"{self.name}_sum{self._label_str(key)} {series['sum']:g}")
+            lines.append(f"{self.name}_count{self._label_str(key)} {series['count']}")
+        return lines
+
+
+METRICS = []
+
+
+def register_metric(metric):
+    METRICS.append(metric)
+    return metric
+
+
+def render_metrics():
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
+
+
+def export_metric_samples(reset=False):
+    """Counter and histogram samples by metric name, for a pool worker to hand back."""
+    return {m.name: m.export(reset) for m in METRICS if hasattr(m, 'export')}
+
+
+def merge_metric_samples(samples):
+    """Add samples from export_metric_samples() (in another process) to this process's metrics."""
+    by_name = {m.name: m for m in METRICS if hasattr(m, 'merge')}
+    for name, values in samples.items():
+        if name in by_name:
+            by_name[name].merge(values)
+
+
+CRAWL_DURATION = register_metric(Histogram(
+    'crfinder_crawl_duration_seconds', 'Wall time of a full crawl.',
+    buckets=(5, 10, 20, 30, 45, 60, 90, 120, 180, 300),
+))
+CRAWL_PHASE_DURATION = register_metric(Histogram(
+    'crfinder_crawl_phase_duration_seconds', 'Wall time per crawl phase (crawl, verify, details).',
+    buckets=(0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300), label_names=('phase',),
+))
+API_REQUEST_DURATION = register_metric(Histogram(
+    'crfinder_api_request_duration_seconds', 'Royale API request latency per attempt.',
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10), label_names=('endpoint', 'status'),
+))
+API_RATE_LIMITS = register_metric(Counter(
+    'crfinder_api_rate_limits_total', 'HTTP 429 responses from the Royale API.', label_names=('endpoint',),
+))
+API_ERRORS = register_metric(Counter(
+    'crfinder_api_errors_total', 'Royale API requests that failed for good.', label_names=('endpoint',),
+))
+CACHE_REQUESTS = register_metric(Counter(
+    'crfinder_cache_requests_total', 'Search/detail cache lookups by result.', label_names=('cache', 'result'),
+))
+HTTP_REQUEST_DURATION = register_metric(Histogram(
+    'crfinder_http_request_duration_seconds', 'Flask request latency per route (streams: until closed).',
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 180),
+    label_names=('route', 'method', 'status'),
+))
+_HTTP_IN_FLIGHT_LOCK = threading.Lock()
+_http_in_flight = 0
+
+
+def _cache_hit_ratio_samples():
+    for cache in ('search', 'detail'):
+        hits = CACHE_REQUESTS.value(cache=cache, result='hit')
+        total = hits + CACHE_REQUESTS.value(cache=cache, result='miss')
+        yield {'cache': cache}, (hits / total if total else None)
+
+
+def _search_cache_samples():
+    with _SEARCH_CACHE_COND:
+        cache = _SEARCH_CACHE
+    return cache
+
+
+def _search_cache_age_samples():
+    cache = _search_cache_samples()
+    yield {}, (time.time() - cache["fetched_at_ts"]) if cache else None
+
+
+def _tournaments_by_mode_samples():
+    cache = _search_cache_samples()
+    if not cache:
+        return
+    for mode_id, count in sorted(cache.get("stats", {}).get("tournaments_by_mode", {}).items()):
+        yield {'mode': mode_id}, count
+
+
+register_metric(Gauge(
+    'crfinder_cache_hit_ratio', 'Share of cache lookups served from cache since startup.',
+    _cache_hit_ratio_samples, label_names=('cache',),
+))
+register_metric(Gauge(
+    'crfinder_search_cache_age_seconds', 'Age of the cached crawl result.', _search_cache_age_samples,
+))
+register_metric(Gauge(
+    'crfinder_tournaments', 'Tournaments in the cached crawl by game mode id.',
+    _tournaments_by_mode_samples, label_names=('mode',),
+))
+register_metric(Gauge(
+    'crfinder_http_requests_in_flight', 'Flask requests (including open streams) being served.',
+    lambda: [({}, _http_in_flight)],
+))
+register_metric(Gauge(
+    'crfinder_api_key_rate_limits_total', '429s per pooled API key (k1 = first key in CR_API_KEY).',
+    lambda: [({'key': f"k{i}"}, k["rateLimits"]) for i, k in enumerate(get_api_key_pool().snapshot(), 1)],
+    label_names=('key',), kind='counter',
+))
+register_metric(Gauge(
+    'crfinder_log_records_dropped_total', 'Log records dropped because the log queue was full.',
+    lambda: [({}, getattr(log_queue_handler, 'dropped', 0))], kind='counter',
+))
+
 # =============================================================================
 # ASYNC API CLIENT CONFIGURATION
 # =============================================================================
@@ -110,6 +1164,8 @@ search_stats = make_search_stats()
 _SEARCH_CACHE_COND = threading.Condition()
 _SEARCH_CACHE = None
 _SEARCH_FETCH_IN_PROGRESS = False
+# Progress callbacks of every caller waiting on the in-flight crawl.
+_SEARCH_PROGRESS_LISTENERS = []
 
 # Paths
 # CONFIG_PATH can point to a mounted persistent volume (e.g. GCS bucket on
@@ -124,7 +1180,12 @@ def get_ssl_context():
 
 API_TIMEOUT = aiohttp.ClientTimeout(total=10)
 
-API_BASE = "https://proxy.royaleapi.dev/v1"
+# The search endpoint returns at most this many items per query; a full page
+# (or a paging cursor) means the result set was cut off.
+QUERY_RESULT_LIMIT = 100
+
+# CR_API_BASE points the crawler at another proxy (e.g. tools/mock_royale_api.py).
+API_BASE = os.environ.get("CR_API_BASE", "https://proxy.royaleapi.dev/v1")
 
 
 def get_retry_delay_seconds(attempt, response=None):
@@ -196,24 +1257,141 @@ def save_config(config):
         json.dump(config, f, indent=2)
 
 
-def get_api_headers():
-    """Get API headers with auth - env var takes precedence over config.json"""
-    api_key = os.environ.get('CR_API_KEY')
-    if not api_key:
-        config = load_config()
-        api_key = config.get('api_key', '')
+def get_api_keys():
+    """Configured API keys, in order; CR_API_KEY / api_key may hold a comma-separated list."""
+    raw = os.environ.get('CR_API_KEY') or load_config().get('api_key', '')
+    return [key.strip() for key in raw.split(',') if key.strip()]
+
+
+def mask_api_key(key):
+    """Show just enough of a key to tell keys apart."""
+    if len(key) > 20:
+        return key[:10] + '...' + key[-6:]
+    return '...' + key[-4:] if len(key) > 8 else '***'
+
+
+def get_api_headers(key=None):
+    """Get API headers with auth - env var takes precedence over config.json.
+
+    Without `key`, the first configured key is used.
+    """
+    if key is None:
+        keys = get_api_keys()
+        key = keys[0] if keys else ''
     return {
-        "Authorization": f"Bearer {api_key}",
+        "Authorization": f"Bearer {key}",
         "Accept": "application/json"
     }
 
 
 def has_api_key():
     """Check if an API key is configured (env var or config)"""
-    if os.environ.get('CR_API_KEY'):
-        return True
-    config = load_config()
-    return bool(config.get('api_key'))
+    return bool(get_api_keys())
+
+
+class ApiKeyPool:
+    """Spreads crawler and detail requests over several API keys.
+
+    Each key has a token bucket of API_KEY_RATE requests/s (0 = no client-side
+    budget); acquire picks the key with the most budget left, ties going to
+    the least used. A 429 benches the key for API_KEY_BENCH_SECONDS, doubling
+    on consecutive 429s up to 8x, and empties its bucket. Benching only steers
+    traffic to other keys: if every key with budget is benched, the one that
+    recovers first is used anyway and the per-request backoff does the pacing,
+    so a single key behaves exactly as before.
+    """
+
+    def __init__(self, keys, rate=0.0, bench_seconds=5.0):
+        self.keys = list(keys)
+        self.rate = rate
+        self.burst = max(1.0, rate)
+        self.bench_seconds = bench_seconds
+        self._lock = threading.Lock()
+        now = time.monotonic()
+        self._state = {
+            key: {"tokens": self.burst, "updated": now, "benched_until": 0.0, "strikes": 0,
+                  "requests": 0, "rate_limits": 0}
+            for key in self.keys
+        }
+
+    def _refill(self, state, now):
+        if self.rate > 0:
+            state["tokens"] = min(self.burst, state["tokens"] + (now - state["updated"]) * self.rate)
+        state["updated"] = now
+
+    def try_acquire(self):
+        """Return (key, 0) if a key has budget now, else (None, seconds to wait)."""
+        with self._lock:
+            now = time.monotonic()
+            best, wait = None, None
+            for key in self.keys:
+                state = self._state[key]
+                self._refill(state, now)
+                if self.rate > 0 and state["tokens"] < 1:
+                    ready_in = (1 - state["tokens"]) / self.rate
+                    wait = ready_in if wait is None else min(wait, ready_in)
+                    continue
+                benched_for = max(0.0, state["benched_until"] - now)
+                rank = (benched_for, -state["tokens"] if self.rate > 0 else 0, state["requests"])
+                if best is None or rank < best[0]:
+                    best = (rank, key)
+            if best is None:
+                return None, max(0.01, wait or 0.01)
+            state = self._state[best[1]]
+            if self.rate > 0:
+                state["tokens"] -= 1
+            state["requests"] += 1
+            return best[1], 0.0
+
+    async def acquire_async(self):
+        while True:
+            key, wait = self.try_acquire()
+            if key is not None:
+                return key
+            await asyncio.sleep(wait)
+
+    def report(self, key, status):
+        state = self._state.get(key)
+        if state is None:
+            return
+        with self._lock:
+            if status == 429:
+                state["rate_limits"] += 1
+                state["strikes"] = min(state["strikes"] + 1, 4)
+                state["tokens"] = 0.0
+                state["benched_until"] = time.monotonic() + self.bench_seconds * 2 ** (state["strikes"] - 1)
+            elif status is not None and status < 500:
+                state["strikes"] = 0
+
+    def snapshot(self):
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "key": mask_api_key(key),
+                    "requests": state["requests"],
+                    "rateLimits": state["rate_limits"],
+                    "benchedFor": round(max(0.0, state["benched_until"] - now), 1),
+                }
+                for key, state in self._state.items()
+            ]
+
+
+_API_KEY_POOL_LOCK = threading.Lock()
+_API_KEY_POOL = None
+
+
+def get_api_key_pool():
+    """Shared pool for the configured keys, rebuilt when the keys or knobs change."""
+    global _API_KEY_POOL
+    keys = get_api_keys()
+    rate = float(os.environ.get("API_KEY_RATE", 0))
+    bench_seconds = float(os.environ.get("API_KEY_BENCH_SECONDS", 5))
+    with _API_KEY_POOL_LOCK:
+        pool = _API_KEY_POOL
+        if pool is None or pool.keys != keys or pool.rate != rate or pool.bench_seconds != bench_seconds:
+            pool = _API_KEY_POOL = ApiKeyPool(keys, rate=rate, bench_seconds=bench_seconds)
+        return pool
 
 
 async def validate_api_access_async():
@@ -239,32 +1417,206 @@ async def validate_api_access_async():
 def validate_api_access():
     return asyncio.run(validate_api_access_async())
 
-async def fetch_tournaments_by_query_async(session, query, stats):
-    """Fetch tournaments matching a query string asynchronously with retry on failure"""
+# =============================================================================
+# CRAWL TIMELINES (Chrome trace-event spans, served at /api/debug/trace)
+# =============================================================================
+_TIMELINE_EPOCH = time.perf_counter()
+_CRAWL_TIMELINES_LOCK = threading.Lock()
+_CRAWL_TIMELINES = deque(maxlen=int(os.environ.get("CRAWL_TIMELINE_KEEP", 4)))
+
+
+class CrawlTimeline:
+    """Per-query spans for one crawl or detail batch, enabled by CRAWL_TIMELINE=1.
+
+    Each worker (or semaphore slot, for detail fetches) is a lane (`tid`);
+    a query span is split into semaphore wait, HTTP attempts and backoff
+    sleeps, with queue wait and retry counts in its args. Finished timelines
+    are kept in memory (CRAWL_TIMELINE_KEEP) and share one clock, so a crawl
+    and the detail batch after it line up in the trace viewer.
+    """
+
+    _pids = itertools.count(1)
+
+    def __init__(self, label):
+        self.label = label
+        self.pid = next(self._pids)
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self.events = []
+
+    @classmethod
+    def from_env(cls, label):
+        enabled = os.environ.get("CRAWL_TIMELINE", "").strip() in ("1", "true", "yes")
+        return cls(label) if enabled else None
+
+    @staticmethod
+    def _us(t):
+        return round((t - _TIMELINE_EPOCH) * 1e6, 1)
+
+    def complete(self, name, start, end, lane=0, cat="crawl", args=None):
+        event = {
+            "name": name, "cat": cat, "ph": "X", "pid": self.pid, "tid": lane,
+            "ts": self._us(start), "dur": round((end - start) * 1e6, 1),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def query_span(self, name, lane, cat, queued, requested, acquired, finished, span, args=None):
+        """Record a query from semaphore request to completion, plus its parts."""
+        http = span.get("http", [])
+        sleeps = span.get("sleeps", [])
+        self.complete(name, requested, finished, lane, cat, dict(
+            args or {},
+            queue_wait_ms=round((requested - queued) * 1000, 2),
+            sem_wait_ms=round((acquired - requested) * 1000, 2),
+            retries=max(0, len(http) - 1),
+            sleep_ms=round(sum(end - start for start, end in sleeps) * 1000, 2),
+        ))
+        if acquired - requested >= 0.0005:
+            self.complete("semaphore wait", requested, acquired, lane, cat)
+        for start, end, status in http:
+            self.complete("http", start, end, lane, cat, {"status": status})
+        for start, end in sleeps:
+            self.complete("backoff", start, end, lane, cat)
+
+    def finish(self):
+        with _CRAWL_TIMELINES_LOCK:
+            _CRAWL_TIMELINES.append(self)
+
+    def export(self):
+        """Picklable copy for a pool worker to hand back (see adopt)."""
+        return {"label": self.label, "started_at": self.started_at, "epoch": _TIMELINE_EPOCH, "events": self.events}
+
+    @classmethod
+    def adopt(cls, exported):
+        """Keep a worker's exported timeline, shifted onto this process's clock."""
+        timeline = cls(exported["label"])
+        timeline.started_at = exported["started_at"]
+        shift = round((exported["epoch"] - _TIMELINE_EPOCH) * 1e6, 1)
+        timeline.events = [dict(event, pid=timeline.pid, ts=event["ts"] + shift) for event in exported["events"]]
+        timeline.finish()
+        return timeline
+
+
+def export_chrome_trace(timelines):
+    """Merge timelines into one Chrome trace-event JSON object."""
+    events = []
+    for timeline in timelines:
+        events.append({
+            "name": "process_name", "ph": "M", "pid": timeline.pid,
+            "args": {"name": f"{timeline.label} {timeline.started_at}"},
+        })
+        events.extend(timeline.events)
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+async def _backoff(delay, span=None):
+    started = time.perf_counter()
+    await asyncio.sleep(delay)
+    if span is not None:
+        span.setdefault("sleeps", []).append((started, time.perf_counter()))
+
+
+def _note_attempt(span, started, status):
+    if span is not None:
+        span.setdefault("http", []).append((started, time.perf_counter(), status))
+
+
+# Search results are decoded and trimmed to these fields before they reach
+# the crawl loop; everything downstream (filters, enrichment, event log)
+# reads only these.
+TOURNAMENT_FIELDS = (
+    'tag', 'name', 'type', 'status', 'capacity', 'maxCapacity', 'levelCap', 'gameMode',
+    'createdTime', 'preparationDuration', 'duration', 'startedTime', 'endedTime',
+)
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+_DECODE_POOLS = {}
+_DECODE_POOLS_LOCK = threading.Lock()
+
+
+def decode_search_page(raw):
+    """Parse a /tournaments response body into (trimmed items, has_next_page)."""
+    data = _json_loads(raw)
+    items = [{k: t[k] for k in TOURNAMENT_FIELDS if k in t} for t in data.get("items", [])]
+    cursors = (data.get("paging") or {}).get("cursors") or {}
+    return items, bool(cursors.get("after"))
+
+
+def _spawn_process_pool(workers):
+    """Process pool whose workers import this module without its server side effects."""
+    context = multiprocessing.get_context(os.environ.get("CRAWL_SHARD_START_METHOD", "spawn"))
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=pool_worker.mark_pool_worker)
+
+
+def _decode_pool(mode):
+    with _DECODE_POOLS_LOCK:
+        pool = _DECODE_POOLS.get(mode)
+        if pool is None:
+            workers = int(os.environ.get("JSON_DECODE_WORKERS", 2))
+            if mode == 'process':
+                pool = _spawn_process_pool(workers)
+            else:
+                pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='json-decode')
+            _DECODE_POOLS[mode] = pool
+            atexit.register(pool.shutdown, wait=False)
+        return pool
+
+
+async def read_search_page(resp):
+    """Read a search response and decode it according to JSON_DECODE_MODE.
+
+    inline (default) decodes on the event loop; thread hands the bytes to a
+    small pool so the loop keeps serving sockets while a page is parsed
+    (decoding still holds the GIL); process decodes in parallel and ships
+    back only the trimmed items.
+    """
+    raw = await resp.read()
+    mode = os.environ.get("JSON_DECODE_MODE", "inline").strip().lower()
+    if mode in ('thread', 'process'):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_decode_pool(mode), decode_search_page, raw)
+    return decode_search_page(raw)
+
+
+async def fetch_tournaments_by_query_async(session, query, stats, span=None):
+    """Fetch tournaments matching a query string asynchronously with retry on failure.
+
+    `span`, if given, collects per-attempt HTTP and backoff timings (see CrawlTimeline).
+    """
     max_attempts = 4
     last_status = None
+    pool = get_api_key_pool()
     for attempt in range(max_attempts):
+        key = await pool.acquire_async()
+        started = time.perf_counter()
         try:
             async with session.get(
                 f"{API_BASE}/tournaments",
-                headers=get_api_headers(),
-                params={"name": query, "limit": 100},
+                headers=get_api_headers(key),
+                params={"name": query, "limit": QUERY_RESULT_LIMIT},
                 timeout=API_TIMEOUT,
             ) as resp:
                 last_status = resp.status
+                pool.report(key, resp.status)
+                API_REQUEST_DURATION.observe(time.perf_counter() - started, endpoint='search', status=resp.status)
                 if resp.status == 200:
-                    data = await resp.json()
+                    items, has_next = await read_search_page(resp)
+                    _note_attempt(span, started, resp.status)
                     stats['queries_completed'] += 1
                     return {
                         "ok": True,
-                        "items": data.get("items", []),
+                        "items": items,
+                        "truncated": len(items) >= QUERY_RESULT_LIMIT or has_next,
                         "attempts": attempt + 1,
                         "status": resp.status,
                     }
-                elif resp.status == 429:
+                _note_attempt(span, started, resp.status)
+                if resp.status == 429:
                     stats['rate_limits'] += 1
+                    API_RATE_LIMITS.inc(endpoint='search')
                     if attempt < max_attempts - 1:
-                        await asyncio.sleep(get_retry_delay_seconds(attempt, resp))
+                        await _backoff(get_retry_delay_seconds(attempt, resp), span)
                         continue
                     logger.debug(f"API rate limit for query '{query}' after {max_attempts} attempts")
                     return {
@@ -274,10 +1626,11 @@ async def fetch_tournaments_by_query_async(session, query, stats):
                         "status": resp.status,
                     }
                 elif 500 <= resp.status < 600 and attempt < max_attempts - 1:
-                    await asyncio.sleep(get_retry_delay_seconds(attempt, resp))
+                    await _backoff(get_retry_delay_seconds(attempt, resp), span)
                     continue
                 else:
                     stats['api_errors'] += 1
+                    API_ERRORS.inc(endpoint='search')
                     logger.debug(f"API error for query '{query}': HTTP {resp.status}")
                     return {
                         "ok": False,
@@ -286,10 +1639,13 @@ async def fetch_tournaments_by_query_async(session, query, stats):
                         "status": resp.status,
                     }
         except Exception as e:
+            API_REQUEST_DURATION.observe(time.perf_counter() - started, endpoint='search', status='error')
+            _note_attempt(span, started, 'error')
             if attempt < max_attempts - 1:
-                await asyncio.sleep(get_retry_delay_seconds(attempt))
+                await _backoff(get_retry_delay_seconds(attempt), span)
                 continue
             stats['api_errors'] += 1
+            API_ERRORS.inc(endpoint='search')
             logger.debug(f"Request error for query '{query}': {e}")
             return {
                 "ok": False,
@@ -305,51 +1661,129 @@ async def fetch_tournaments_by_query_async(session, query, stats):
     }
 
 
-async def fetch_tournament_detail_async(session, tag):
+async def fetch_tournament_detail_async(session, tag, span=None):
     """Fetch detailed info for a single tournament by tag asynchronously."""
     encoded_tag = quote(tag, safe='')
     max_attempts = 4
+    pool = get_api_key_pool()
     for attempt in range(max_attempts):
+        key = await pool.acquire_async()
+        started = time.perf_counter()
         try:
             async with session.get(
                 f"{API_BASE}/tournaments/{encoded_tag}",
-                headers=get_api_headers(),
+                headers=get_api_headers(key),
                 timeout=API_TIMEOUT,
             ) as resp:
+                pool.report(key, resp.status)
+                API_REQUEST_DURATION.observe(time.perf_counter() - started, endpoint='detail', status=resp.status)
                 if resp.status == 200:
-                    return await resp.json()
-                elif resp.status == 429:
+                    detail = await resp.json()
+                    _note_attempt(span, started, resp.status)
+                    return detail
+                _note_attempt(span, started, resp.status)
+                if resp.status == 429:
+                    API_RATE_LIMITS.inc(endpoint='detail')
                     if attempt < max_attempts - 1:
-                        await asyncio.sleep(get_retry_delay_seconds(attempt, resp))
+                        await _backoff(get_retry_delay_seconds(attempt, resp), span)
                         continue
-                    return None
+                    break
                 elif 500 <= resp.status < 600 and attempt < max_attempts - 1:
-                    await asyncio.sleep(get_retry_delay_seconds(attempt, resp))
+                    await _backoff(get_retry_delay_seconds(attempt, resp), span)
                     continue
+                break
         except Exception:
+            API_REQUEST_DURATION.observe(time.perf_counter() - started, endpoint='detail', status='error')
+            _note_attempt(span, started, 'error')
             if attempt < max_attempts - 1:
-                await asyncio.sleep(get_retry_delay_seconds(attempt))
+                await _backoff(get_retry_delay_seconds(attempt), span)
                 continue
+    API_ERRORS.inc(endpoint='detail')
     return None
 
 
 _DETAIL_CACHE_LOCK = threading.Lock()
 _DETAIL_CACHE = {}
+# tag -> Future of a detail fetch in progress. Request threads each run their
+# own event loop, so waiters join it through asyncio.wrap_future().
+_DETAIL_INFLIGHT = {}
 
 
-async def _get_cached_tournament_detail_async(session, tag):
+def _load_shared_detail(tag, max_age=None):
+    """(fetched_at, detail) another instance stored for `tag`, or None."""
+    if not _CACHE_BACKEND.shared:
+        return None
+    body = _backend_call(_CACHE_BACKEND.get, DETAIL_CACHE_KEY_PREFIX + tag)
+    if not body:
+        return None
+    entry = _json_loads(body)
+    if max_age is not None and time.time() - entry["fetched_at"] > max_age:
+        return None
+    return entry["fetched_at"], entry["detail"]
+
+
+async def _load_shared_detail_async(tag, max_age=None):
+    if _CACHE_BACKEND.remote:
+        return await asyncio.to_thread(_load_shared_detail, tag, max_age)
+    return _load_shared_detail(tag, max_age)
+
+
+async def _get_cached_tournament_detail_async(session, tag, span=None, max_age=None):
+    """Detail for `tag` from this process's cache, a fetch already in flight,
+    the shared cache backend, or the API.
+
+    `max_age` (seconds) additionally rejects cached entries older than that.
+    """
     ttl = int(os.environ.get("DETAIL_CACHE_TTL_SECONDS", 300))
     now = time.time()
 
     with _DETAIL_CACHE_LOCK:
         cached = _DETAIL_CACHE.get(tag)
-        if cached and now < cached["expires_at"]:
-            return cached["detail"]
-
-    detail = await fetch_tournament_detail_async(session, tag)
-    if detail:
+        hit = cached and now < cached["expires_at"] and (max_age is None or now - cached["fetched_at"] <= max_age)
+        if not hit:
+            inflight = _DETAIL_INFLIGHT.get(tag)
+            if inflight is None:
+                inflight = _DETAIL_INFLIGHT[tag] = Future()
+                owner = True
+            else:
+                owner = False
+    if hit:
+        CACHE_REQUESTS.inc(cache='detail', result='hit')
+        if span is not None:
+            span["cached"] = True
+        # A crawl may have pushed older state to watchers since this was fetched.
+        _TAG_WATCH_HUB.publish([cached["detail"]])
+        return cached["detail"]
+    if not owner:
+        CACHE_REQUESTS.inc(cache='detail', result='inflight')
+        if span is not None:
+            span["cached"] = True
+        return await asyncio.wrap_future(inflight)
+
+    detail = None
+    try:
+        shared = await _load_shared_detail_async(tag, max_age)
+        if shared is not None:
+            CACHE_REQUESTS.inc(cache='detail', result='shared')
+            if span is not None:
+                span["cached"] = True
+            fetched_at, detail = shared
+        else:
+            CACHE_REQUESTS.inc(cache='detail', result='miss')
+            detail = await fetch_tournament_detail_async(session, tag, span)
+            fetched_at = time.time()
+            if detail and _CACHE_BACKEND.shared:
+                body = json.dumps({"fetched_at": fetched_at, "detail": detail}, separators=(',', ':')).encode('utf-8')
+                await _backend_call_async(_CACHE_BACKEND.set, DETAIL_CACHE_KEY_PREFIX + tag, body, ttl)
+        if detail:
+            with _DETAIL_CACHE_LOCK:
+                _DETAIL_CACHE[tag] = {"fetched_at": fetched_at, "expires_at": fetched_at + ttl, "detail": detail}
+    finally:
         with _DETAIL_CACHE_LOCK:
-            _DETAIL_CACHE[tag] = {"expires_at": time.time() + ttl, "detail": detail}
+            _DETAIL_INFLIGHT.pop(tag, None)
+        inflight.set_result(detail)
+    if detail:
+        _TAG_WATCH_HUB.publish([detail])
     return detail
 
 
@@ -379,15 +1813,29 @@ async def fetch_tournament_details_batch_async(tournaments, progress_cb=None, st
         })
 
     emit(force=True)
+    started = time.perf_counter()
+    timeline = CrawlTimeline.from_env("details")
 
     max_detail_workers = int(os.environ.get('DETAIL_WORKERS', 50))
+    free_lanes = list(range(max_detail_workers, 0, -1))
+    times = []
 
     async def fetch_and_update(tag, session, sem):
         nonlocal completed
         if stop_event and stop_event.is_set():
             return
+        span = {} if timeline else None
+        requested = time.perf_counter()
         async with sem:
-            detail = await _get_cached_tournament_detail_async(session, tag)
+            acquired = time.perf_counter()
+            lane = free_lanes.pop()
+            try:
+                detail = await _get_cached_tournament_detail_async(session, tag, span)
+            finally:
+                free_lanes.append(lane)
+        if timeline:
+            timeline.query_span(tag, lane, "details", requested, requested, acquired, time.perf_counter(), span,
+                                {"cached": bool(span.get("cached")), "ok": detail is not None})
 
         tournament = by_tag.get(tag)
         if tournament and detail:
@@ -395,6 +1843,7 @@ async def fetch_tournament_details_batch_async(tournaments, progress_cb=None, st
                 tournament['startedTime'] = detail['startedTime']
             if 'endedTime' in detail:
                 tournament['endedTime'] = detail['endedTime']
+            times.append({k: tournament[k] for k in ('tag', 'startedTime', 'endedTime') if k in tournament})
 
         completed += 1
         emit()
@@ -404,6 +1853,18 @@ async def fetch_tournament_details_batch_async(tournaments, progress_cb=None, st
         tasks = [fetch_and_update(tag, session, sem) for tag in tags]
         await asyncio.gather(*tasks)
 
+    # `tournaments` may be copies read from the tournament store, so the
+    # times also go back into the crawl itself (a no-op when they are set).
+    if times:
+        if _TOURNAMENT_STORE is not None or _CACHE_BACKEND.remote:
+            await asyncio.to_thread(merge_into_search_cache, times)
+        else:
+            merge_into_search_cache(times)
+
+    CRAWL_PHASE_DURATION.observe(time.perf_counter() - started, phase='details')
+    if timeline:
+        timeline.complete("details", started, time.perf_counter(), args={"tournaments": total})
+        timeline.finish()
     emit(force=True)
     return tournaments
 
@@ -422,6 +1883,99 @@ def fetch_tournament_details_for_in_progress(tournaments, progress_cb=None, stop
     return tournaments
 
 
+async def fetch_tournament_details_for_in_progress_async(tournaments, progress_cb=None, stop_event=None):
+    """Event-loop variant of fetch_tournament_details_for_in_progress()."""
+    if not tournaments:
+        return tournaments
+    subset = [t for t in tournaments if t.get('status') == 'inProgress']
+    if subset:
+        await fetch_tournament_details_batch_async(subset, progress_cb=progress_cb, stop_event=stop_event)
+    return tournaments
+
+
+# Targeted refresh: a few tags, one detail request each, no crawl.
+TOURNAMENT_REFRESH_MAX_TAGS = int(os.environ.get("TOURNAMENT_REFRESH_MAX_TAGS", 50))
+DETAIL_REFRESH_MAX_AGE_SECONDS = float(os.environ.get("DETAIL_REFRESH_MAX_AGE_SECONDS", 10))
+
+
+def merge_into_search_cache(details):
+    """Fold fresh tournament details into the cached crawl.
+
+    Only tags the crawl holds are updated, in a new cache entry (or, for a
+    crawl kept in the tournament store, in its rows) that is shared like the
+    crawl itself; cached records are never edited in place, and details that
+    change nothing are not re-shared. Returns (merged records, records of
+    tags the crawl never saw).
+    """
+    global _SEARCH_CACHE
+
+    updates = {}
+    for detail in details:
+        updates[normalize_tag(detail.get('tag'))] = {k: detail[k] for k in TOURNAMENT_FIELDS if k in detail}
+    with _SEARCH_CACHE_COND:
+        cache = _SEARCH_CACHE
+    if cache is None or not updates:
+        return [], list(updates.values())
+
+    merged = []
+    changed = {}
+    for t in search_cache_tournaments(cache, list(updates)):
+        tag = normalize_tag(t.get('tag'))
+        update = updates.pop(tag)
+        if any(t.get(k) != v for k, v in update.items()):
+            changed[tag] = update
+            t = dict(t, **update)
+        merged.append(t)
+    unmerged = list(updates.values())
+    if not changed:
+        return merged, unmerged
+
+    if "tournaments" not in cache:
+        try:
+            _TOURNAMENT_STORE.update_tournaments(
+                [t for t in merged if normalize_tag(t.get('tag')) in changed], cache["crawl_id"])
+        except sqlite3.Error as e:
+            logger.error(f"Failed to store refreshed tournaments in {_TOURNAMENT_STORE.path}: {e}")
+    with _SEARCH_CACHE_COND:
+        if _SEARCH_CACHE is None or _SEARCH_CACHE["fetched_at_ts"] != cache["fetched_at_ts"]:
+            return merged, unmerged  # a newer crawl replaced this one meanwhile
+        # Start from the current entry: another merge may have landed since.
+        cache = dict(_SEARCH_CACHE, revised_at_ts=time.time())
+        if "tournaments" in cache:
+            tournaments = []
+            for t in cache["tournaments"]:
+                update = changed.get(normalize_tag(t.get('tag')))
+                tournaments.append(dict(t, **update) if update else t)
+            cache["tournaments"] = tournaments
+        _SEARCH_CACHE = cache
+    # Same crawl, so it expires when the crawl does.
+    _share_search_cache(cache, max(0, cache["expires_at_ts"] - time.time()))
+    return merged, unmerged
+
+
+async def refresh_tournaments_async(tags, max_age=None):
+    """Re-fetch details for `tags` only and merge them into the search cache.
+
+    Details fetched within `max_age` seconds (DETAIL_REFRESH_MAX_AGE_SECONDS)
+    are reused and concurrent refreshes of a tag share one request, so the
+    cost is at most one API request per tag. Returns (records merged into the
+    crawl, records of tags the crawl never saw, missing tags).
+    """
+    if max_age is None:
+        max_age = DETAIL_REFRESH_MAX_AGE_SECONDS
+    sem = asyncio.Semaphore(int(os.environ.get('DETAIL_WORKERS', 50)))
+
+    async def refresh_one(session, tag):
+        async with sem:
+            return await _get_cached_tournament_detail_async(session, tag, max_age=max_age)
+
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=get_ssl_context())) as session:
+        details = await asyncio.gather(*(refresh_one(session, tag) for tag in tags))
+    missing = [tag for tag, detail in zip(tags, details) if not detail]
+    merged, unmerged = merge_into_search_cache([d for d in details if d])
+    return merged, unmerged, missing
+
+
 def _snapshot_search_stats():
     # Make the defaultdict JSON-friendly and avoid accidental mutation.
     return {
@@ -467,14 +2021,60 @@ def get_fresh_search_cache():
         return None
     with _SEARCH_CACHE_COND:
         now = time.time()
-        if _SEARCH_CACHE and now < _SEARCH_CACHE["expires_at_ts"]:
-            return _SEARCH_CACHE
+        cache = _SEARCH_CACHE
+    if cache and now < cache["expires_at_ts"]:
+        CACHE_REQUESTS.inc(cache='search', result='hit')
+        return follow_stored_crawl(cache)
+    CACHE_REQUESTS.inc(cache='search', result='miss')
     return None
 
 
+def follow_stored_crawl(cache):
+    """`cache`, or the newer crawl another worker sharing the tournament store recorded over it.
+
+    A store-backed cache has only its metadata in memory, so once its rows
+    belong to a newer crawl this process switches to that crawl (matches,
+    totals and stats then all describe it).
+    """
+    global _SEARCH_CACHE
+
+    if "tournaments" in cache or _TOURNAMENT_STORE is None:
+        return cache
+    try:
+        latest = _TOURNAMENT_STORE.latest_crawl()
+    except sqlite3.Error as e:
+        logger.error(f"Failed to read the latest crawl from {_TOURNAMENT_STORE.path}: {e}")
+        return cache
+    if latest is None or latest[0] == cache["crawl_id"]:
+        return cache
+    stored = load_stored_search_cache()
+    if stored is None:
+        return cache
+    with _SEARCH_CACHE_COND:
+        if _SEARCH_CACHE is None or _SEARCH_CACHE.get("crawl_id") == cache["crawl_id"]:
+            _SEARCH_CACHE = stored
+    _TAG_WATCH_HUB.publish(search_cache_tournaments(stored, _TAG_WATCH_HUB.watched_tags()))
+    return stored
+
+
+def _broadcast_crawl_progress(payload):
+    """Forward one crawl progress payload to every caller waiting on it."""
+    with _SEARCH_CACHE_COND:
+        listeners = list(_SEARCH_PROGRESS_LISTENERS)
+    for listener in listeners:
+        try:
+            listener(payload)
+        except Exception:
+            logger.exception("Crawl progress listener failed")
+
+
 def get_cached_search_results(force_refresh=False, progress_cb=None):
-    """Fetch tournaments via the crawler, with an in-memory TTL cache and in-flight dedupe."""
-    global _SEARCH_CACHE, _SEARCH_FETCH_IN_PROGRESS
+    """Fetch tournaments via the crawler, with an in-memory TTL cache and in-flight dedupe.
+
+    Callers that pass `progress_cb` while a crawl is already running are
+    attached to it and receive its live progress, not just a wait notice.
+    """
+    global _SEARCH_FETCH_IN_PROGRESS
 
     ttl = int(os.environ.get("SEARCH_CACHE_TTL_SECONDS", 180))  # 0 disables cache reuse (but still dedupes in-flight)
 
@@ -483,6 +2083,9 @@ def get_cached_search_results(force_refresh=False, progress_cb=None):
         if not force_refresh and ttl > 0 and _SEARCH_CACHE and now < _SEARCH_CACHE["expires_at_ts"]:
             return _SEARCH_CACHE
 
+        if progress_cb:
+            _SEARCH_PROGRESS_LISTENERS.append(progress_cb)
+
         # If a fetch is already running, wait for it and reuse its result (even if ttl==0).
         if _SEARCH_FETCH_IN_PROGRESS:
             if progress_cb:
@@ -490,79 +2093,470 @@ def get_cached_search_results(force_refresh=False, progress_cb=None):
             while _SEARCH_FETCH_IN_PROGRESS:
                 _SEARCH_CACHE_COND.wait(timeout=0.5)
             if _SEARCH_CACHE:
+                if progress_cb:
+                    _SEARCH_PROGRESS_LISTENERS.remove(progress_cb)
                 return _SEARCH_CACHE
 
-        _SEARCH_FETCH_IN_PROGRESS = True
+        _SEARCH_FETCH_IN_PROGRESS = True
+
+    # Do the expensive work outside the lock, once per fleet: another instance
+    # holding the crawl lock means waiting for its result instead.
+    try:
+        started = time.time()
+        waited = False
+        while True:
+            shared, token = _try_claim_crawl(ttl, started, force_refresh)
+            if shared is not None:
+                return _adopt_search_cache(shared)
+            if token is not None:
+                break
+            if time.time() - started >= CRAWL_LOCK_WAIT_SECONDS:
+                cache = _stop_waiting_for_crawl(ttl)
+                if cache is not None:
+                    return cache
+                token = ''
+                break
+            if not waited:
+                waited = True
+                _broadcast_crawl_progress({"phase": "wait", "message": "Waiting for another instance's crawl"})
+            time.sleep(CRAWL_LOCK_POLL_SECONDS)
+        renewing = _hold_crawl_lock(token)
+        try:
+            tournaments = fetch_all_tournaments(progress_cb=_broadcast_crawl_progress)
+            return _store_search_cache(tournaments, ttl)
+        finally:
+            renewing.set()
+            _release_crawl_lock(token)
+    finally:
+        _end_search_fetch(progress_cb)
+
+
+def _store_search_cache(tournaments, ttl):
+    """Publish a finished crawl as the shared search cache entry."""
+    global _SEARCH_CACHE
+
+    fetched_at_ts = time.time()
+    fetched_at_iso = datetime.now(timezone.utc).isoformat()
+    stats_snapshot = _snapshot_search_stats()
+
+    cache = {
+        "tournaments": tournaments,
+        "total": len(tournaments),
+        "fetchedAt": fetched_at_iso,
+        "fetched_at_ts": fetched_at_ts,
+        "expires_at_ts": fetched_at_ts + ttl if ttl > 0 else fetched_at_ts,
+        # Bumped by every refresh merged into this crawl; peers adopt newer revisions.
+        "revised_at_ts": fetched_at_ts,
+        "stats": stats_snapshot,
+        # Which stored crawl holds these tournaments (None: filter in memory).
+        "crawl_id": None,
+    }
+    if _TOURNAMENT_STORE is not None:
+        try:
+            cache["crawl_id"] = _TOURNAMENT_STORE.record_crawl(tournaments, fetched_at_ts, stats_snapshot)
+            # The store holds the crawl; memory keeps only its metadata.
+            del cache["tournaments"]
+        except sqlite3.Error as e:
+            logger.error(f"Failed to store crawl in {_TOURNAMENT_STORE.path}: {e}")
+    with _SEARCH_CACHE_COND:
+        _SEARCH_CACHE = cache
+    _TAG_WATCH_HUB.publish(tournaments)
+    _share_search_cache(cache, ttl, tournaments)
+    return cache
+
+
+def _adopt_search_cache(cache):
+    """Publish another instance's crawl in this process without sharing it back."""
+    global _SEARCH_CACHE
+
+    with _SEARCH_CACHE_COND:
+        _SEARCH_CACHE = cache
+    _TAG_WATCH_HUB.publish(cache["tournaments"])
+    return cache
+
+
+def _share_search_cache(cache, ttl, tournaments=None):
+    if not _CACHE_BACKEND.shared:
+        return
+    body = {key: cache[key] for key in ("fetchedAt", "fetched_at_ts", "revised_at_ts", "stats")}
+    body["tournaments"] = tournaments if tournaments is not None else search_cache_tournaments(cache)
+    body = json.dumps(body, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    # Kept past its TTL so instances that waited on the crawl lock can still read it.
+    _backend_call(_CACHE_BACKEND.set, SEARCH_CACHE_KEY, body, max(ttl, CRAWL_LOCK_TTL_SECONDS))
+    _backend_call(_CACHE_BACKEND.set, SEARCH_CACHE_STAMP_KEY, repr(cache["revised_at_ts"]),
+                  max(ttl, CRAWL_LOCK_TTL_SECONDS))
+
+
+def load_shared_search_cache(ttl, fetched_after, allow_cached=True):
+    """The shared crawl if it finished after `fetched_after` or (with `allow_cached`) is still fresh."""
+    if not _CACHE_BACKEND.shared:
+        return None
+    body = _backend_call(_CACHE_BACKEND.get, SEARCH_CACHE_KEY)
+    if not body:
+        return None
+    cache = _json_loads(body)
+    fetched_at_ts = cache["fetched_at_ts"]
+    fresh = allow_cached and ttl > 0 and time.time() < fetched_at_ts + ttl
+    if not fresh and fetched_at_ts < fetched_after:
+        return None
+    cache["expires_at_ts"] = fetched_at_ts + ttl if ttl > 0 else fetched_at_ts
+    cache.setdefault("revised_at_ts", fetched_at_ts)
+    return cache
+
+
+def _acquire_crawl_lock():
+    """Crawl lock token, None while a peer holds it, or '' when the backend is down or its reply was lost."""
+    try:
+        return _CACHE_BACKEND.acquire_lock(CRAWL_LOCK_KEY, CRAWL_LOCK_TTL_SECONDS)
+    except CacheBackendError as e:
+        logger.warning(f"Crawl lock unavailable, crawling without it: {e}")
+        return ''
+
+
+def _release_crawl_lock(token):
+    if token:
+        _backend_call(_CACHE_BACKEND.release_lock, CRAWL_LOCK_KEY, token)
+
+
+def _renew_crawl_lock(token, stop):
+    """Extend the crawl lease every third of its TTL until `stop` is set."""
+    while not stop.wait(CRAWL_LOCK_TTL_SECONDS / 3):
+        if not _backend_call(_CACHE_BACKEND.renew_lock, CRAWL_LOCK_KEY, token, CRAWL_LOCK_TTL_SECONDS, default=True):
+            logger.warning("Crawl lock lease lost while crawling; a peer may crawl too")
+            return
+
+
+def _hold_crawl_lock(token):
+    """Keep renewing `token`'s lease on a background thread; set the returned event to stop."""
+    stop = threading.Event()
+    if token:
+        threading.Thread(target=_renew_crawl_lock, args=(token, stop), name='crawl-lock-renew', daemon=True).start()
+    return stop
+
+
+def _stop_waiting_for_crawl(ttl):
+    """Called after CRAWL_LOCK_WAIT_SECONDS on a peer's lock: the newest cache we have, or None."""
+    with _SEARCH_CACHE_COND:
+        local = _SEARCH_CACHE
+    shared = load_shared_search_cache(ttl, 0)
+    if shared is not None and (local is None or shared["revised_at_ts"] > local["revised_at_ts"]):
+        local = _adopt_search_cache(shared)
+    if local is not None:
+        logger.warning(f"Gave up waiting for a peer's crawl after {CRAWL_LOCK_WAIT_SECONDS:.0f}s; serving {local['fetchedAt']}")
+    else:
+        logger.warning(f"Gave up waiting for a peer's crawl after {CRAWL_LOCK_WAIT_SECONDS:.0f}s; crawling without the lock")
+    return local
+
+
+def _try_claim_crawl(ttl, started, force_refresh):
+    """One attempt at the fleet-wide crawl: (shared cache, None), (None, lock token) or (None, None) to wait."""
+    shared = load_shared_search_cache(ttl, started, allow_cached=not force_refresh)
+    if shared is not None:
+        return shared, None
+    token = _acquire_crawl_lock()
+    if token is None:
+        return None, None
+    # A peer may have published and released between the two calls above.
+    shared = load_shared_search_cache(ttl, started, allow_cached=not force_refresh)
+    if shared is not None:
+        _release_crawl_lock(token)
+        return shared, None
+    return None, token
+
+
+def load_stored_search_cache():
+    """Rebuild the search cache from the tournament store's latest crawl, if any."""
+    if _TOURNAMENT_STORE is None:
+        return None
+    try:
+        latest = _TOURNAMENT_STORE.latest_crawl()
+        total = _TOURNAMENT_STORE.crawl_total(latest[0]) if latest else 0
+    except sqlite3.Error as e:
+        logger.error(f"Failed to load stored crawl from {_TOURNAMENT_STORE.path}: {e}")
+        return None
+    if latest is None:
+        return None
+    crawl_id, fetched_at_ts, stats = latest
+    ttl = int(os.environ.get("SEARCH_CACHE_TTL_SECONDS", 180))
+    logger.info(f"Loaded crawl {crawl_id} ({total} tournaments) from {_TOURNAMENT_STORE.path}")
+    return {
+        "total": total,
+        "fetchedAt": datetime.fromtimestamp(fetched_at_ts, timezone.utc).isoformat(),
+        "fetched_at_ts": fetched_at_ts,
+        "expires_at_ts": fetched_at_ts + ttl if ttl > 0 else fetched_at_ts,
+        "revised_at_ts": fetched_at_ts,
+        "stats": stats,
+        "crawl_id": crawl_id,
+    }
+
+
+def stored_tournaments_matching(filters, cache):
+    """Non-time filter matches from the tournament store, or None to filter `cache` in memory.
+
+    The store answers only while its latest crawl is the one `cache` holds, so
+    the matches, the unfiltered total and the stats all describe one crawl.
+    Crawls adopted from a peer carry no crawl id and are filtered in memory.
+    """
+    if _TOURNAMENT_STORE is None or cache.get("crawl_id") is None:
+        return None
+    try:
+        return _TOURNAMENT_STORE.query(filters, crawl_id=cache["crawl_id"])
+    except sqlite3.Error as e:
+        logger.error(f"Tournament store query failed: {e}")
+        return None
+
+
+def search_cache_tournaments(cache, tags=None):
+    """The tournaments of `cache` (only `tags`, if given).
+
+    Crawls recorded in the tournament store keep only their metadata in
+    memory and are read back from SQLite here; each call gets fresh dicts.
+    """
+    if "tournaments" in cache:
+        if tags is None:
+            return cache["tournaments"]
+        wanted = set(tags)
+        return [t for t in cache["tournaments"] if normalize_tag(t.get('tag')) in wanted]
+    try:
+        return _TOURNAMENT_STORE.crawl_tournaments(cache["crawl_id"], tags)
+    except sqlite3.Error as e:
+        logger.error(f"Failed to read crawl {cache['crawl_id']} from {_TOURNAMENT_STORE.path}: {e}")
+        return []
+
+
+async def search_cache_tournaments_async(cache, tags=None):
+    """search_cache_tournaments() with the SQLite read off the event loop."""
+    if "tournaments" in cache:
+        return search_cache_tournaments(cache, tags)
+    return await asyncio.to_thread(search_cache_tournaments, cache, tags)
+
+
+def search_cache_total(cache):
+    return cache["total"] if "total" in cache else len(cache["tournaments"])
+
+
+# A restart resumes from the last stored crawl instead of an empty cache
+# (pool workers have no store, so this is a no-op there).
+_SEARCH_CACHE = load_stored_search_cache()
+
+
+def _end_search_fetch(progress_cb):
+    global _SEARCH_FETCH_IN_PROGRESS
+
+    with _SEARCH_CACHE_COND:
+        _SEARCH_FETCH_IN_PROGRESS = False
+        if progress_cb:
+            _SEARCH_PROGRESS_LISTENERS.remove(progress_cb)
+        _SEARCH_CACHE_COND.notify_all()
+
+
+async def get_cached_search_results_async(force_refresh=False, progress_cb=None):
+    """Event-loop variant of get_cached_search_results() for the ASGI tier.
+
+    Shares the cache, in-flight flag and progress listeners with the threaded
+    version, but never blocks the loop: waiters poll with asyncio.sleep() and
+    the crawl itself runs on the caller's loop instead of a nested asyncio.run().
+    """
+    global _SEARCH_FETCH_IN_PROGRESS
+
+    ttl = int(os.environ.get("SEARCH_CACHE_TTL_SECONDS", 180))
 
-    # Do the expensive work outside the lock.
-    cache = None
+    with _SEARCH_CACHE_COND:
+        now = time.time()
+        if not force_refresh and ttl > 0 and _SEARCH_CACHE and now < _SEARCH_CACHE["expires_at_ts"]:
+            return _SEARCH_CACHE
+        if progress_cb:
+            _SEARCH_PROGRESS_LISTENERS.append(progress_cb)
+        waiting = _SEARCH_FETCH_IN_PROGRESS
+        if not waiting:
+            _SEARCH_FETCH_IN_PROGRESS = True
+
+    if waiting:
+        if progress_cb:
+            progress_cb({"phase": "wait", "message": "Waiting for active crawl"})
+        while True:
+            await asyncio.sleep(0.25)
+            with _SEARCH_CACHE_COND:
+                if _SEARCH_FETCH_IN_PROGRESS:
+                    continue
+                if _SEARCH_CACHE:
+                    if progress_cb:
+                        _SEARCH_PROGRESS_LISTENERS.remove(progress_cb)
+                    return _SEARCH_CACHE
+                # The crawl we waited for failed; take over.
+                _SEARCH_FETCH_IN_PROGRESS = True
+                break
+
+    # Backend round-trips and the store's SQLite writes stay off the loop.
+    offload = _CACHE_BACKEND.remote or _TOURNAMENT_STORE is not None
     try:
-        tournaments = fetch_all_tournaments(progress_cb=progress_cb)
-        fetched_at_ts = time.time()
-        fetched_at_iso = datetime.now(timezone.utc).isoformat()
-        stats_snapshot = _snapshot_search_stats()
-
-        cache = {
-            "tournaments": tournaments,
-            "fetchedAt": fetched_at_iso,
-            "fetched_at_ts": fetched_at_ts,
-            "expires_at_ts": fetched_at_ts + ttl if ttl > 0 else fetched_at_ts,
-            "stats": stats_snapshot,
-        }
-        with _SEARCH_CACHE_COND:
-            _SEARCH_CACHE = cache
-        return cache
+        started = time.time()
+        waited = False
+        while True:
+            if offload:
+                shared, token = await asyncio.to_thread(_try_claim_crawl, ttl, started, force_refresh)
+            else:
+                shared, token = _try_claim_crawl(ttl, started, force_refresh)
+            if shared is not None:
+                return _adopt_search_cache(shared)
+            if token is not None:
+                break
+            if time.time() - started >= CRAWL_LOCK_WAIT_SECONDS:
+                if offload:
+                    cache = await asyncio.to_thread(_stop_waiting_for_crawl, ttl)
+                else:
+                    cache = _stop_waiting_for_crawl(ttl)
+                if cache is not None:
+                    return cache
+                token = ''
+                break
+            if not waited:
+                waited = True
+                _broadcast_crawl_progress({"phase": "wait", "message": "Waiting for another instance's crawl"})
+            await asyncio.sleep(CRAWL_LOCK_POLL_SECONDS)
+        renewing = _hold_crawl_lock(token)
+        try:
+            tournaments = await fetch_all_tournaments_async(progress_cb=_broadcast_crawl_progress)
+            if offload:
+                return await asyncio.to_thread(_store_search_cache, tournaments, ttl)
+            return _store_search_cache(tournaments, ttl)
+        finally:
+            renewing.set()
+            await _backend_call_async(_release_crawl_lock, token)
     finally:
-        with _SEARCH_CACHE_COND:
-            _SEARCH_FETCH_IN_PROGRESS = False
-            _SEARCH_CACHE_COND.notify_all()
+        _end_search_fetch(progress_cb)
 
 
-async def fetch_all_tournaments_async(progress_cb=None, stop_event=None):
-    # Per-crawl stats container (local, so concurrent crawls can't corrupt each other)
-    stats = make_search_stats()
+CRAWL_TUNING_ENV = (
+    'SEARCH_WORKERS', 'VERIFY_WORKERS', 'QUERY_DRILLDOWN_THRESHOLD', 'MAX_QUERY_LEN',
+    'MAX_CYRILLIC_QUERY_LEN', 'MAX_ARABIC_QUERY_LEN', 'MAX_VERIFICATION_PASSES',
+)
 
-    logger.info("Starting tournament fetch (asyncio)...")
-    start_time = time.time()
 
-    letters = 'abcdefghijklmnopqrstuvwxyz'
-    digits = '0123456789'
-    latin_chars = list(letters + digits)
-    drilldown_threshold = int(os.environ.get("QUERY_DRILLDOWN_THRESHOLD", 20))
+class CrawlTraceRecorder:
+    """Collects every crawl query and its response for offline tuning.
 
-    # 2-letter combinations (676) remain the main coverage backbone.
-    queries = [a + b for a in letters for b in letters]
+    Enabled by CRAWL_TRACE_DIR: each crawl writes one gzip-compressed
+    JSON-lines file there (a meta line, one line per query, a summary line).
+    Only tag and name are kept per item, which is all tools/crawl_tuner.py
+    needs to replay the API's word-prefix matching.
+    """
+
+    def __init__(self, directory, suffix=''):
+        self.directory = directory
+        self.suffix = suffix
+        self.started_at = datetime.now(timezone.utc)
+        self.settings = {name: os.environ.get(name) for name in CRAWL_TUNING_ENV}
+        self.queries = []
+
+    @classmethod
+    def from_env(cls, suffix=''):
+        directory = os.environ.get('CRAWL_TRACE_DIR')
+        return cls(directory, suffix) if directory else None
+
+    def record(self, query, phase, result, elapsed):
+        self.queries.append({
+            "type": "query",
+            "q": query,
+            "phase": phase,
+            "ok": bool(result.get("ok")),
+            "status": result.get("status"),
+            "attempts": result.get("attempts", 1),
+            "elapsed": round(elapsed, 4),
+            "items": [[t.get('tag'), t.get('name')] for t in result.get("items", [])],
+        })
 
+    def write(self, stats, found):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"crawl-{self.started_at.strftime('%Y%m%dT%H%M%S')}{self.suffix}.jsonl.gz")
+        lines = [{"type": "meta", "startedAt": self.started_at.isoformat(), "settings": self.settings}]
+        lines.extend(self.queries)
+        lines.append({
+            "type": "summary",
+            "found": found,
+            "rateLimits": stats.get('rate_limits', 0),
+            "apiErrors": stats.get('api_errors', 0),
+            "queries": stats.get('queries_completed', 0),
+        })
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            for line in lines:
+                f.write(json.dumps(line, separators=(',', ':'), ensure_ascii=False) + '\n')
+        logger.info(f"Crawl trace written to {path} ({len(self.queries)} queries)")
+        return path
+
+
+_LATIN_LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+_DIGITS = '0123456789'
+# Accented latin letters: the API does word-prefix matching WITHOUT
+# accent folding ("cok" does not match "çok"), so names whose every
+# word starts with an accented character are invisible to a-z queries.
+_ACCENTED_LETTERS = 'àáâãäåæçèéêëìíîïñòóôõöøùúûüýßıőşğœčćšžł'
+# Cyrillic letters (33) for Russian tournament names
+_CYRILLIC_LETTERS = 'абвгдеёжзийклмнопрстуфхцчшщъыьэюя'
+# Arabic script coverage for tournament names such as "صالح".
+_ARABIC_LETTERS = ''.join(dict.fromkeys('ءآأؤإئابتثجحخدذرزسشصضطظعغفقكلمنهويىةپچژکگھہیے'))
+_ARABIC_DIGITS = '٠١٢٣٤٥٦٧٨٩'
+# Common tournament words
+_COMMON_WORDS = [
+    'torneo', 'tornei', 'tourno', 'turnie', 'free', 'open', 'join',
+    'clan', 'war', 'pro', 'noob', 'legend', 'champ', 'master', 'elite',
+    'draft', 'mega', 'super', 'test', 'fun', '1000', '500', '100'
+]
+
+
+def build_seed_queries():
+    """Initial crawl queries; drill-downs extend these prefixes."""
+    # 2-letter combinations (676) remain the main coverage backbone.
+    queries = [a + b for a in _LATIN_LETTERS for b in _LATIN_LETTERS]
     # Single-letter latin queries catch one-character tournament names.
-    queries.extend(list(letters))
-
-    # Single digits
-    queries.extend(list(digits))
-
-    # Accented latin letters: the API does word-prefix matching WITHOUT
-    # accent folding ("cok" does not match "çok"), so names whose every
-    # word starts with an accented character are invisible to a-z queries.
-    accented_letters = 'àáâãäåæçèéêëìíîïñòóôõöøùúûüýßıőşğœčćšžł'
-    queries.extend(list(accented_letters))
-
-    # Cyrillic letters (33) for Russian tournament names
-    cyrillic_letters = 'абвгдеёжзийклмнопрстуфхцчшщъыьэюя'
-    queries.extend(list(cyrillic_letters))
-
-    # Arabic script coverage for tournament names such as "صالح".
-    arabic_letters = ''.join(dict.fromkeys('ءآأؤإئابتثجحخدذرزسشصضطظعغفقكلمنهويىةپچژکگھہیے'))
-    arabic_digits = '٠١٢٣٤٥٦٧٨٩'
-    arabic_chars = list(arabic_letters + arabic_digits + digits)
-    queries.extend(list(arabic_letters))
-    queries.extend(list(arabic_digits))
-
-    # Common tournament words
-    common_words = [
-        'torneo', 'tornei', 'tourno', 'turnie', 'free', 'open', 'join',
-        'clan', 'war', 'pro', 'noob', 'legend', 'champ', 'master', 'elite',
-        'draft', 'mega', 'super', 'test', 'fun', '1000', '500', '100'
-    ]
-    queries.extend(common_words)
+    queries.extend(_LATIN_LETTERS)
+    queries.extend(_DIGITS)
+    queries.extend(_ACCENTED_LETTERS)
+    queries.extend(_CYRILLIC_LETTERS)
+    queries.extend(_ARABIC_LETTERS)
+    queries.extend(_ARABIC_DIGITS)
+    queries.extend(_COMMON_WORDS)
+    return queries
+
+
+def shard_queries(queries, shard_count):
+    """Split seed queries into `shard_count` disjoint shards by first character.
+
+    Drill-downs only ever extend a query, so every query a shard can reach
+    starts with one of its characters and shards never overlap. Character
+    groups are assigned greedily, largest first, to the lightest shard.
+    """
+    groups = defaultdict(list)
+    for query in queries:
+        groups[query[0]].append(query)
+    loads = [0] * max(1, shard_count)
+    assignment = {}
+    for char in sorted(groups, key=lambda c: (-len(groups[c]), c)):
+        target = loads.index(min(loads))
+        assignment[char] = target
+        loads[target] += len(groups[char])
+    shards = [[] for _ in loads]
+    for query in queries:
+        shards[assignment[query[0]]].append(query)
+    return shards
+
+
+async def crawl_queries_async(queries, progress_cb=None, stop_event=None, trace=None, timeline=None,
+                              worker_divisor=1):
+    """Crawl `queries` (and their drill-downs) and return the raw, unmerged result.
+
+    The result holds the tournaments by tag, the counter stats and the sets
+    of retried, unresolved and saturated queries; merge_crawl_results()
+    turns one or more of them into the final crawl.
+    """
+    # Per-crawl stats container (local, so concurrent crawls can't corrupt each other)
+    stats = make_search_stats()
+
+    latin_chars = list(_LATIN_LETTERS + _DIGITS)
+    arabic_chars = list(_ARABIC_LETTERS + _ARABIC_DIGITS + _DIGITS)
+    # Children of a query can only add tournaments if its response was truncated;
+    # a lower threshold forces extra (usually redundant) drill-downs.
+    drilldown_threshold = int(os.environ.get("QUERY_DRILLDOWN_THRESHOLD", QUERY_RESULT_LIMIT))
 
     all_tournaments = {}
     successful_queries = set()
@@ -572,18 +2566,19 @@ async def fetch_all_tournaments_async(progress_cb=None, stop_event=None):
     # Increase workers since async I/O is very lightweight
     # The Royale API proxy starts dropping query coverage aggressively at 100 workers.
     # A lower default keeps the crawl slower but materially more complete.
-    WORKERS = int(os.environ.get('SEARCH_WORKERS', 25))
-    VERIFY_WORKERS = int(os.environ.get('VERIFY_WORKERS', 5))
+    # Sharded crawls split the budget so total concurrency stays the same.
+    WORKERS = max(1, int(os.environ.get('SEARCH_WORKERS', 25)) // worker_divisor)
+    VERIFY_WORKERS = max(1, int(os.environ.get('VERIFY_WORKERS', 5)) // worker_divisor)
     MAX_VERIFICATION_PASSES = int(os.environ.get('MAX_VERIFICATION_PASSES', 2))
     max_latin_len = int(os.environ.get("MAX_QUERY_LEN", 4))
     max_cyrillic_len = int(os.environ.get("MAX_CYRILLIC_QUERY_LEN", 2))
     max_arabic_len = int(os.environ.get("MAX_ARABIC_QUERY_LEN", 3))
 
     def drilldown_chars_and_limit(q):
-        if any(ch in arabic_letters or ch in arabic_digits for ch in q):
+        if any(ch in _ARABIC_LETTERS or ch in _ARABIC_DIGITS for ch in q):
             return arabic_chars, max_arabic_len
-        if any(ch in cyrillic_letters for ch in q):
-            return list(cyrillic_letters + digits), max_cyrillic_len
+        if any(ch in _CYRILLIC_LETTERS for ch in q):
+            return list(_CYRILLIC_LETTERS + _DIGITS), max_cyrillic_len
         return latin_chars, max_latin_len
 
     last_emit_ts = 0.0
@@ -619,6 +2614,7 @@ async def fetch_all_tournaments_async(progress_cb=None, stop_event=None):
     async def run_query_phase(session, initial_queries, phase, worker_count, message=None):
         q = asyncio.Queue()
         queued = set()
+        queued_at = {}
         unresolved = set()
         scheduled = 0
         completed = 0
@@ -628,6 +2624,8 @@ async def fetch_all_tournaments_async(progress_cb=None, stop_event=None):
             if query in successful_queries or query in queued:
                 return
             queued.add(query)
+            if timeline:
+                queued_at[query] = time.perf_counter()
             q.put_nowait(query)
             scheduled += 1
 
@@ -638,7 +2636,7 @@ async def fetch_all_tournaments_async(progress_cb=None, stop_event=None):
 
         sem = asyncio.Semaphore(worker_count)
 
-        async def worker():
+        async def worker(lane):
             nonlocal completed
             while True:
                 try:
@@ -653,8 +2651,21 @@ async def fetch_all_tournaments_async(progress_cb=None, stop_event=None):
                     if query in successful_queries:
                         continue
 
+                    query_started = time.perf_counter()
+                    span = {} if timeline else None
                     async with sem:
-                        result = await fetch_tournaments_by_query_async(session, query, stats)
+                        acquired = time.perf_counter()
+                        result = await fetch_tournaments_by_query_async(session, query, stats, span=span)
+                    finished = time.perf_counter()
+                    if trace:
+                        # API time only: the tuner must not read semaphore queueing as latency.
+                        trace.record(query, phase, result, finished - acquired)
+                    if timeline:
+                        timeline.query_span(
+                            query, lane, phase, queued_at.get(query, query_started), query_started, acquired,
+                            finished, span,
+                            {"status": result.get("status"), "items": len(result.get("items", []))},
+                        )
 
                     if not result.get("ok"):
                         unresolved.add(query)
@@ -669,7 +2680,7 @@ async def fetch_all_tournaments_async(progress_cb=None, stop_event=None):
                         all_tournaments[t['tag']] = t
 
                     chars, max_len = drilldown_chars_and_limit(query)
-                    if len(results) >= drilldown_threshold:
+                    if result.get("truncated") or len(results) >= drilldown_threshold:
                         if len(query) < max_len:
                             stats['drill_downs'] += 1
                             for c in chars:
@@ -681,7 +2692,7 @@ async def fetch_all_tournaments_async(progress_cb=None, stop_event=None):
                     emit(phase, completed, scheduled, unresolved=len(unresolved))
                     q.task_done()
 
-        workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+        workers = [asyncio.create_task(worker(lane)) for lane in range(1, worker_count + 1)]
         await q.join()
         for worker_task in workers:
             worker_task.cancel()
@@ -692,12 +2703,18 @@ async def fetch_all_tournaments_async(progress_cb=None, stop_event=None):
 
     connector = aiohttp.TCPConnector(limit=max(WORKERS, VERIFY_WORKERS), ssl=get_ssl_context())
     async with aiohttp.ClientSession(connector=connector) as session:
+        phase_started = time.perf_counter()
         unresolved = await run_query_phase(session, queries, "crawl", WORKERS)
+        CRAWL_PHASE_DURATION.observe(time.perf_counter() - phase_started, phase='crawl')
+        if timeline:
+            timeline.complete("crawl phase", phase_started, time.perf_counter())
 
+        phase_started = time.perf_counter()
         while unresolved and stats['verification_passes'] < MAX_VERIFICATION_PASSES:
             if stop_event and stop_event.is_set():
                 break
             stats['verification_passes'] += 1
+            pass_started = time.perf_counter()
             unresolved = await run_query_phase(
                 session,
                 sorted(unresolved),
@@ -705,17 +2722,171 @@ async def fetch_all_tournaments_async(progress_cb=None, stop_event=None):
                 VERIFY_WORKERS,
                 message="Rechecking incomplete query branches",
             )
+            if timeline:
+                timeline.complete(f"verify pass {stats['verification_passes']}", pass_started, time.perf_counter())
+        if stats['verification_passes']:
+            CRAWL_PHASE_DURATION.observe(time.perf_counter() - phase_started, phase='verify')
 
-    elapsed = time.time() - start_time
-    stats['queries_retried'] = len(retried_queries)
+    return {
+        "tournaments": all_tournaments,
+        "stats": stats,
+        "retried": retried_queries,
+        "unresolved": unresolved,
+        "saturated": saturated_queries,
+    }
+
+
+def merge_crawl_results(results):
+    """Combine crawl results: dedupe tags, then derive stats as a single crawl would.
+
+    Counters are summed, verification_passes is the deepest pass any shard
+    needed, and retried/unresolved/saturated counts, the per-mode breakdown
+    and the confidence are recomputed from the merged sets.
+    """
+    stats = make_search_stats()
+    all_tournaments = {}
+    retried, unresolved, saturated = set(), set(), set()
+    for result in results:
+        all_tournaments.update(result["tournaments"])
+        for counter in ('queries_completed', 'drill_downs', 'rate_limits', 'api_errors'):
+            stats[counter] += result["stats"].get(counter, 0)
+        stats['verification_passes'] = max(stats['verification_passes'], result["stats"].get('verification_passes', 0))
+        retried |= set(result["retried"])
+        unresolved |= set(result["unresolved"])
+        saturated |= set(result["saturated"])
+
+    stats['queries_retried'] = len(retried)
     stats['failed_queries'] = len(unresolved)
-    stats['saturated_queries'] = len(saturated_queries)
+    stats['saturated_queries'] = len(saturated)
     stats['search_confidence'] = compute_search_confidence(stats)
 
     # Count tournaments by game mode
     for t in all_tournaments.values():
         mode_id = str(t.get('gameMode', {}).get('id', 'unknown'))
         stats['tournaments_by_mode'][mode_id] += 1
+    return all_tournaments, stats, unresolved, saturated
+
+
+_SHARD_POOL_LOCK = threading.Lock()
+_SHARD_POOL = None  # (worker count, ProcessPoolExecutor), kept between crawls
+
+
+def run_crawl_shard(queries, shard_count, shard_index=0, timeline=None):
+    """Crawl one shard in this process (a pool worker, or a node of its own)."""
+    rate = float(os.environ.get("API_KEY_RATE", 0))
+    if rate:
+        # Every process has its own key pool; split the per-key budget.
+        os.environ["API_KEY_RATE"] = str(rate / shard_count)
+    trace = CrawlTraceRecorder.from_env(suffix=f"-shard{shard_index}")
+    result = asyncio.run(crawl_queries_async(queries, trace=trace, timeline=timeline, worker_divisor=shard_count))
+    if trace:
+        try:
+            trace.write(result["stats"], len(result["tournaments"]))
+        except OSError as e:
+            logger.error(f"Failed to write crawl trace: {e}")
+    return result
+
+
+def _run_pooled_crawl_shard(queries, shard_count, shard_index, env, api_base):
+    """Shard pool entry point.
+
+    Workers outlive a crawl, so each task brings the parent's current
+    environment and API base, and hands back its metrics and timeline for
+    the parent to merge.
+    """
+    global API_BASE
+    os.environ.clear()
+    os.environ.update(env)
+    API_BASE = api_base
+    export_metric_samples(reset=True)  # drop anything left over from a failed task
+    timeline = CrawlTimeline.from_env(f"crawl shard {shard_index}")
+    result = run_crawl_shard(queries, shard_count, shard_index, timeline=timeline)
+    result["metrics"] = export_metric_samples(reset=True)
+    result["timeline"] = timeline.export() if timeline else None
+    return result
+
+
+def _shard_pool(workers):
+    global _SHARD_POOL
+    with _SHARD_POOL_LOCK:
+        if _SHARD_POOL is not None and _SHARD_POOL[0] != workers:
+            _SHARD_POOL[1].shutdown(wait=False)
+            _SHARD_POOL = None
+        if _SHARD_POOL is None:
+            pool = _spawn_process_pool(workers)
+            atexit.register(pool.shutdown, wait=False)
+            _SHARD_POOL = (workers, pool)
+        return _SHARD_POOL[1]
+
+
+def _discard_shard_pool(pool):
+    """Drop a pool that lost a worker, so the next crawl spawns a fresh one."""
+    global _SHARD_POOL
+    with _SHARD_POOL_LOCK:
+        if _SHARD_POOL is not None and _SHARD_POOL[1] is pool:
+            _SHARD_POOL = None
+    pool.shutdown(wait=False)
+
+
+async def crawl_shards_async(queries, shard_count, progress_cb=None):
+    """Run the shards of `queries` on the shard process pool; progress is per shard."""
+    shards = [shard for shard in shard_queries(queries, shard_count) if shard]
+    loop = asyncio.get_running_loop()
+    found = set()
+    results = []
+
+    def emit(message):
+        if progress_cb:
+            progress_cb({
+                "phase": "crawl",
+                "completed": len(results),
+                "pending": len(shards) - len(results),
+                "uniqueFound": len(found),
+                "message": message,
+            })
+
+    emit(f"Crawling {len(shards)} shards in parallel")
+    pool = _shard_pool(len(shards))
+    env = dict(os.environ)
+    futures = [
+        loop.run_in_executor(pool, _run_pooled_crawl_shard, shard, len(shards), index, env, API_BASE)
+        for index, shard in enumerate(shards)
+    ]
+    try:
+        for future in asyncio.as_completed(futures):
+            result = await future
+            merge_metric_samples(result.pop("metrics"))
+            timeline = result.pop("timeline")
+            if timeline:
+                CrawlTimeline.adopt(timeline)
+            results.append(result)
+            found.update(result["tournaments"])
+            emit(f"Shard {len(results)}/{len(shards)} finished")
+    except BrokenProcessPool:
+        _discard_shard_pool(pool)
+        raise
+    return results
+
+
+async def fetch_all_tournaments_async(progress_cb=None, stop_event=None):
+    logger.info("Starting tournament fetch (asyncio)...")
+    start_time = time.time()
+
+    queries = build_seed_queries()
+    # CRAWL_SHARDS > 1 spreads the query space over that many processes.
+    shard_count = int(os.environ.get('CRAWL_SHARDS', 1))
+    trace = timeline = None
+    crawl_started = time.perf_counter()
+    if shard_count > 1:
+        results = await crawl_shards_async(queries, shard_count, progress_cb=progress_cb)
+    else:
+        trace = CrawlTraceRecorder.from_env()
+        timeline = CrawlTimeline.from_env("crawl")
+        results = [await crawl_queries_async(queries, progress_cb, stop_event, trace=trace, timeline=timeline)]
+    all_tournaments, stats, unresolved, saturated_queries = merge_crawl_results(results)
+
+    elapsed = time.time() - start_time
+    CRAWL_DURATION.observe(elapsed)
 
     logger.info(f"Fetch completed in {elapsed:.1f}s")
     logger.info(
@@ -736,11 +2907,38 @@ async def fetch_all_tournaments_async(progress_cb=None, stop_event=None):
     if saturated_queries:
         logger.warning("Saturated query leaves (possible incomplete coverage): %s", ", ".join(sorted(saturated_queries)[:20]))
 
-    # Log breakdown by game mode
-    logger.info("Game Mode breakdown:")
-    for mode_id, count in sorted(stats['tournaments_by_mode'].items(), key=lambda x: -x[1]):
-        mode_name = GAME_MODES.get(mode_id, f"Unknown ({mode_id})")
-        logger.info(f"  - {mode_name}: {count}")
+    # Log breakdown by game mode (one DEBUG line; the counts also live in the stats)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Game Mode breakdown: %s", ", ".join(
+            f"{GAME_MODES.get(mode_id, f'Unknown ({mode_id})')}: {count}"
+            for mode_id, count in sorted(stats['tournaments_by_mode'].items(), key=lambda x: -x[1])
+        ))
+
+    if timeline:
+        timeline.complete("crawl", crawl_started, time.perf_counter(), lane=0, args={
+            "found": len(all_tournaments), "queries": stats['queries_completed'],
+            "rate_limits": stats['rate_limits'], "drill_downs": stats['drill_downs'],
+        })
+        timeline.finish()
+
+    if trace:
+        try:
+            trace.write(stats, len(all_tournaments))
+        except OSError as e:
+            logger.error(f"Failed to write crawl trace: {e}")
+
+    crawled_at = datetime.now(timezone.utc).isoformat()
+    event_log.record_many(
+        [({
+            "ts": crawled_at,
+            "event": "crawl",
+            "durationSec": round(elapsed, 1),
+            "found": len(all_tournaments),
+            "queries": stats['queries_completed'],
+            "confidence": stats['search_confidence'],
+        }, ())]
+        + seen_events(crawled_at, all_tournaments)
+    )
 
     # Publish the finished stats for _snapshot_search_stats() consumers.
     global search_stats
@@ -908,8 +3106,110 @@ def filter_tournaments(tournaments, filters, apply_time_filter=True):
     return filtered
 
 
+# =============================================================================
+# PROFILING (opt-in cProfile per route, served at /api/debug/profiles)
+# =============================================================================
+PROFILE_TOP_N = int(os.environ.get("PROFILE_TOP_N", 25))
+_PROFILES_LOCK = threading.Lock()
+_PROFILES = deque(maxlen=int(os.environ.get("PROFILE_KEEP", 30)))
+# One profiled call at a time keeps the overhead bounded when PROFILE_ROUTES
+# covers busy routes (and cProfile can't nest across threads on 3.12+).
+_PROFILER_BUSY = threading.Lock()
+
+
+def profiling_requested(route_name):
+    """PROFILE_ROUTES=all|<name>,... or an `X-Profile: 1` header from a logged-in user."""
+    configured = {r.strip() for r in os.environ.get("PROFILE_ROUTES", "").split(",") if r.strip()}
+    if configured & {"1", "all", route_name}:
+        return True
+    if has_request_context() and request.headers.get("X-Profile", "").strip() in ("1", "true", "yes"):
+        return not APP_PASSWORD or bool(session.get('authenticated'))
+    return False
+
+
+def summarize_profile(profiler, top_n=PROFILE_TOP_N):
+    """Top functions by own time from a finished cProfile.Profile."""
+    rows = []
+    for (filename, line, func), (_, calls, tottime, cumtime, _) in pstats.Stats(profiler).stats.items():
+        rows.append({
+            "function": func,
+            "file": os.path.relpath(filename, BASE_DIR) if filename.startswith(BASE_DIR) else filename,
+            "line": line,
+            "calls": calls,
+            "ownMs": round(tottime * 1000, 2),
+            "cumulativeMs": round(cumtime * 1000, 2),
+        })
+    rows.sort(key=lambda r: r["ownMs"], reverse=True)
+    return rows[:top_n]
+
+
+def run_profiled(route_name, fn, *args, **kwargs):
+    """Call fn under cProfile and keep its hot functions in the rolling store."""
+    if not _PROFILER_BUSY.acquire(blocking=False):
+        return fn(*args, **kwargs)
+    profiler = cProfile.Profile()
+    started = time.perf_counter()
+    try:
+        return profiler.runcall(fn, *args, **kwargs)
+    finally:
+        wall = time.perf_counter() - started
+        _PROFILER_BUSY.release()
+        entry = {
+            "route": route_name,
+            "at": datetime.now(timezone.utc).isoformat(),
+            "wallMs": round(wall * 1000, 1),
+            "top": summarize_profile(profiler),
+        }
+        with _PROFILES_LOCK:
+            _PROFILES.append(entry)
+        logger.debug(f"Profiled {route_name} in {entry['wallMs']}ms")
+
+
+def profiled(route_name):
+    """Decorator: profile the view when profiling_requested(route_name)."""
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            if not profiling_requested(route_name):
+                return f(*args, **kwargs)
+            return run_profiled(route_name, f, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
 # Routes
 
+@app.before_request
+def start_request_timer():
+    global _http_in_flight
+    g.request_started = time.perf_counter()
+    with _HTTP_IN_FLIGHT_LOCK:
+        _http_in_flight += 1
+
+
+@app.after_request
+def remember_response_status(response):
+    g.response_status = response.status_code
+    return response
+
+
+@app.teardown_request
+def observe_request_duration(exc):
+    """Runs when the request context is popped, i.e. after a stream closes."""
+    global _http_in_flight
+    started = g.pop('request_started', None)
+    if started is None:
+        return
+    with _HTTP_IN_FLIGHT_LOCK:
+        _http_in_flight -= 1
+    HTTP_REQUEST_DURATION.observe(
+        time.perf_counter() - started,
+        route=request.url_rule.rule if request.url_rule else 'unmatched',
+        method=request.method,
+        status=500 if exc is not None else g.get('response_status', 500),
+    )
+
+
 @app.route('/login', methods=['GET', 'POST'])
 def login():
     """Login page"""
@@ -924,7 +3224,7 @@ def login():
     error = None
     if request.method == 'POST':
         password = request.form.get('password', '')
-        if secrets.compare_digest(password, APP_PASSWORD):
+        if secrets.compare_digest(password.encode('utf-8'), APP_PASSWORD.encode('utf-8')):
             session.permanent = True
             session['authenticated'] = True
             return redirect(url_for('index'))
@@ -955,6 +3255,7 @@ def manifest():
 
 @app.route('/api/tournaments')
 @login_required
+@profiled('tournaments')
 def api_tournaments():
     """Fetch and filter tournaments with accurate timing from detail API"""
     if not has_api_key():
@@ -987,12 +3288,15 @@ def api_tournaments():
     # Phase 1: Fetch all tournaments (crawler), cached across requests
     if cache is None:
         cache = get_cached_search_results(force_refresh=False)
-    tournaments = cache["tournaments"]
-    unfiltered_total = len(tournaments)
+    unfiltered_total = search_cache_total(cache)
     cached_stats = cache.get("stats", _snapshot_search_stats())
 
-    # Phase 2: Apply non-time filters first (reduces to ~10-50 tournaments)
-    filtered = filter_tournaments(tournaments, filters, apply_time_filter=False)
+    # Phase 2: Apply non-time filters first (reduces to ~10-50 tournaments),
+    # as indexed SQL when the tournament store holds this crawl
+    stored = stored_tournaments_matching(filters, cache)
+    if stored is None:
+        stored = search_cache_tournaments(cache)
+    filtered = filter_tournaments(stored, filters, apply_time_filter=False)
     logger.info(f"After non-time filters: {len(filtered)} tournaments")
 
     # Phase 3: Fetch details only when needed (in-progress tournaments)
@@ -1001,13 +3305,15 @@ def api_tournaments():
     # Phase 4: Apply time filters with accurate times
     filtered = filter_tournaments(filtered, filters, apply_time_filter=True)
     logger.info(f"After time filters: {len(filtered)} tournaments")
-
-    # Log all matching tournaments
-    if filtered:
-        logger.info("Matching tournaments:")
-        for t in filtered:
-            mode_name = t.get('_mode_name', 'Unknown')
-            logger.info(f"  {t.get('tag')} \"{t.get('name')}\" [{mode_name}] {t.get('capacity')}/{t.get('maxCapacity')} players")
+    log_sampled_tournaments("Matching tournaments", filtered)
+
+    # Record every matching tournament as a structured event (written off-thread)
+    searched_at = datetime.now(timezone.utc).isoformat()
+    event_log.record_many(
+        [({"ts": searched_at, "event": "search", "filters": filters, "total": len(filtered)}, ())]
+        + [({"ts": searched_at, "event": "match", **tournament_event_fields(t)}, (t.get('tag'),))
+           for t in filtered if t.get('tag')]
+    )
 
     # Prepare response
     result = []
@@ -1038,6 +3344,7 @@ def api_tournaments():
 
 @app.route('/api/tournaments/search')
 @login_required
+@profiled('search')
 def api_tournaments_search():
     """Fetch ALL tournaments without filtering - for client-side filtering.
 
@@ -1062,7 +3369,7 @@ def api_tournaments_search():
     # Phase 1: Fetch all tournaments (crawler), cached across requests
     if cache is None:
         cache = get_cached_search_results(force_refresh=force_refresh)
-    tournaments = cache["tournaments"]
+    tournaments = search_cache_tournaments(cache)
     total_count = len(tournaments)
     cached_stats = cache.get("stats", _snapshot_search_stats())
 
@@ -1072,35 +3379,93 @@ def api_tournaments_search():
 
     logger.info(f"=== FETCH COMPLETE: {len(tournaments)} tournaments ===")
 
-    return jsonify(build_tournaments_search_payload(
+    response = jsonify(build_tournaments_search_payload(
         tournaments=tournaments,
         fetched_at_iso=cache.get("fetchedAt") or datetime.now(timezone.utc).isoformat(),
         stats_snapshot=cached_stats,
     ))
+    # The service worker revalidates its cached copy with If-None-Match.
+    etag = payload_etag(response.get_data())
+    if etag_matches(request.headers.get('If-None-Match'), etag):
+        response = Response(status=304)
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+@app.route('/api/tournaments/history')
+@login_required
+def api_tournaments_history():
+    """Trend data from the tournament store (TOURNAMENT_DB_PATH).
+
+    Query params:
+        tag: one tournament's status/player change points; omit for per-crawl totals
+        hours: how far back to look (default 24, capped by TOURNAMENT_HISTORY_HOURS)
+    """
+    if _TOURNAMENT_STORE is None:
+        return jsonify({"error": "Tournament history requires TOURNAMENT_DB_PATH"}), 400
+    try:
+        hours = min(float(request.args.get('hours', 24)), TOURNAMENT_HISTORY_HOURS)
+    except ValueError:
+        return jsonify({"error": "hours must be a number"}), 400
+    tag = normalize_tag(request.args.get('tag', '')) or None
+    points = _TOURNAMENT_STORE.history(tag, since_ts=time.time() - hours * 3600)
+    for point in points:
+        point["ts"] = datetime.fromtimestamp(point["ts"], timezone.utc).isoformat()
+    return jsonify({"tag": tag, "hours": hours, "points": points})
+
+
+@app.route('/api/tournaments/refresh', methods=['POST'])
+@login_required
+def api_tournaments_refresh():
+    """Re-fetch a few tournaments by tag without a crawl.
+
+    Body: {"tags": [...]} (or ?tags=A,B), at most TOURNAMENT_REFRESH_MAX_TAGS.
+    Returns the refreshed records in the search payload shape plus the tags
+    the API did not return; the cached crawl (for tags it holds) and tag
+    watchers are updated too.
+    """
+    if not has_api_key():
+        return jsonify({"error": "API key not configured"}), 400
+    data = request.get_json(silent=True) or {}
+    tags = parse_tag_list(data.get('tags') or request.args.get('tags', ''), TOURNAMENT_REFRESH_MAX_TAGS)
+    if not tags:
+        return jsonify({"error": "tags is required"}), 400
+
+    merged, unmerged, missing = asyncio.run(refresh_tournaments_async(tags))
+    tournaments = merged + unmerged
+    logger.info(f"Refreshed {len(tournaments)}/{len(tags)} tournaments by tag")
+    return jsonify({
+        "tournaments": [serialize_tournament(t) for t in tournaments],
+        "missing": missing,
+        "refreshedAt": datetime.now(timezone.utc).isoformat(),
+    })
+
+
+def serialize_tournament(t):
+    """One raw tournament in the shape the frontend reads."""
+    return {
+        "tag": t.get('tag'),
+        "name": t.get('name'),
+        "type": t.get('type'),
+        "status": t.get('status'),
+        "players": t.get('capacity', 0),
+        "maxPlayers": t.get('maxCapacity', 0),
+        "levelCap": t.get('levelCap'),
+        "gameModeId": str(t.get('gameMode', {}).get('id', '')),
+        "gameModeName": get_mode_name(t.get('gameMode', {}).get('id')),
+        # Raw time fields for client-side calculation
+        "createdTime": t.get('createdTime'),
+        "preparationDuration": t.get('preparationDuration', 0),
+        "duration": t.get('duration', 0),
+        "startedTime": t.get('startedTime'),
+        "endedTime": t.get('endedTime')
+    }
 
 
 def build_tournaments_search_payload(tournaments, fetched_at_iso, stats_snapshot):
     """Build the `/api/tournaments/search` response payload from raw tournaments."""
-    result = []
-    for t in tournaments:
-        result.append({
-            "tag": t.get('tag'),
-            "name": t.get('name'),
-            "type": t.get('type'),
-            "status": t.get('status'),
-            "players": t.get('capacity', 0),
-            "maxPlayers": t.get('maxCapacity', 0),
-            "levelCap": t.get('levelCap'),
-            "gameModeId": str(t.get('gameMode', {}).get('id', '')),
-            "gameModeName": get_mode_name(t.get('gameMode', {}).get('id')),
-            # Raw time fields for client-side calculation
-            "createdTime": t.get('createdTime'),
-            "preparationDuration": t.get('preparationDuration', 0),
-            "duration": t.get('duration', 0),
-            "startedTime": t.get('startedTime'),
-            "endedTime": t.get('endedTime')
-        })
-
+    result = [serialize_tournament(t) for t in tournaments]
     return {
         "tournaments": result,
         "total": len(result),
@@ -1109,80 +3474,424 @@ def build_tournaments_search_payload(tournaments, fetched_at_iso, stats_snapshot
     }
 
 
+def payload_etag(body):
+    """Strong ETag for a response body (bytes)."""
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+def etag_matches(if_none_match, etag):
+    """True when an If-None-Match header value covers `etag` (weak comparison)."""
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(',')]
+    return '*' in tags or any((t[2:] if t.startswith('W/') else t) == etag for t in tags)
+
+
+class SearchStreamHub:
+    """Fan out one search job's SSE events to every connected client.
+
+    The first subscriber starts the job; everyone who connects while it runs
+    shares it and gets the latest event replayed on arrival. When
+    the last subscriber disconnects the job's stop event is set, mirroring
+    the old per-connection behaviour.
+
+    A job is identified by its stop event. A joiner starts a fresh job that
+    supersedes the current one when that job is already stopping, or when the
+    joiner asks for `force` and the current job was not forced; publish() and
+    finish() calls from a superseded job are ignored.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sinks = []
+        self._latest_event = None
+        self._stop_event = None
+        self._force = False
+        self._running = False
+
+    def subscribe(self, sink, start_job, force=False):
+        """Register `sink(message)`; call `start_job(stop_event)` unless a usable job is running."""
+        with self._lock:
+            self._sinks.append(sink)
+            if self._running and not self._stop_event.is_set() and (self._force or not force):
+                if self._latest_event is not None:
+                    sink(self._latest_event)
+                return
+            if self._stop_event is not None:
+                self._stop_event.set()
+            self._running = True
+            self._latest_event = None
+            self._force = force
+            self._stop_event = threading.Event()
+            stop_event = self._stop_event
+        start_job(stop_event)
+
+    def unsubscribe(self, sink):
+        with self._lock:
+            if sink in self._sinks:
+                self._sinks.remove(sink)
+            if not self._sinks and self._stop_event is not None:
+                self._stop_event.set()
+
+    def publish(self, event_type, data, job=None):
+        """Send an event to every subscriber; `job` is the publishing job's stop event."""
+        message = format_sse_event(event_type, data)
+        with self._lock:
+            if job is not None and job is not self._stop_event:
+                return
+            # Replay progress to late joiners; a final done/fail replaces it so
+            # someone connecting just before finish() still gets the result.
+            self._latest_event = message
+            sinks = list(self._sinks)
+        for sink in sinks:
+            sink(message)
+
+    def finish(self, job=None):
+        """End the current job and close every subscriber's stream."""
+        with self._lock:
+            if job is not None and job is not self._stop_event:
+                return
+            sinks = self._sinks
+            self._sinks = []
+            self._running = False
+            self._latest_event = None
+            self._stop_event = None
+            self._force = False
+        for sink in sinks:
+            sink(None)
+
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._sinks)
+
+
+def format_sse_event(event_type, data):
+    try:
+        msg = json.dumps(data, separators=(",", ":"))
+    except Exception:
+        msg = json.dumps({"error": "Failed to encode event payload"})
+    return f"event: {event_type}\ndata: {msg}\n\n"
+
+
+_SEARCH_STREAM_HUB = SearchStreamHub()
+
+
+# =============================================================================
+# FAVORITE WATCHES (per-tag push)
+# =============================================================================
+FAVORITES_STREAM_MAX_TAGS = int(os.environ.get("FAVORITES_STREAM_MAX_TAGS", 50))
+FAVORITES_KEEPALIVE_SECONDS = float(os.environ.get("FAVORITES_KEEPALIVE_SECONDS", 15))
+# The threaded server parks a request thread on every open stream, so each
+# process holds at most this many open (by default all but one of its
+# GUNICORN_THREADS); other clients get a snapshot and reconnect after
+# FAVORITES_POLL_SECONDS. The ASGI tier streams to everyone.
+FAVORITES_THREADED_STREAMS = int(os.environ.get(
+    "FAVORITES_THREADED_STREAMS", max(1, int(os.environ.get("GUNICORN_THREADS", 4)) - 1)))
+FAVORITES_POLL_SECONDS = float(os.environ.get("FAVORITES_POLL_SECONDS", 30))
+# How often watchers pick up crawls and details from other processes.
+FAVORITES_SHARED_POLL_SECONDS = float(os.environ.get("FAVORITES_SHARED_POLL_SECONDS", 10))
+
+
+def parse_tag_list(value, limit):
+    """Tags from a comma-separated string or a list, normalized, deduped and capped."""
+    parts = value if isinstance(value, (list, tuple)) else str(value or '').split(',')
+    tags = []
+    for part in parts:
+        tag = normalize_tag(part)
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags[:limit]
+
+
+def parse_watch_tags(value):
+    return parse_tag_list(value, FAVORITES_STREAM_MAX_TAGS)
+
+
+def tournament_watch_state(t):
+    """The fields a favorite's row and live alert need, as pushed to watchers."""
+    return {
+        "tag": normalize_tag(t.get('tag')),
+        "name": t.get('name'),
+        "status": t.get('status'),
+        "players": t.get('capacity', 0),
+        "maxPlayers": t.get('maxCapacity', 0),
+        "startedTime": t.get('startedTime'),
+        "endedTime": t.get('endedTime'),
+    }
+
+
+def current_watch_states(tags):
+    """Latest known state for `tags`: the search cache, overlaid with fresher details."""
+    wanted = set(tags)
+    states = {}
+    with _SEARCH_CACHE_COND:
+        cache = _SEARCH_CACHE
+    for t in search_cache_tournaments(cache, wanted) if cache else []:
+        states[normalize_tag(t.get('tag'))] = tournament_watch_state(t)
+    with _DETAIL_CACHE_LOCK:
+        details = [_DETAIL_CACHE[tag]["detail"] for tag in wanted if tag in _DETAIL_CACHE]
+    for detail in details:
+        states[normalize_tag(detail.get('tag'))] = tournament_watch_state(detail)
+    return states
+
+
+class TagWatchHub:
+    """Push compact per-tag changes to clients watching a few tournaments.
+
+    Each subscriber registers a sink and its tags. publish() is handed every
+    crawl result and fetched detail, and sends each sink only the watched
+    tournaments whose state differs from what was last pushed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sinks_by_tag = defaultdict(set)
+        self._tags_by_sink = {}
+        self._last = {}
+
+    def subscribe(self, sink, tags):
+        """Register `sink(message)` for `tags` and send it a snapshot of what is known."""
+        states = current_watch_states(tags)
+        with self._lock:
+            self._tags_by_sink[sink] = list(tags)
+            for tag in tags:
+                self._sinks_by_tag[tag].add(sink)
+                if tag in states:
+                    self._last.setdefault(tag, states[tag])
+            snapshot = [self._last[tag] for tag in tags if tag in self._last]
+        sink(format_sse_event("snapshot", {"tournaments": snapshot}))
+
+    def unsubscribe(self, sink):
+        with self._lock:
+            for tag in self._tags_by_sink.pop(sink, []):
+                sinks = self._sinks_by_tag.get(tag)
+                if sinks is None:
+                    continue
+                sinks.discard(sink)
+                if not sinks:
+                    del self._sinks_by_tag[tag]
+                    self._last.pop(tag, None)
+
+    def publish(self, tournaments):
+        pending = defaultdict(list)
+        with self._lock:
+            if not self._sinks_by_tag:
+                return
+            for t in tournaments:
+                tag = normalize_tag(t.get('tag'))
+                if tag not in self._sinks_by_tag:
+                    continue
+                state = tournament_watch_state(t)
+                last = self._last.get(tag)
+                if last:
+                    # Crawl items carry no start/end times; keep what a detail said.
+                    state = {key: last[key] if value is None else value for key, value in state.items()}
+                if last == state:
+                    continue
+                self._last[tag] = state
+                for sink in self._sinks_by_tag[tag]:
+                    pending[sink].append(state)
+        for sink, states in pending.items():
+            sink(format_sse_event("update", {"tournaments": states}))
+
+    def watched_tags(self):
+        with self._lock:
+            return sorted(self._sinks_by_tag)
+
+
+_TAG_WATCH_HUB = TagWatchHub()
+_FAVORITES_STREAM_SLOTS = threading.Semaphore(FAVORITES_THREADED_STREAMS)
+_SHARED_WATCH_FOLLOWER_LOCK = threading.Lock()
+_SHARED_WATCH_FOLLOWER = None
+
+
+def sync_shared_watch_states(tags):
+    """Pull what other processes learned about `tags` into this one.
+
+    Adopts a newer shared crawl and newer shared details, publishing both to
+    this process's watchers; crawls and detail fetches elsewhere reach them
+    only through here.
+    """
+    if not _CACHE_BACKEND.shared or not tags:
+        return
+    with _SEARCH_CACHE_COND:
+        local = _SEARCH_CACHE
+    local_ts = local["revised_at_ts"] if local else 0
+    stamp = _backend_call(_CACHE_BACKEND.get, SEARCH_CACHE_STAMP_KEY)
+    if stamp and float(stamp) > local_ts:
+        shared = load_shared_search_cache(int(os.environ.get("SEARCH_CACHE_TTL_SECONDS", 180)), 0)
+        if shared is not None and shared["revised_at_ts"] > local_ts:
+            _adopt_search_cache(shared)
+
+    ttl = int(os.environ.get("DETAIL_CACHE_TTL_SECONDS", 300))
+    details = []
+    for tag in tags:
+        shared = _load_shared_detail(tag)
+        if shared is None:
+            continue
+        fetched_at, detail = shared
+        with _DETAIL_CACHE_LOCK:
+            cached = _DETAIL_CACHE.get(tag)
+            if cached and cached["fetched_at"] >= fetched_at:
+                continue
+            _DETAIL_CACHE[tag] = {"fetched_at": fetched_at, "expires_at": fetched_at + ttl, "detail": detail}
+        details.append(detail)
+    if details:
+        _TAG_WATCH_HUB.publish(details)
+
+
+def _follow_shared_watch_states():
+    while True:
+        time.sleep(FAVORITES_SHARED_POLL_SECONDS)
+        try:
+            sync_shared_watch_states(_TAG_WATCH_HUB.watched_tags())
+        except Exception:
+            logger.exception("Syncing watched tags from the shared cache failed")
+
+
+def ensure_shared_watch_follower():
+    """Start the thread that keeps watchers fed from the shared cache (once per process)."""
+    global _SHARED_WATCH_FOLLOWER
+    if not _CACHE_BACKEND.shared:
+        return
+    with _SHARED_WATCH_FOLLOWER_LOCK:
+        if _SHARED_WATCH_FOLLOWER is None:
+            _SHARED_WATCH_FOLLOWER = threading.Thread(
+                target=_follow_shared_watch_states, name='shared-watch-follower', daemon=True)
+            _SHARED_WATCH_FOLLOWER.start()
+
+
+@app.route('/api/favorites/stream')
+@login_required
+def api_favorites_stream():
+    """Stream state changes for a few watched tournaments via SSE.
+
+    Query params:
+        tags: comma-separated tournament tags (at most FAVORITES_STREAM_MAX_TAGS)
+
+    Event types:
+      - snapshot: {"tournaments": [...]} current state of the known tags, sent once
+      - update: {"tournaments": [...]} tags whose status, players or times changed
+
+    Served here (the threaded tier), only FAVORITES_THREADED_STREAMS streams
+    per process stay open; the others end after the snapshot and the browser
+    reconnects after FAVORITES_POLL_SECONDS. asgi.py streams to every client.
+    """
+    tags = parse_watch_tags(request.args.get('tags', ''))
+    if not tags:
+        return jsonify({"error": "tags is required"}), 400
+
+    def gen():
+        # Everything happens once the response starts, so a client that leaves
+        # before that holds neither a slot nor a subscription.
+        sync_shared_watch_states(tags)
+        if not _FAVORITES_STREAM_SLOTS.acquire(blocking=False):
+            states = current_watch_states(tags)
+            yield f"retry: {int(FAVORITES_POLL_SECONDS * 1000)}\n\n"
+            yield format_sse_event("snapshot", {"tournaments": [states[tag] for tag in tags if tag in states]})
+            return
+        q = queue.Queue()
+        try:
+            ensure_shared_watch_follower()
+            _TAG_WATCH_HUB.subscribe(q.put, tags)
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    yield q.get(timeout=FAVORITES_KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+        finally:
+            _TAG_WATCH_HUB.unsubscribe(q.put)
+            _FAVORITES_STREAM_SLOTS.release()
+
+    headers = {
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",
+        "Connection": "keep-alive",
+    }
+    return Response(stream_with_context(gen()), mimetype="text/event-stream", headers=headers)
+
+
+def run_search_stream_job(hub, force_refresh, stop_event):
+    """Crawl (or reuse the cache), fetch details and publish the result to `hub`."""
+    def progress_cb(payload):
+        hub.publish("progress", payload, job=stop_event)
+
+    try:
+        cache = get_fresh_search_cache() if not force_refresh else None
+        if cache is not None:
+            tournaments = search_cache_tournaments(cache)
+            stats_snapshot = cache.get("stats", _snapshot_search_stats())
+            fetched_at_iso = cache.get("fetchedAt") or datetime.now(timezone.utc).isoformat()
+            progress_cb({"phase": "cache", "message": "Using cached crawl"})
+        else:
+            if not has_prior_crawl():
+                ok, err = validate_api_access()
+                if not ok:
+                    hub.publish("fail", {"error": err}, job=stop_event)
+                    return
+
+            # Reuse the same in-flight coordinator as the plain endpoint,
+            # so simultaneous browser sessions never launch duplicate crawls.
+            cache = get_cached_search_results(
+                force_refresh=force_refresh,
+                progress_cb=progress_cb,
+            )
+            tournaments = search_cache_tournaments(cache)
+            stats_snapshot = cache.get("stats", _snapshot_search_stats())
+            fetched_at_iso = cache.get("fetchedAt") or datetime.now(timezone.utc).isoformat()
+
+        # Details phase (only in-progress tournaments)
+        in_progress = [t for t in tournaments if t.get('status') == 'inProgress']
+        progress_cb({"phase": "details", "completed": 0, "total": len(in_progress)})
+        fetch_tournament_details_batch(in_progress, progress_cb=progress_cb, stop_event=stop_event)
+
+        progress_cb({"phase": "serialize", "message": "Preparing results"})
+
+        payload = build_tournaments_search_payload(
+            tournaments=tournaments,
+            fetched_at_iso=fetched_at_iso,
+            stats_snapshot=stats_snapshot,
+        )
+        hub.publish("done", payload, job=stop_event)
+    except Exception as e:
+        logger.exception("SSE search failed")
+        hub.publish("fail", {"error": str(e)}, job=stop_event)
+    finally:
+        hub.finish(job=stop_event)
+
+
 @app.route('/api/tournaments/search/stream')
 @login_required
 def api_tournaments_search_stream():
     """Stream tournament search progress via Server-Sent Events (SSE).
 
+    All connected clients share one search job through `_SEARCH_STREAM_HUB`;
+    late joiners receive the latest progress event, then live updates.
+
     Event types:
       - progress: progress payload (phase, counts, etc.)
       - done: final payload (same shape as /api/tournaments/search)
       - fail: error payload
     """
     if not has_api_key():
-        payload = f"event: fail\ndata: {json.dumps({'error': 'API key not configured'})}\n\n"
+        payload = format_sse_event("fail", {"error": "API key not configured"})
         return Response(payload, mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
 
     force_refresh = request.args.get("force", "").strip() in ("1", "true", "yes")
 
     q = queue.Queue()
-    stop_event = threading.Event()
-
-    def push_event(event_type, data):
-        try:
-            msg = json.dumps(data, separators=(",", ":"))
-        except Exception:
-            msg = json.dumps({"error": "Failed to encode event payload"})
-        q.put(f"event: {event_type}\ndata: {msg}\n\n")
-
-    def progress_cb(payload):
-        push_event("progress", payload)
+    profile_job = profiling_requested('search_stream')
 
-    def worker():
-        try:
-            cache = get_fresh_search_cache() if not force_refresh else None
-            if cache is not None:
-                tournaments = cache.get("tournaments", [])
-                stats_snapshot = cache.get("stats", _snapshot_search_stats())
-                fetched_at_iso = cache.get("fetchedAt") or datetime.now(timezone.utc).isoformat()
-                progress_cb({"phase": "cache", "message": "Using cached crawl"})
-            else:
-                if not has_prior_crawl():
-                    ok, err = validate_api_access()
-                    if not ok:
-                        push_event("fail", {"error": err})
-                        return
-
-                # Reuse the same in-flight coordinator as the plain endpoint,
-                # so simultaneous browser sessions never launch duplicate crawls.
-                cache = get_cached_search_results(
-                    force_refresh=force_refresh,
-                    progress_cb=progress_cb,
-                )
-                tournaments = cache.get("tournaments", [])
-                stats_snapshot = cache.get("stats", _snapshot_search_stats())
-                fetched_at_iso = cache.get("fetchedAt") or datetime.now(timezone.utc).isoformat()
-
-            # Details phase (only in-progress tournaments)
-            in_progress = [t for t in tournaments if t.get('status') == 'inProgress']
-            progress_cb({"phase": "details", "completed": 0, "total": len(in_progress)})
-            fetch_tournament_details_batch(in_progress, progress_cb=progress_cb, stop_event=stop_event)
-
-            progress_cb({"phase": "serialize", "message": "Preparing results"})
-
-            payload = build_tournaments_search_payload(
-                tournaments=tournaments,
-                fetched_at_iso=fetched_at_iso,
-                stats_snapshot=stats_snapshot,
-            )
-            push_event("done", payload)
-        except Exception as e:
-            logger.exception("SSE search failed")
-            push_event("fail", {"error": str(e)})
-        finally:
-            q.put(None)
+    def start_job(stop_event):
+        job_args = (_SEARCH_STREAM_HUB, force_refresh, stop_event)
+        threading.Thread(
+            target=run_profiled if profile_job else run_search_stream_job,
+            args=('search_stream', run_search_stream_job) + job_args if profile_job else job_args,
+            daemon=True,
+        ).start()
 
-    threading.Thread(target=worker, daemon=True).start()
+    _SEARCH_STREAM_HUB.subscribe(q.put, start_job, force=force_refresh)
 
     def gen():
         try:
@@ -1199,7 +3908,7 @@ def api_tournaments_search_stream():
                     break
                 yield item
         finally:
-            stop_event.set()
+            _SEARCH_STREAM_HUB.unsubscribe(q.put)
 
     headers = {
         "Cache-Control": "no-cache",
@@ -1227,6 +3936,61 @@ def api_game_modes():
     return jsonify(common_modes)
 
 
+@app.route('/api/events')
+@login_required
+def api_events():
+    """Crawl/search history for one tournament from the tag-indexed event log.
+
+    Query params:
+        tag: Tournament tag (with or without '#')
+        limit: Maximum number of events to return (default 200)
+    """
+    tag = normalize_tag(request.args.get('tag', ''))
+    if not tag:
+        return jsonify({"error": "tag is required"}), 400
+    try:
+        limit = max(1, int(request.args.get('limit', 200)))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    events = event_log.lookup(tag, limit=limit)
+    return jsonify({"tag": tag, "events": events, "total": len(events)})
+
+
+LOG_READ_BLOCK_SIZE = 64 * 1024
+
+
+def iter_log_lines_reversed(path, block_size=LOG_READ_BLOCK_SIZE):
+    """Yield the lines of `path` newest first, reading fixed-size blocks from the end.
+
+    Memory stays bounded by the block size plus one line, whatever the file size.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        remainder = b''
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            chunk = f.read(read_size) + remainder
+            lines = chunk.split(b'\n')
+            # The first piece may be the tail of a line that starts in an earlier block.
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                if line:
+                    yield line.decode('utf-8', errors='replace') + '\n'
+        if remainder:
+            yield remainder.decode('utf-8', errors='replace') + '\n'
+
+
+def log_file_paths(include_rotated=False):
+    """Current log file first, then the RotatingFileHandler backups (.1 newest)."""
+    paths = [LOG_FILE]
+    if include_rotated:
+        paths.extend(f"{LOG_FILE}.{n}" for n in range(1, 4))
+    return [p for p in paths if os.path.exists(p)]
+
+
 @app.route('/api/logs')
 @login_required
 def api_logs():
@@ -1235,57 +3999,130 @@ def api_logs():
     Query params:
         lines: Number of lines to return (default 500)
         search: Search for specific text (e.g., tournament tag)
+        rotated: 1 to also read the rotated .1-.3 backups
+
+    Files are read backwards in blocks and scanning stops as soon as `lines`
+    lines (or matches) are collected, so cost no longer grows with log size.
     """
-    lines_count = int(request.args.get('lines', 500))
+    lines_count = max(0, int(request.args.get('lines', 500)))
     search_term = request.args.get('search', '').strip()
+    include_rotated = request.args.get('rotated', '').strip() in ('1', 'true', 'yes')
 
     try:
-        if not os.path.exists(LOG_FILE):
+        paths = log_file_paths(include_rotated)
+        if not paths:
             return jsonify({"logs": [], "message": "No log file yet"})
 
-        with open(LOG_FILE, 'r', encoding='utf-8') as f:
-            all_lines = f.readlines()
+        needle = search_term.lower()
+        collected = []
+        more = False
+        for path in paths:
+            for line in iter_log_lines_reversed(path):
+                if needle and needle not in line.lower():
+                    continue
+                if len(collected) == lines_count:
+                    more = True
+                    break
+                collected.append(line)
+            if more:
+                break
+        collected.reverse()
 
-        # If searching, filter lines
+        # If searching, `total_matches` counts what was found before the early exit.
         if search_term:
-            matching_lines = [line for line in all_lines if search_term.lower() in line.lower()]
             return jsonify({
-                "logs": matching_lines[-lines_count:],
-                "total_matches": len(matching_lines),
-                "search_term": search_term
+                "logs": collected,
+                "total_matches": len(collected),
+                "more": more,
+                "search_term": search_term,
+                "dropped_records": getattr(log_queue_handler, 'dropped', 0)
             })
 
-        # Return last N lines
         return jsonify({
-            "logs": all_lines[-lines_count:],
-            "total_lines": len(all_lines)
+            "logs": collected,
+            "more": more,
+            "dropped_records": getattr(log_queue_handler, 'dropped', 0)
         })
     except Exception as e:
         logger.error(f"Error reading log file: {e}")
         return jsonify({"error": str(e)}), 500
 
 
+@app.route('/api/debug/trace')
+@login_required
+def api_debug_trace():
+    """Export recent crawl/detail timelines as Chrome trace-event JSON.
+
+    Query params:
+        last: only the N most recent timelines (default: all kept)
+        download: 1 to serve as an attachment for chrome://tracing / Perfetto
+    """
+    with _CRAWL_TIMELINES_LOCK:
+        timelines = list(_CRAWL_TIMELINES)
+    if not timelines:
+        return jsonify({"error": "No crawl timelines recorded; set CRAWL_TIMELINE=1"}), 404
+    last = int(request.args.get('last', 0) or 0)
+    if last > 0:
+        timelines = timelines[-last:]
+    resp = jsonify(export_chrome_trace(timelines))
+    if request.args.get('download', '').strip() in ('1', 'true', 'yes'):
+        resp.headers['Content-Disposition'] = f'attachment; filename="crawl-trace-{timelines[-1].pid}.json"'
+    return resp
+
+
+@app.route('/api/debug/profiles')
+@login_required
+def api_debug_profiles():
+    """Recent route profiles, newest first.
+
+    Query params:
+        route: tournaments | search | search_stream
+        limit: max profiles (default 10)
+    """
+    route = request.args.get('route', '').strip()
+    limit = max(1, int(request.args.get('limit', 10)))
+    with _PROFILES_LOCK:
+        profiles = [p for p in reversed(_PROFILES) if not route or p["route"] == route]
+    return jsonify({"profiles": profiles[:limit]})
+
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus text exposition.
+
+    With METRICS_TOKEN set, scrapers authenticate with `Authorization: Bearer <token>`;
+    otherwise the endpoint is protected like every other page.
+    """
+    token = os.environ.get("METRICS_TOKEN", "")
+    if token:
+        # Bytes: compare_digest() raises TypeError on non-ASCII str.
+        if not secrets.compare_digest(request.headers.get("Authorization", "").encode('utf-8'),
+                                      f"Bearer {token}".encode('utf-8')):
+            return Response("Unauthorized\n", status=401, mimetype="text/plain")
+    elif APP_PASSWORD and not session.get('authenticated'):
+        return Response("Unauthorized\n", status=401, mimetype="text/plain")
+    return Response(render_metrics(), mimetype="text/plain; version=0.0.4")
+
+
 @app.route('/api/config', methods=['GET'])
 @login_required
 def api_get_config():
     """Get saved config"""
     config = load_config()
 
-    # Check for API key: env var takes precedence
-    env_api_key = os.environ.get('CR_API_KEY', '')
-    config_api_key = config.get('api_key', '')
-    api_key = env_api_key or config_api_key
-    api_key_from_env = bool(env_api_key)
+    # Check for API key(s): env var takes precedence
+    keys = get_api_keys()
+    api_key_from_env = bool(os.environ.get('CR_API_KEY', ''))
 
-    # Mask the API key for display (show first 10 and last 6 chars)
-    masked_key = None
-    if api_key and len(api_key) > 20:
-        masked_key = api_key[:10] + '...' + api_key[-6:]
+    # Mask every key on its own, so a key list never leaks a whole key
+    masked_key = ', '.join(mask_api_key(key) for key in keys) or None
 
     return jsonify({
-        "has_api_key": bool(api_key),
+        "has_api_key": bool(keys),
         "api_key_from_env": api_key_from_env,
         "masked_key": masked_key,
+        "key_count": len(keys),
+        "key_pool": get_api_key_pool().snapshot() if len(keys) > 1 else [],
         "shutdown_enabled": os.environ.get('FLASK_ENV') != 'production',
         "filters": config.get('filters', {})
     })
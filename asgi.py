@@ -0,0 +1,300 @@
+"""ASGI entry point: async-native search endpoints, Flask for everything else.
+
+The search and SSE endpoints run directly on the event loop, together with
+the aiohttp crawler, so an idle stream subscriber costs a coroutine instead of
+a pinned gthread worker thread. Every other route is served by the unchanged
+Flask app through asgiref's WSGI adapter, one pool thread per request.
+
+    gunicorn asgi:app --worker-class uvicorn.workers.UvicornWorker
+"""
+import asyncio
+import json
+import os
+from datetime import datetime, timezone
+from http.cookies import SimpleCookie
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi, WsgiToAsgiInstance
+
+import app as finder
+
+# Idle SSE connections only need a comment often enough to keep proxies from
+# closing them; unlike the threaded server there is no worker to hand back.
+SSE_KEEPALIVE_SECONDS = float(os.environ.get("ASGI_SSE_KEEPALIVE_SECONDS", 15))
+
+
+class _PooledWsgiToAsgiInstance(WsgiToAsgiInstance):
+    # asgiref runs WSGI calls thread_sensitive, i.e. all on one shared thread,
+    # so a crawl behind /api/tournaments would stall login and static files.
+    run_wsgi_app = sync_to_async(WsgiToAsgiInstance.__dict__["run_wsgi_app"].func, thread_sensitive=False)
+
+
+class PooledWsgiToAsgi(WsgiToAsgi):
+    """WsgiToAsgi that serves each request on the loop's default thread pool."""
+
+    async def __call__(self, scope, receive, send):
+        await _PooledWsgiToAsgiInstance(self.wsgi_application, self.duplicate_header_limit)(scope, receive, send)
+
+
+_flask_asgi = PooledWsgiToAsgi(finder.app)
+_background_tasks = set()
+
+
+def _header(scope, wanted):
+    for name, value in scope.get("headers", []):
+        if name == wanted:
+            return value.decode("latin-1")
+    return ""
+
+
+def _is_authenticated(scope):
+    """Mirror login_required by reading Flask's signed session cookie."""
+    if not finder.APP_PASSWORD:
+        return True
+    cookie_header = _header(scope, b"cookie")
+    cookies = SimpleCookie()
+    try:
+        cookies.load(cookie_header)
+    except Exception:
+        return False
+    morsel = cookies.get(finder.app.config["SESSION_COOKIE_NAME"])
+    if morsel is None:
+        return False
+    serializer = finder.app.session_interface.get_signing_serializer(finder.app)
+    if serializer is None:
+        return False
+    try:
+        data = serializer.loads(
+            morsel.value,
+            max_age=int(finder.app.permanent_session_lifetime.total_seconds()),
+        )
+    except Exception:
+        return False
+    return bool(data.get("authenticated"))
+
+
+def _query_value(scope, name):
+    values = parse_qs(scope.get("query_string", b"").decode("latin-1")).get(name)
+    return values[0] if values else ""
+
+
+def _query_flag(scope, name):
+    return _query_value(scope, name).strip() in ("1", "true", "yes")
+
+
+async def _send_json(send, payload, status=200, scope=None):
+    """Send `payload`; with `scope`, tag it with an ETag and honour If-None-Match."""
+    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    headers = [(b"content-type", b"application/json")]
+    if scope is not None:
+        etag = finder.payload_etag(body)
+        headers = [(b"etag", etag.encode("ascii")), (b"cache-control", b"private, no-cache")]
+        if finder.etag_matches(_header(scope, b"if-none-match"), etag):
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        headers.append((b"content-type", b"application/json"))
+    headers.append((b"content-length", str(len(body)).encode("ascii")))
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+async def run_search_stream_job_async(hub, force_refresh, stop_event):
+    """Event-loop twin of app.run_search_stream_job()."""
+    def progress_cb(payload):
+        hub.publish("progress", payload, job=stop_event)
+
+    try:
+        cache = finder.get_fresh_search_cache() if not force_refresh else None
+        if cache is not None:
+            progress_cb({"phase": "cache", "message": "Using cached crawl"})
+        else:
+            if not finder.has_prior_crawl():
+                ok, err = await finder.validate_api_access_async()
+                if not ok:
+                    hub.publish("fail", {"error": err}, job=stop_event)
+                    return
+            cache = await finder.get_cached_search_results_async(
+                force_refresh=force_refresh,
+                progress_cb=progress_cb,
+            )
+        tournaments = await finder.search_cache_tournaments_async(cache)
+        stats_snapshot = cache.get("stats", finder._snapshot_search_stats())
+        fetched_at_iso = cache.get("fetchedAt") or datetime.now(timezone.utc).isoformat()
+
+        in_progress = [t for t in tournaments if t.get('status') == 'inProgress']
+        progress_cb({"phase": "details", "completed": 0, "total": len(in_progress)})
+        await finder.fetch_tournament_details_batch_async(
+            in_progress, progress_cb=progress_cb, stop_event=stop_event
+        )
+
+        progress_cb({"phase": "serialize", "message": "Preparing results"})
+        payload = finder.build_tournaments_search_payload(
+            tournaments=tournaments,
+            fetched_at_iso=fetched_at_iso,
+            stats_snapshot=stats_snapshot,
+        )
+        hub.publish("done", payload, job=stop_event)
+    except Exception as e:
+        finder.logger.exception("SSE search failed")
+        hub.publish("fail", {"error": str(e)}, job=stop_event)
+    finally:
+        hub.finish(job=stop_event)
+
+
+async def search_stream(scope, receive, send):
+    """Async equivalent of /api/tournaments/search/stream."""
+    headers = [
+        (b"content-type", b"text/event-stream"),
+        (b"cache-control", b"no-cache"),
+        (b"x-accel-buffering", b"no"),
+    ]
+    if not finder.has_api_key():
+        body = finder.format_sse_event("fail", {"error": "API key not configured"})
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body.encode("utf-8")})
+        return
+
+    force_refresh = _query_flag(scope, "force")
+    loop = asyncio.get_running_loop()
+    events = asyncio.Queue()
+    hub = finder._SEARCH_STREAM_HUB
+
+    def sink(message):
+        # publish() may run on a crawler thread started by the Flask side.
+        loop.call_soon_threadsafe(events.put_nowait, message)
+
+    def start_job(stop_event):
+        task = loop.create_task(run_search_stream_job_async(hub, force_refresh, stop_event))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    async def watch_disconnect():
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                events.put_nowait(None)
+                return
+
+    await send({"type": "http.response.start", "status": 200, "headers": headers})
+    await send({"type": "http.response.body", "body": b"retry: 1500\n\n", "more_body": True})
+
+    hub.subscribe(sink, start_job, force=force_refresh)
+    watcher = asyncio.create_task(watch_disconnect())
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(events.get(), timeout=SSE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                item = ": keepalive\n\n"
+            if item is None:
+                break
+            await send({"type": "http.response.body", "body": item.encode("utf-8"), "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        watcher.cancel()
+        hub.unsubscribe(sink)
+
+
+async def favorites_stream(scope, receive, send):
+    """Async equivalent of /api/favorites/stream."""
+    tags = finder.parse_watch_tags(_query_value(scope, "tags"))
+    if not tags:
+        await _send_json(send, {"error": "tags is required"}, status=400)
+        return
+
+    loop = asyncio.get_running_loop()
+    events = asyncio.Queue()
+
+    def sink(message):
+        # Crawls and detail fetches publish from their own threads.
+        loop.call_soon_threadsafe(events.put_nowait, message)
+
+    async def watch_disconnect():
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                events.put_nowait(None)
+                return
+
+    await send({"type": "http.response.start", "status": 200, "headers": [
+        (b"content-type", b"text/event-stream"),
+        (b"cache-control", b"no-cache"),
+        (b"x-accel-buffering", b"no"),
+    ]})
+    await send({"type": "http.response.body", "body": b"retry: 5000\n\n", "more_body": True})
+
+    if finder._CACHE_BACKEND.remote:
+        await asyncio.to_thread(finder.sync_shared_watch_states, tags)
+    else:
+        finder.sync_shared_watch_states(tags)
+    finder.ensure_shared_watch_follower()
+    watcher = asyncio.create_task(watch_disconnect())
+    try:
+        finder._TAG_WATCH_HUB.subscribe(sink, tags)
+        while True:
+            try:
+                item = await asyncio.wait_for(events.get(), timeout=SSE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                item = ": keepalive\n\n"
+            if item is None:
+                break
+            await send({"type": "http.response.body", "body": item.encode("utf-8"), "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        watcher.cancel()
+        finder._TAG_WATCH_HUB.unsubscribe(sink)
+
+
+async def search(scope, receive, send):
+    """Async equivalent of /api/tournaments/search."""
+    if not finder.has_api_key():
+        await _send_json(send, {"error": "API key not configured"}, status=400)
+        return
+    force_refresh = _query_flag(scope, "force")
+    cache = None if force_refresh else finder.get_fresh_search_cache()
+    if cache is None and not finder.has_prior_crawl():
+        ok, err = await finder.validate_api_access_async()
+        if not ok:
+            await _send_json(send, {"error": err}, status=400)
+            return
+
+    finder.logger.info("=== FETCH ALL TOURNAMENTS (asgi) ===")
+    if cache is None:
+        cache = await finder.get_cached_search_results_async(force_refresh=force_refresh)
+    tournaments = await finder.search_cache_tournaments_async(cache)
+    await finder.fetch_tournament_details_for_in_progress_async(tournaments)
+
+    await _send_json(send, finder.build_tournaments_search_payload(
+        tournaments=tournaments,
+        fetched_at_iso=cache.get("fetchedAt") or datetime.now(timezone.utc).isoformat(),
+        stats_snapshot=cache.get("stats", finder._snapshot_search_stats()),
+    ), scope=scope)
+
+
+ASYNC_ROUTES = {
+    "/api/tournaments/search": search,
+    "/api/tournaments/search/stream": search_stream,
+    "/api/favorites/stream": favorites_stream,
+}
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    handler = ASYNC_ROUTES.get(scope.get("path")) if scope["type"] == "http" else None
+    if handler is None or scope.get("method") != "GET":
+        await _flask_asgi(scope, receive, send)
+        return
+    if not _is_authenticated(scope):
+        await _send_json(send, {"error": "Unauthorized"}, status=401)
+        return
+    await handler(scope, receive, send)
@@ -0,0 +1,14 @@
+"""Initializer for the app's spawned process pools (crawl shards, JSON decoding).
+
+It must not import app: it runs in each new worker before the first task
+unpickles (and so imports) app, which then reads IN_POOL_WORKER to skip the
+log file, the tournament store and the shared cache backend that belong to
+the serving process.
+"""
+
+IN_POOL_WORKER = False
+
+
+def mark_pool_worker():
+    global IN_POOL_WORKER
+    IN_POOL_WORKER = True
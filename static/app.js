@@ -10,14 +10,25 @@ if ('serviceWorker' in navigator) {
 // ==========================================================
 const state = {
   tournaments: [],       // raw list from /api/tournaments/search
-  enriched: [],          // computed countdowns, etc. refreshed each tick
+  visible: [],           // enriched rows currently materialized (from the results worker)
+  visibleByTag: new Map(),
+  visibleOffset: 0,      // index of state.visible[0] in the full sorted result list
+  matchedCount: 0,
+  viewCounts: {},        // saved view → non-ended tournament count
+  tournamentsByTag: new Map(),
+  phaseSchedule: null,   // CrTiming.createPhaseSchedule over state.tournaments
+  mountedRows: new Map(), // tag → { item, cell, countdown, label } for rendered rows
   fetchedAt: null,
+  fromSnapshot: false,   // showing the IndexedDB copy until the network answers
+  swEtag: null,          // ETag of the service worker copy on screen
+  currentSwEtag: null,   // ETag the worker last confirmed as still current
   gameModes: {},         // {id: name}
   hasApiKey: false,
   apiKeyFromEnv: false,
   shutdownEnabled: true,
   isSearching: false,
   activeStream: null,
+  favoritesStream: null, // EventSource on /api/favorites/stream
   heartbeatInterval: null,
   lastStats: null,
 
@@ -58,6 +69,106 @@ function persistFavorites() {
   try { localStorage.setItem('cr.favorites', JSON.stringify([...state.favorites])); } catch {}
 }
 
+// ==========================================================
+// Startup snapshot — last search payload in IndexedDB
+// ==========================================================
+const SNAPSHOT_DB = 'cr-finder';
+const SNAPSHOT_STORE = 'snapshots';
+const SNAPSHOT_KEY = 'last-search';
+const SNAPSHOT_MAX_AGE_MS = 6 * 60 * 60 * 1000; // older data is all ended anyway
+
+function openSnapshotDb() {
+  return new Promise(resolve => {
+    if (!('indexedDB' in window)) { resolve(null); return; }
+    try {
+      const req = indexedDB.open(SNAPSHOT_DB, 1);
+      req.onupgradeneeded = () => req.result.createObjectStore(SNAPSHOT_STORE);
+      req.onsuccess = () => resolve(req.result);
+      req.onerror = () => resolve(null);
+      req.onblocked = () => resolve(null);
+    } catch { resolve(null); }
+  });
+}
+
+async function snapshotRequest(mode, run) {
+  const db = await openSnapshotDb();
+  if (!db) return null;
+  return new Promise(resolve => {
+    try {
+      const tx = db.transaction(SNAPSHOT_STORE, mode);
+      const req = run(tx.objectStore(SNAPSHOT_STORE));
+      tx.oncomplete = () => { db.close(); resolve(req.result ?? null); };
+      tx.onerror = tx.onabort = () => { db.close(); resolve(null); };
+    } catch { db.close(); resolve(null); }
+  });
+}
+
+// fetchedAt of the crawl stored (or read back) last; auto-refreshes mostly
+// return the same crawl, which is not worth rewriting.
+let storedSnapshotAt = null;
+
+function saveSnapshot(data) {
+  if (data.fetchedAt && data.fetchedAt === storedSnapshotAt) return Promise.resolve(null);
+  const snapshot = {
+    tournaments: data.tournaments || [],
+    fetchedAt: data.fetchedAt || new Date().toISOString(),
+    stats: data.stats || null,
+  };
+  storedSnapshotAt = snapshot.fetchedAt;
+  return snapshotRequest('readwrite', store => store.put(snapshot, SNAPSHOT_KEY));
+}
+
+async function loadSnapshot() {
+  const snapshot = await snapshotRequest('readonly', store => store.get(SNAPSHOT_KEY));
+  if (!snapshot || !Array.isArray(snapshot.tournaments)) return null;
+  storedSnapshotAt = snapshot.fetchedAt;
+  const ageMs = Date.now() - new Date(snapshot.fetchedAt).getTime();
+  return ageMs >= 0 && ageMs < SNAPSHOT_MAX_AGE_MS ? snapshot : null;
+}
+
+// ==========================================================
+// Cached search through the service worker (stale-while-revalidate)
+// ==========================================================
+const SEARCH_URL = '/api/tournaments/search';
+
+// Only worth it when the worker already holds a copy; otherwise the SSE
+// search with its progress bar is the better first load.
+async function searchFromServiceWorkerCache() {
+  if (!navigator.serviceWorker?.controller || !('caches' in window)) return false;
+  try {
+    if (!(await caches.match(SEARCH_URL))) return false;
+    const r = await fetch(SEARCH_URL);
+    if (!r.ok) return false;
+    const data = await r.json();
+    // A 'search-updated' message may already have painted newer data.
+    if (state.fetchedAt && !state.fromSnapshot && data.fetchedAt < state.fetchedAt) return true;
+    // Its 'search-current' message may also arrive before this point.
+    state.swEtag = r.headers.get('ETag');
+    const stale = r.headers.get('X-SW-Cache') === 'hit' && !(state.swEtag && state.swEtag === state.currentSwEtag);
+    return applySearchResponse(data, { fromSnapshot: stale });
+  } catch { return false; }
+}
+
+function listenForServiceWorkerUpdates() {
+  if (!('serviceWorker' in navigator)) return;
+  navigator.serviceWorker.addEventListener('message', async event => {
+    const msg = event.data || {};
+    if (msg.type === 'search-updated') {
+      // The worker stored newer data; read it straight from its cache.
+      try {
+        const cached = await caches.match(msg.url);
+        if (cached && !state.isSearching) applySearchResponse(await cached.json());
+      } catch {}
+    } else if (msg.type === 'search-current') {
+      state.currentSwEtag = msg.etag || null;
+      if (state.fromSnapshot && msg.etag && msg.etag === state.swEtag) {
+        state.fromSnapshot = false;
+        renderFreshness();
+      }
+    }
+  });
+}
+
 // ==========================================================
 // Time helpers
 // ==========================================================
@@ -111,7 +222,10 @@ function renderFreshness() {
   let statusText = 'No data loaded';
   if (state.isSearching) {
     visualState = 'searching';
-    statusText = 'Refreshing tournament data';
+    statusText = state.fromSnapshot ? 'Showing saved results while refreshing' : 'Refreshing tournament data';
+  } else if (state.fromSnapshot) {
+    visualState = 'stale';
+    statusText = 'Showing saved results from your last visit';
   } else if (confidence === 'low') {
     visualState = 'error';
     statusText = 'Low search coverage';
@@ -204,6 +318,7 @@ function grabRefs() {
     detailJoin: id('detail-join'),
     detailFavBtn: id('detail-fav-btn'),
     detailCopyBtn: id('detail-copy-btn'),
+    detailRefreshBtn: id('detail-refresh-btn'),
 
     toast: id('toast'),
 
@@ -221,6 +336,8 @@ function grabRefs() {
     tagSearchResult: id('tag-search-result'),
     refreshLogsBtn: id('refresh-logs-btn'),
     logOutput: id('log-output'),
+    refreshProfilesBtn: id('refresh-profiles-btn'),
+    profileOutput: id('profile-output'),
     shutdownBtn: id('shutdown-btn'),
     modeBreakdown: id('mode-breakdown'),
     modeList: id('mode-list'),
@@ -237,13 +354,7 @@ const SAVED_VIEWS = [
 ];
 
 function renderSavedViews() {
-  const pool = (state.enriched && state.enriched.length ? state.enriched : state.tournaments)
-    .filter(t => (t.effectiveStatus || t.status) !== 'ended');
-  const counts = {
-    all: pool.length,
-    favorites: pool.filter(t => state.favorites.has(t.tag)).length,
-    'high-lvl': pool.filter(t => (t.levelCap || 0) >= 15).length,
-  };
+  const counts = state.viewCounts;
   $.savedViews.innerHTML = '';
   SAVED_VIEWS.forEach(v => {
     const btn = document.createElement('button');
@@ -361,121 +472,173 @@ function resetAllFilters() {
 }
 
 // ==========================================================
-// Rendering — rows / main list
+// Results — enrich/filter/sort run in results-worker.js
 // ==========================================================
-function matchesFilters(t) {
-  // Ended tournaments can't be joined — never show them.
-  if (t.effectiveStatus === 'ended') return false;
-
-  // Saved view
-  if (state.savedView === 'favorites' && !state.favorites.has(t.tag)) return false;
-  if (state.savedView === 'high-lvl' && (t.levelCap || 0) < 15) return false;
-
-  // Sidebar filters
-  if (state.filters.modes.size && !state.filters.modes.has(String(t.gameModeId))) return false;
-  if (state.filters.levelCaps.size && !state.filters.levelCaps.has(Number(t.levelCap))) return false;
-  if (state.filters.minPlayers > 0 && (t.players || 0) < state.filters.minPlayers) return false;
-  const mins = Number.isFinite(t.remainingSec) ? t.remainingSec / 60 : null;
-  if (state.filters.minMinsLeft > 0 && (mins === null || mins < state.filters.minMinsLeft)) return false;
-  if (state.filters.maxMinsLeft !== null && (mins === null || mins > state.filters.maxMinsLeft)) return false;
-  if (state.filters.access === 'open' && t.type === 'passwordProtected') return false;
-  if (state.filters.access === 'password' && t.type !== 'passwordProtected') return false;
-
-  // Quick
-  if (state.quick === 'live' && t.effectiveStatus !== 'inProgress') return false;
-  if (state.quick === 'prep' && t.effectiveStatus !== 'inPreparation') return false;
-
-  // Search
-  const q = state.search.trim().toLowerCase();
-  if (q) {
-    const hay = `${t.name || ''} ${t.tag || ''} ${t.gameModeName || ''}`.toLowerCase();
-    if (!hay.includes(q)) return false;
+const results = { worker: null, model: null, seq: 0 };
+
+function startResultsWorker() {
+  if (!('Worker' in window)) return;
+  try {
+    const worker = new Worker('/static/results-worker.js');
+    worker.onmessage = e => {
+      // Drop answers to queries that a newer one has superseded.
+      if (e.data.seq === results.seq) renderResults(e.data);
+    };
+    worker.onerror = () => {
+      // Fall back to the same model on the main thread.
+      worker.terminate();
+      results.worker = null;
+      renderRows();
+    };
+    results.worker = worker;
+  } catch { results.worker = null; }
+}
+
+function localResultsModel() {
+  if (!results.model) {
+    results.model = CrResults.createModel();
+    results.model.setData(state.tournaments);
   }
-  return true;
+  return results.model;
 }
 
-function enrich() {
-  state.enriched = state.tournaments.map(t => {
-    const timing = CrTiming.deriveTiming(t);
-    return {
-      ...t,
-      timing,
-      countdownType: timing.countdownType,
-      remainingSec: timing.remainingSec,
-      totalSec: timing.totalSec,
-      effectiveStatus: timing.effectiveStatus,
-    };
+function syncResultsData() {
+  if (results.worker) results.worker.postMessage({ type: 'data', tournaments: state.tournaments });
+  else localResultsModel().setData(state.tournaments);
+}
+
+function patchResultsData(tournaments) {
+  if (results.worker) results.worker.postMessage({ type: 'patch', tournaments });
+  else localResultsModel().patch(tournaments);
+}
+
+function resultsQuery() {
+  const { offset, limit } = rowWindow();
+  return {
+    savedView: state.savedView,
+    favorites: state.favorites,
+    filters: state.filters,
+    quick: state.quick,
+    search: state.search,
+    sort: state.sort,
+    offset,
+    limit,
+    selectedTag: state.selectedTag,
+  };
+}
+
+// Rebuilt once per data load; alerts on favorites that went live since the
+// previous load.
+function rebuildPhaseSchedule() {
+  const previous = state.phaseSchedule;
+  const schedule = CrTiming.createPhaseSchedule(state.tournaments);
+  state.phaseSchedule = schedule;
+  state.tournamentsByTag = new Map(state.tournaments.map(t => [t.tag, t]));
+  if (!previous) return;
+  state.tournaments.forEach(t => {
+    const before = previous.status(t.tag);
+    if (before && before !== 'inProgress' && schedule.status(t.tag) === 'inProgress' && state.favorites.has(t.tag)) {
+      notifyFavoriteLive(t);
+    }
   });
-  state.enrichedByTag = new Map(state.enriched.map(t => [t.tag, t]));
 }
 
-function phaseRank(t) {
-  if (t.timing?.phase === 'prep') return 0;
-  if (t.timing?.phase === 'live') return 1;
-  return 2;
+function selectedTournament() {
+  return state.tournamentsByTag.get(state.selectedTag) || null;
 }
 
-function finiteRemaining(t) {
-  return Number.isFinite(t.remainingSec) ? t.remainingSec : Number.POSITIVE_INFINITY;
+// ==========================================================
+// Virtual list — only the rows in view plus ROW_BUFFER either side exist
+// ==========================================================
+const ROW_BUFFER = 20;
+const list = { rowPitch: 56, scrollFrame: 0 };
+
+function ensureListFrame() {
+  if ($.rowsWindow) return;
+  $.rows.innerHTML = '<div class="db-rows-spacer"><div class="db-rows-window"></div></div>';
+  $.rowsSpacer = $.rows.firstElementChild;
+  $.rowsWindow = $.rowsSpacer.firstElementChild;
 }
 
-function compareRemaining(a, b) {
-  const left = finiteRemaining(a);
-  const right = finiteRemaining(b);
-  return left === right ? 0 : left - right;
+function viewportRange() {
+  const first = Math.floor($.rows.scrollTop / list.rowPitch);
+  return { first, last: first + Math.ceil($.rows.clientHeight / list.rowPitch) + 1 };
 }
 
-function currentFiltered() {
-  const items = state.enriched.filter(matchesFilters);
-  const dir = state.sort.dir === 'asc' ? 1 : -1;
-  items.sort((a, b) => {
-    switch (state.sort.by) {
-      case 'name':    return (a.name || '').localeCompare(b.name || '') * dir;
-      case 'mode':    return (a.gameModeName || '').localeCompare(b.gameModeName || '') * dir;
-      case 'players': return ((a.players || 0) - (b.players || 0)) * dir;
-      case 'level':   return ((a.levelCap || 0) - (b.levelCap || 0)) * dir;
-      case 'timing': {
-        const phaseDiff = phaseRank(a) - phaseRank(b);
-        if (phaseDiff !== 0) return phaseDiff;
-        const aKnown = Number.isFinite(a.remainingSec);
-        const bKnown = Number.isFinite(b.remainingSec);
-        if (aKnown !== bKnown) return aKnown ? -1 : 1;
-        return compareRemaining(a, b) * dir;
-      }
-      case 'recommended':
-      default: {
-        const phaseDiff = phaseRank(a) - phaseRank(b);
-        if (phaseDiff !== 0) return phaseDiff;
-        if (a.timing?.phase === 'live') {
-          const aKnown = Number.isFinite(a.remainingSec);
-          const bKnown = Number.isFinite(b.remainingSec);
-          if (aKnown !== bKnown) return aKnown ? -1 : 1;
-          const remainingDiff = compareRemaining(b, a);
-          if (remainingDiff !== 0) return remainingDiff;
-        } else {
-          const remainingDiff = compareRemaining(a, b);
-          if (remainingDiff !== 0) return remainingDiff;
-        }
-        return (b.players || 0) - (a.players || 0);
-      }
-    }
+function rowWindow() {
+  const { first, last } = viewportRange();
+  const offset = Math.max(0, first - ROW_BUFFER);
+  return { offset, limit: last + ROW_BUFFER - offset };
+}
+
+// Row pitch includes margins (cards on mobile), so measure between rows.
+function measureRowPitch() {
+  const rows = $.rowsWindow.children;
+  if (!rows.length) return list.rowPitch;
+  if (rows.length > 1) return rows[1].offsetTop - rows[0].offsetTop;
+  return rows[0].offsetHeight + (parseFloat(getComputedStyle(rows[0]).marginBottom) || 0);
+}
+
+function onRowsScroll() {
+  if (list.scrollFrame) return;
+  list.scrollFrame = requestAnimationFrame(() => {
+    list.scrollFrame = 0;
+    const { first, last } = viewportRange();
+    const loadedEnd = state.visibleOffset + state.visible.length;
+    const margin = ROW_BUFFER / 2;
+    const needAbove = state.visibleOffset > 0 && first - state.visibleOffset < margin;
+    const needBelow = loadedEnd < state.matchedCount && loadedEnd - last < margin;
+    if (needAbove || needBelow) renderRows();
   });
-  return items;
 }
 
+function selectTournament(tag) {
+  state.selectedTag = tag;
+  if (state.detailOverlay) openDetail();
+  highlightSelectedRow();
+  renderDetail();
+}
+
+// One delegated listener serves every row the virtual list ever renders.
+function onRowsClick(e) {
+  const row = e.target.closest('.db-row');
+  if (!row) return;
+  const star = e.target.closest('[data-fav]');
+  if (star) { toggleFavorite(star.dataset.fav); return; }
+  if (e.target.closest('[data-join]')) return; // allow default link
+  selectTournament(row.dataset.tag);
+}
+
+// ==========================================================
+// Rendering — rows / main list
+// ==========================================================
 function renderRows() {
-  enrich();
-  const items = currentFiltered();
+  results.seq += 1;
+  const query = resultsQuery();
+  if (results.worker) {
+    results.worker.postMessage({ type: 'query', seq: results.seq, query });
+  } else {
+    renderResults({ seq: results.seq, ...localResultsModel().query(query) });
+  }
+}
+
+function renderResults(view) {
+  const items = view.items;
+  state.visible = items;
+  state.visibleByTag = new Map(items.map(t => [t.tag, t]));
+  state.visibleOffset = view.offset;
+  state.matchedCount = view.matched;
+  state.viewCounts = view.counts;
 
   // Update counts and saved views (counts depend on tournaments, not filters)
   renderSavedViews();
   renderActiveFilters();
 
   // Results meta
-  const total = state.enriched.filter(t => t.effectiveStatus !== 'ended').length;
-  $.resultsCountText.textContent = items.length === total
-    ? `${items.length} results`
-    : `${items.length}/${total} results`;
+  const total = view.total;
+  $.resultsCountText.textContent = view.matched === total
+    ? `${view.matched} results`
+    : `${view.matched}/${total} results`;
 
   // Quick pill actives
   $.quickLive.classList.toggle('active', state.quick === 'live');
@@ -493,8 +656,11 @@ function renderRows() {
   });
 
   // Empty state
-  if (items.length === 0) {
-    $.rows.innerHTML = '';
+  ensureListFrame();
+  if (view.matched === 0) {
+    $.rowsWindow.innerHTML = '';
+    state.mountedRows = new Map();
+    $.rowsSpacer.style.height = '0px';
     $.empty.classList.remove('hidden');
     if (total === 0 && !state.isSearching && state.hasApiKey) {
       $.emptyTitle.textContent = 'No tournaments loaded yet';
@@ -508,15 +674,21 @@ function renderRows() {
     }
   } else {
     $.empty.classList.add('hidden');
-    // Build rows. Using innerHTML for speed; add listeners after.
-    const html = items.map(t => rowHtml(t)).join('');
-    $.rows.innerHTML = html;
-    attachRowListeners();
+    // Only the window's rows are built; the spacer keeps the scrollbar honest.
+    $.rowsWindow.innerHTML = items.map(t => rowHtml(t)).join('');
+    mountRows();
+    const pitch = measureRowPitch();
+    const remeasured = Math.abs(pitch - list.rowPitch) > 0.5;
+    list.rowPitch = pitch;
+    $.rowsSpacer.style.height = `${view.matched * pitch}px`;
+    $.rowsWindow.style.transform = `translateY(${view.offset * pitch}px)`;
+    // A new layout (first render, breakpoint change) shifts the window; refetch it.
+    if (remeasured) requestAnimationFrame(renderRows);
   }
 
   // Auto-select first row when nothing selected or selection filtered out
-  if (!state.selectedTag || !items.some(t => t.tag === state.selectedTag)) {
-    state.selectedTag = items[0]?.tag || null;
+  if (!state.selectedTag || view.selectedIndex === -1) {
+    state.selectedTag = view.firstTag;
   }
   renderDetail();
   highlightSelectedRow();
@@ -563,25 +735,6 @@ function rowHtml(t) {
   `;
 }
 
-function attachRowListeners() {
-  $.rows.querySelectorAll('.db-row').forEach(row => {
-    const tag = row.dataset.tag;
-    const openRow = () => {
-      state.selectedTag = tag;
-      if (state.detailOverlay) openDetail();
-      highlightSelectedRow();
-      renderDetail();
-    };
-    row.addEventListener('click', e => {
-      const star = e.target.closest('[data-fav]');
-      if (star) { toggleFavorite(star.dataset.fav); e.stopPropagation(); return; }
-      const join = e.target.closest('[data-join]');
-      if (join) { e.stopPropagation(); return; } // allow default link
-      openRow();
-    });
-  });
-}
-
 function highlightSelectedRow() {
   $.rows.querySelectorAll('.db-row').forEach(row => {
     row.classList.toggle('selected', row.dataset.tag === state.selectedTag);
@@ -589,54 +742,57 @@ function highlightSelectedRow() {
 }
 
 // ==========================================================
-// Ticking — update countdown numbers every second
+// Ticking — phase changes come from the schedule heap; only mounted
+// countdowns are touched
 // ==========================================================
+function mountRows() {
+  const mounted = new Map();
+  for (const row of $.rowsWindow.children) {
+    const item = state.visibleByTag.get(row.dataset.tag);
+    const cell = row.querySelector('[data-timing]');
+    if (!item || !cell) continue;
+    mounted.set(item.tag, {
+      item,
+      cell,
+      countdown: cell.querySelector('[data-cd]'),
+      label: cell.querySelector('.db-row-timing-label'),
+    });
+  }
+  state.mountedRows = mounted;
+}
+
 function tickCountdowns() {
-  let statusChanged = false;
-  state.tournaments.forEach(t => {
-    const timing = CrTiming.deriveTiming(t);
-    const newStatus = timing.effectiveStatus;
-    // Update the enriched copy so filter/sort reflects live values
-    const enrichedItem = state.enrichedByTag ? state.enrichedByTag.get(t.tag) : null;
-    if (enrichedItem) {
-      enrichedItem.timing = timing;
-      enrichedItem.remainingSec = timing.remainingSec;
-      enrichedItem.countdownType = timing.countdownType;
-      enrichedItem.totalSec = timing.totalSec;
-      if (enrichedItem.effectiveStatus !== newStatus) {
-        if (newStatus === 'inProgress' && state.favorites.has(t.tag)) notifyFavoriteLive(t);
-        enrichedItem.effectiveStatus = newStatus;
-        statusChanged = true;
-      }
-    }
-    // Update the complete timing cell so phase and value never diverge.
-    const cell = $.rows.querySelector(`[data-timing="${cssEscape(t.tag)}"]`);
-    if (cell) {
-      cell.className = `db-row-timing ${timingTone(timing)}`;
-      const countdown = cell.querySelector('[data-cd]');
-      const label = cell.querySelector('.db-row-timing-label');
-      if (countdown) countdown.textContent = fmtCd(timing.remainingSec);
-      if (label) label.textContent = timing.timingLabel;
-    }
+  const now = Date.now();
+  const changes = state.phaseSchedule ? state.phaseSchedule.due(now) : [];
+  changes.forEach(({ tournament, status }) => {
+    if (status === 'inProgress' && state.favorites.has(tournament.tag)) notifyFavoriteLive(tournament);
   });
 
   // A tournament went live or ended: re-filter, re-sort, fix badges.
-  if (statusChanged) renderRows();
+  if (changes.length) {
+    renderRows();
+  } else {
+    state.mountedRows.forEach(({ item, cell, countdown, label }) => {
+      const timing = CrTiming.deriveTiming(item, now);
+      item.timing = timing;
+      item.remainingSec = timing.remainingSec;
+      item.countdownType = timing.countdownType;
+      item.totalSec = timing.totalSec;
+      const tone = `db-row-timing ${timingTone(timing)}`;
+      if (cell.className !== tone) cell.className = tone;
+      const text = fmtCd(timing.remainingSec);
+      if (countdown && countdown.textContent !== text) countdown.textContent = text;
+      if (label && label.textContent !== timing.timingLabel) label.textContent = timing.timingLabel;
+    });
+  }
 
   // Update detail countdown
-  if (state.selectedTag) {
-    const t = state.tournaments.find(x => x.tag === state.selectedTag);
-    if (t) updateDetailCountdown(t);
-  }
+  const selected = selectedTournament();
+  if (selected) updateDetailCountdown(selected);
 
   renderFreshness();
 }
 
-// Simple CSS.escape polyfill fallback
-function cssEscape(s) {
-  return (window.CSS && CSS.escape) ? CSS.escape(s) : String(s).replace(/["\\]/g, '\\$&');
-}
-
 // ==========================================================
 // Rendering — detail
 // ==========================================================
@@ -661,7 +817,7 @@ function renderDetail() {
     $.detailFavBtn.textContent = '☆ Favorite';
     return;
   }
-  const t = state.tournaments.find(x => x.tag === state.selectedTag);
+  const t = selectedTournament();
   if (!t) return;
   const cleanTag = String(t.tag).replace('#', '');
   const fav = state.favorites.has(t.tag);
@@ -684,7 +840,7 @@ function renderDetail() {
   $.detailAccessSub.textContent = isPwd ? 'Password in-game' : 'Anyone can join';
 
   // Timing
-  const timing = state.enrichedByTag?.get(t.tag)?.timing || CrTiming.deriveTiming(t);
+  const timing = state.visibleByTag.get(t.tag)?.timing || CrTiming.deriveTiming(t);
   const duration = t.duration || 0;
   const durMin = Math.round(duration / 60);
   if (timing.phase === 'prep' && timing.startsAtMs !== null) {
@@ -757,6 +913,61 @@ function toggleFavorite(tag) {
   }
   persistFavorites();
   renderRows();
+  rewatchFavorites();
+}
+
+// ==========================================================
+// Favorites — server pushes per-tag changes (/api/favorites/stream)
+// ==========================================================
+const WATCHED_FIELDS = ['name', 'status', 'players', 'maxPlayers', 'startedTime', 'endedTime'];
+
+function watchFavorites() {
+  if (state.favoritesStream) { state.favoritesStream.close(); state.favoritesStream = null; }
+  if (!('EventSource' in window) || !state.hasApiKey || !state.favorites.size) return;
+  const tags = [...state.favorites].join(',');
+  const es = new EventSource(`/api/favorites/stream?tags=${encodeURIComponent(tags)}`);
+  const onEvent = ev => {
+    try { applyTournamentUpdates(JSON.parse(ev.data).tournaments || []); } catch {}
+  };
+  es.addEventListener('snapshot', onEvent);
+  es.addEventListener('update', onEvent);
+  state.favoritesStream = es;
+}
+
+const rewatchFavorites = debounce(watchFavorites, 500);
+
+function applyTournamentUpdates(updates) {
+  const patched = [];
+  updates.forEach(update => {
+    const t = state.tournamentsByTag.get(update.tag);
+    if (!t) return;
+    const changed = WATCHED_FIELDS.filter(field => update[field] != null && update[field] !== t[field]);
+    if (!changed.length) return;
+    changed.forEach(field => { t[field] = update[field]; });
+    patched.push(t);
+  });
+  if (!patched.length) return;
+  patchResultsData(patched);
+  rebuildPhaseSchedule(); // raises the live alert for favorites that just started
+  renderRows();
+}
+
+// ==========================================================
+// Targeted refresh — re-fetch a few tags without a crawl
+// ==========================================================
+async function refreshTournaments(tags) {
+  if (!tags.length) return;
+  try {
+    const r = await fetch('/api/tournaments/refresh', {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ tags }),
+    });
+    if (!r.ok) { showToast('Refresh failed'); return; }
+    const data = await r.json();
+    applyTournamentUpdates(data.tournaments || []);
+    showToast(data.missing && data.missing.length ? 'Tournament no longer listed' : 'Tournament refreshed');
+  } catch { showToast('Refresh failed'); }
 }
 
 function notifyFavoriteLive(t) {
@@ -847,7 +1058,7 @@ async function loadConfig() {
     if (state.apiKeyFromEnv) {
       $.keyCurrentRow.classList.remove('hidden');
       $.keyInputRow.classList.add('hidden');
-      $.maskedKey.textContent = '(env variable)';
+      $.maskedKey.textContent = data.key_count > 1 ? `(env variable, ${data.key_count} keys)` : '(env variable)';
       $.changeKeyBtn.classList.add('hidden');
     } else if (state.hasApiKey) {
       $.keyCurrentRow.classList.remove('hidden');
@@ -987,24 +1198,24 @@ function updateProgress(p) {
   }
 }
 
-function applySearchResponse(data) {
+function applySearchResponse(data, { fromSnapshot = false } = {}) {
   if (data.error) {
     showToast('Error: ' + data.error);
     return false;
   }
-  const previousStatuses = new Map(state.enriched.map(t => [t.tag, t.effectiveStatus]));
   state.tournaments = data.tournaments || [];
   state.fetchedAt = data.fetchedAt || new Date().toISOString();
   state.lastStats = data.stats || null;
+  state.fromSnapshot = fromSnapshot;
+  syncResultsData();
+  rebuildPhaseSchedule();
   renderRows();
-  state.enriched.forEach(t => {
-    if (previousStatuses.get(t.tag) === 'inPreparation' && t.effectiveStatus === 'inProgress' && state.favorites.has(t.tag)) {
-      notifyFavoriteLive(t);
-    }
-  });
   if (state.lastStats) updateDebugStats(state.lastStats);
   renderFreshness();
-  showToast(`Loaded ${state.tournaments.length} tournaments`);
+  if (!fromSnapshot) {
+    saveSnapshot(data);
+    showToast(`Loaded ${state.tournaments.length} tournaments`);
+  }
   return true;
 }
 
@@ -1110,6 +1321,34 @@ async function loadLogs() {
   }
 }
 
+function formatProfile(p) {
+  const when = p.at ? new Date(p.at).toLocaleTimeString() : '—';
+  const rows = (p.top || []).slice(0, 12).map(f =>
+    `  ${String(f.ownMs.toFixed(1)).padStart(8)} ms  ${String(f.cumulativeMs.toFixed(1)).padStart(8)} ms  ${String(f.calls).padStart(7)}×  ${f.function} (${f.file}:${f.line})`
+  );
+  return [`${p.route} · ${when} · ${p.wallMs} ms wall`, '       own   cumulative    calls', ...rows].join('\n');
+}
+
+async function loadProfiles() {
+  try {
+    $.profileOutput.textContent = 'Loading…';
+    const r = await fetch('/api/debug/profiles?limit=5');
+    const data = await r.json();
+    $.profileOutput.textContent = (data.profiles && data.profiles.length)
+      ? data.profiles.map(formatProfile).join('\n\n')
+      : 'No profiles yet.';
+  } catch (e) {
+    $.profileOutput.textContent = 'Error loading profiles: ' + e.message;
+  }
+}
+
+function formatTagEvent(e) {
+  const when = e.ts ? new Date(e.ts).toLocaleString() : '—';
+  const what = e.event === 'seen' ? 'crawl' : e.event === 'match' ? 'search match' : (e.event || 'event');
+  const mode = state.gameModes[String(e.gameModeId)] || (e.gameModeId ? `#${e.gameModeId}` : '—');
+  return `${when}  ${what}  "${e.name || '—'}" ${e.status || '—'} [${mode}] ${e.players ?? 0}/${e.maxPlayers ?? 0} players`;
+}
+
 async function searchTag() {
   const tag = $.tagSearchInput.value.trim();
   if (!tag) {
@@ -1119,14 +1358,15 @@ async function searchTag() {
     return;
   }
   try {
-    const r = await fetch('/api/logs?search=' + encodeURIComponent(tag));
+    const r = await fetch('/api/events?tag=' + encodeURIComponent(tag));
     const data = await r.json();
-    if (data.total_matches > 0) {
+    if (data.total > 0) {
+      const lines = data.events.map(formatTagEvent).join('\n');
       $.tagSearchResult.className = 'db-log-result success';
-      $.tagSearchResult.innerHTML = `<strong>Found ${data.total_matches} entries for ${escapeHtml(tag)}</strong><pre>${escapeHtml((data.logs || []).join(''))}</pre>`;
+      $.tagSearchResult.innerHTML = `<strong>Found ${data.total} entries for ${escapeHtml(data.tag || tag)}</strong><pre>${escapeHtml(lines)}</pre>`;
     } else {
       $.tagSearchResult.className = 'db-log-result warning';
-      $.tagSearchResult.innerHTML = `<strong>No entries for ${escapeHtml(tag)}</strong><br>The tournament was not in the search results.`;
+      $.tagSearchResult.innerHTML = `<strong>No entries for ${escapeHtml(tag)}</strong><br>The tournament was not found by any recorded crawl or search.`;
     }
     $.tagSearchResult.classList.remove('hidden');
   } catch (e) {
@@ -1234,6 +1474,8 @@ function wire() {
 
   // Toolbar
   $.searchInput.addEventListener('input', debounce(() => { state.search = $.searchInput.value; renderRows(); }, 100));
+  $.rows.addEventListener('scroll', onRowsScroll, { passive: true });
+  $.rows.addEventListener('click', onRowsClick);
   $.quickLive.addEventListener('click', () => { state.quick = state.quick === 'live' ? null : 'live'; renderRows(); });
   $.quickPrep.addEventListener('click', () => { state.quick = state.quick === 'prep' ? null : 'prep'; renderRows(); });
   // Normal click reuses the server cache (fast); Shift-click forces a full re-crawl.
@@ -1270,6 +1512,7 @@ function wire() {
   };
   $.detailCopy.addEventListener('click', copyCurrentTag);
   $.detailCopyBtn.addEventListener('click', copyCurrentTag);
+  $.detailRefreshBtn.addEventListener('click', () => { if (state.selectedTag) refreshTournaments([state.selectedTag]); });
 
   // Settings drawer
   $.settingsBtn.addEventListener('click', openSettings);
@@ -1289,6 +1532,7 @@ function wire() {
   $.tagSearchBtn.addEventListener('click', searchTag);
   $.tagSearchInput.addEventListener('keypress', e => { if (e.key === 'Enter') searchTag(); });
   $.refreshLogsBtn.addEventListener('click', loadLogs);
+  $.refreshProfilesBtn.addEventListener('click', loadProfiles);
   $.shutdownBtn.addEventListener('click', shutdownServer);
 
   // Global shortcuts
@@ -1306,6 +1550,7 @@ function wire() {
 
   // Resize handler
   window.addEventListener('resize', debounce(applyResponsive, 100));
+  window.addEventListener('resize', debounce(renderRows, 150));
 }
 
 function copyToClipboard(text) {
@@ -1326,17 +1571,24 @@ function copyToClipboard(text) {
 // ==========================================================
 document.addEventListener('DOMContentLoaded', async () => {
   grabRefs();
+  startResultsWorker();
+  listenForServiceWorkerUpdates();
   wire();
   applyResponsive();
   renderFreshness();
   renderSavedViews();
   renderLevelCaps();
 
+  // Paint the last results right away; the search below refreshes them.
+  const snapshot = await loadSnapshot();
+  if (snapshot) applySearchResponse(snapshot, { fromSnapshot: true });
+
   await loadGameModes();
   renderModeChecks();
 
   await loadConfig();
   renderRows(); // initial empty/"set API key" state
+  watchFavorites();
 
   startHeartbeat();
 
@@ -1352,7 +1604,7 @@ document.addEventListener('DOMContentLoaded', async () => {
   }, 15000);
 
   // Kick off an initial search if we have a key
-  if (state.hasApiKey) {
+  if (state.hasApiKey && !(await searchFromServiceWorkerCache())) {
     searchTournaments({ force: false });
   }
 });
@@ -0,0 +1,254 @@
+// Result list model: timing enrichment, filtering and sorting of tournaments.
+// Runs inside results-worker.js, on the main thread as a fallback, and in Node tests.
+var CrResults = (() => {
+  const timingModel = typeof CrTiming !== 'undefined' ? CrTiming : require('./timing.js');
+
+  function enrich(tournaments, nowMs = Date.now()) {
+    return tournaments.map(t => {
+      const timing = timingModel.deriveTiming(t, nowMs);
+      return {
+        ...t,
+        timing,
+        countdownType: timing.countdownType,
+        remainingSec: timing.remainingSec,
+        totalSec: timing.totalSec,
+        effectiveStatus: timing.effectiveStatus,
+      };
+    });
+  }
+
+  // Letters NFD can't split into base + combining mark.
+  const FOLD_EXTRA = { 'ı': 'i', 'ł': 'l', 'ø': 'o', 'đ': 'd', 'ß': 'ss', 'æ': 'ae', 'œ': 'oe' };
+
+  // Lowercase and strip accents so "cok" finds "Çok" (the Royale API can't).
+  function foldText(text) {
+    return String(text || '')
+      .normalize('NFD')
+      .replace(/[\u0300-\u036f]/g, '')
+      .toLowerCase()
+      .replace(/[ıłøđßæœ]/g, ch => FOLD_EXTRA[ch]);
+  }
+
+  function intersectSorted(a, b) {
+    const out = [];
+    let i = 0;
+    let j = 0;
+    while (i < a.length && j < b.length) {
+      if (a[i] === b[j]) { out.push(a[i]); i += 1; j += 1; }
+      else if (a[i] < b[j]) i += 1;
+      else j += 1;
+    }
+    return out;
+  }
+
+  const MAX_GRAM = 3;
+
+  // Posting lists of every 1..3-character substring of each tournament's
+  // folded "name tag mode" text, built once per data load.
+  function createSearchIndex(tournaments) {
+    const texts = [];
+    const grams = new Map();
+    tournaments.forEach((t, position) => {
+      const text = foldText(`${t.name || ''} ${t.tag || ''} ${t.gameModeName || ''}`);
+      texts.push(text);
+      const seen = new Set();
+      for (let n = 1; n <= MAX_GRAM; n += 1) {
+        for (let i = 0; i + n <= text.length; i += 1) {
+          const gram = text.slice(i, i + n);
+          if (seen.has(gram)) continue;
+          seen.add(gram);
+          let list = grams.get(gram);
+          if (!list) { list = []; grams.set(gram, list); }
+          list.push(position);
+        }
+      }
+    });
+
+    return {
+      // Positions whose text contains the (already folded) query, ascending.
+      lookup(query) {
+        if (!query) return null;
+        if (query.length <= MAX_GRAM) return grams.get(query) || [];
+        const lists = [];
+        for (let i = 0; i + MAX_GRAM <= query.length; i += 1) {
+          const list = grams.get(query.slice(i, i + MAX_GRAM));
+          if (!list) return [];
+          lists.push(list);
+        }
+        lists.sort((a, b) => a.length - b.length);
+        const candidates = lists.reduce((acc, list) => intersectSorted(acc, list));
+        // Trigrams can all occur without being adjacent; confirm the substring.
+        return candidates.filter(position => texts[position].includes(query));
+      },
+    };
+  }
+
+  // Sets arrive as Sets from structured clone, or as arrays from JSON callers.
+  function toSet(values) {
+    return values instanceof Set ? values : new Set(values || []);
+  }
+
+  function normalizeQuery(query = {}) {
+    const filters = query.filters || {};
+    return {
+      savedView: query.savedView || 'all',
+      favorites: toSet(query.favorites),
+      quick: query.quick || null,
+      search: foldText(String(query.search || '').trim()),
+      sort: query.sort || { by: 'recommended', dir: 'asc' },
+      offset: Math.max(0, query.offset || 0),
+      limit: query.limit ?? Number.POSITIVE_INFINITY,
+      filters: {
+        modes: toSet(filters.modes),
+        levelCaps: toSet(filters.levelCaps),
+        minPlayers: filters.minPlayers || 0,
+        minMinsLeft: filters.minMinsLeft || 0,
+        maxMinsLeft: filters.maxMinsLeft ?? null,
+        access: filters.access || 'any',
+      },
+    };
+  }
+
+  function matchesFilters(t, q) {
+    // Ended tournaments can't be joined — never show them.
+    if (t.effectiveStatus === 'ended') return false;
+
+    // Saved view
+    if (q.savedView === 'favorites' && !q.favorites.has(t.tag)) return false;
+    if (q.savedView === 'high-lvl' && (t.levelCap || 0) < 15) return false;
+
+    // Sidebar filters
+    const f = q.filters;
+    if (f.modes.size && !f.modes.has(String(t.gameModeId))) return false;
+    if (f.levelCaps.size && !f.levelCaps.has(Number(t.levelCap))) return false;
+    if (f.minPlayers > 0 && (t.players || 0) < f.minPlayers) return false;
+    const mins = Number.isFinite(t.remainingSec) ? t.remainingSec / 60 : null;
+    if (f.minMinsLeft > 0 && (mins === null || mins < f.minMinsLeft)) return false;
+    if (f.maxMinsLeft !== null && (mins === null || mins > f.maxMinsLeft)) return false;
+    if (f.access === 'open' && t.type === 'passwordProtected') return false;
+    if (f.access === 'password' && t.type !== 'passwordProtected') return false;
+
+    // Quick
+    if (q.quick === 'live' && t.effectiveStatus !== 'inProgress') return false;
+    if (q.quick === 'prep' && t.effectiveStatus !== 'inPreparation') return false;
+
+    // Search (the model answers this from its index instead)
+    if (q.search) {
+      const hay = foldText(`${t.name || ''} ${t.tag || ''} ${t.gameModeName || ''}`);
+      if (!hay.includes(q.search)) return false;
+    }
+    return true;
+  }
+
+  function phaseRank(t) {
+    if (t.timing?.phase === 'prep') return 0;
+    if (t.timing?.phase === 'live') return 1;
+    return 2;
+  }
+
+  function finiteRemaining(t) {
+    return Number.isFinite(t.remainingSec) ? t.remainingSec : Number.POSITIVE_INFINITY;
+  }
+
+  function compareRemaining(a, b) {
+    const left = finiteRemaining(a);
+    const right = finiteRemaining(b);
+    return left === right ? 0 : left - right;
+  }
+
+  function comparator(sort) {
+    const dir = sort.dir === 'asc' ? 1 : -1;
+    return (a, b) => {
+      switch (sort.by) {
+        case 'name':    return (a.name || '').localeCompare(b.name || '') * dir;
+        case 'mode':    return (a.gameModeName || '').localeCompare(b.gameModeName || '') * dir;
+        case 'players': return ((a.players || 0) - (b.players || 0)) * dir;
+        case 'level':   return ((a.levelCap || 0) - (b.levelCap || 0)) * dir;
+        case 'timing': {
+          const phaseDiff = phaseRank(a) - phaseRank(b);
+          if (phaseDiff !== 0) return phaseDiff;
+          const aKnown = Number.isFinite(a.remainingSec);
+          const bKnown = Number.isFinite(b.remainingSec);
+          if (aKnown !== bKnown) return aKnown ? -1 : 1;
+          return compareRemaining(a, b) * dir;
+        }
+        case 'recommended':
+        default: {
+          const phaseDiff = phaseRank(a) - phaseRank(b);
+          if (phaseDiff !== 0) return phaseDiff;
+          if (a.timing?.phase === 'live') {
+            const aKnown = Number.isFinite(a.remainingSec);
+            const bKnown = Number.isFinite(b.remainingSec);
+            if (aKnown !== bKnown) return aKnown ? -1 : 1;
+            const remainingDiff = compareRemaining(b, a);
+            if (remainingDiff !== 0) return remainingDiff;
+          } else {
+            const remainingDiff = compareRemaining(a, b);
+            if (remainingDiff !== 0) return remainingDiff;
+          }
+          return (b.players || 0) - (a.players || 0);
+        }
+      }
+    };
+  }
+
+  // Holds the full data set; query() returns only the requested slice plus
+  // the counts the toolbar and saved views need.
+  function createModel() {
+    let tournaments = [];
+    let positions = new Map();
+    let index = createSearchIndex([]);
+    return {
+      setData(list) {
+        tournaments = Array.isArray(list) ? list : [];
+        positions = new Map(tournaments.map((t, position) => [t.tag, position]));
+        index = createSearchIndex(tournaments);
+      },
+      // Replace known tournaments by tag; the index is rebuilt only if a name changed.
+      patch(list) {
+        let renamed = false;
+        (list || []).forEach(t => {
+          const position = positions.get(t.tag);
+          if (position === undefined) return;
+          renamed = renamed || tournaments[position].name !== t.name;
+          tournaments[position] = t;
+        });
+        if (renamed) index = createSearchIndex(tournaments);
+      },
+      query(rawQuery, nowMs = Date.now()) {
+        const q = normalizeQuery(rawQuery);
+        const enriched = enrich(tournaments, nowMs);
+        const counts = { all: 0, favorites: 0, 'high-lvl': 0 };
+        enriched.forEach(t => {
+          if (t.effectiveStatus === 'ended') return;
+          counts.all += 1;
+          if (q.favorites.has(t.tag)) counts.favorites += 1;
+          if ((t.levelCap || 0) >= 15) counts['high-lvl'] += 1;
+        });
+        const hits = index.lookup(q.search);
+        const rest = { ...q, search: '' };
+        const candidates = hits ? hits.map(position => enriched[position]) : enriched;
+        const matched = candidates.filter(t => matchesFilters(t, rest)).sort(comparator(q.sort));
+        // A window past the end (the list just shrank) snaps back to the last page.
+        const offset = Math.min(q.offset, Math.max(0, matched.length - q.limit));
+        return {
+          items: matched.slice(offset, offset + q.limit),
+          offset,
+          matched: matched.length,
+          total: counts.all,
+          counts,
+          selectedIndex: rawQuery && rawQuery.selectedTag
+            ? matched.findIndex(t => t.tag === rawQuery.selectedTag)
+            : -1,
+          firstTag: matched[0]?.tag || null,
+        };
+      },
+    };
+  }
+
+  return { enrich, foldText, createSearchIndex, matchesFilters, normalizeQuery, comparator, createModel };
+})();
+
+if (typeof module !== 'undefined' && module.exports) {
+  module.exports = CrResults;
+}
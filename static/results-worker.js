@@ -0,0 +1,16 @@
+// Holds the tournament list off the UI thread and answers result queries
+// with the visible slice only (see results-model.js).
+importScripts('timing.js', 'results-model.js');
+
+const model = CrResults.createModel();
+
+self.onmessage = event => {
+  const msg = event.data || {};
+  if (msg.type === 'data') {
+    model.setData(msg.tournaments);
+  } else if (msg.type === 'patch') {
+    model.patch(msg.tournaments);
+  } else if (msg.type === 'query') {
+    self.postMessage({ seq: msg.seq, ...model.query(msg.query) });
+  }
+};
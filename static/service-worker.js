@@ -1,11 +1,18 @@
 // CR Tournament Finder - Service Worker
 // Provides offline caching for static assets
 
-const CACHE_NAME = 'cr-finder-v18';
+const CACHE_NAME = 'cr-finder-v29';
+// Search payloads outlive app versions, so they get their own cache.
+const API_CACHE_NAME = 'cr-finder-api';
+const SEARCH_URL = '/api/tournaments/search';
+// The page's IndexedDB copy of the last search (see app.js).
+const SNAPSHOT_DB = 'cr-finder';
 const STATIC_ASSETS = [
     '/',
     '/static/style.css',
     '/static/timing.js',
+    '/static/results-model.js',
+    '/static/results-worker.js',
     '/static/app.js',
     '/static/icons/icon-192x192.png',
     '/static/icons/icon-512x512.png',
@@ -36,7 +43,7 @@ self.addEventListener('activate', (event) => {
             .then((cacheNames) => {
                 return Promise.all(
                     cacheNames
-                        .filter((name) => name !== CACHE_NAME)
+                        .filter((name) => name !== CACHE_NAME && name !== API_CACHE_NAME)
                         .map((name) => {
                             console.log('[SW] Deleting old cache:', name);
                             return caches.delete(name);
@@ -47,6 +54,48 @@ self.addEventListener('activate', (event) => {
     );
 });
 
+function notifyClients(message) {
+    return self.clients.matchAll({ type: 'window' })
+        .then((clients) => clients.forEach((client) => client.postMessage(message)));
+}
+
+// Conditional fetch of the search payload; stores and announces new data.
+async function revalidateSearch(cache, cached) {
+    const headers = new Headers();
+    const etag = cached && cached.headers.get('ETag');
+    if (etag) {
+        headers.set('If-None-Match', etag);
+    }
+    const response = await fetch(SEARCH_URL, { headers, credentials: 'same-origin', cache: 'no-store' });
+    if (response.status === 304 && cached) {
+        // The ETag lets the page match this to the copy it painted, whichever arrives first.
+        await notifyClients({ type: 'search-current', url: SEARCH_URL, etag });
+        return cached;
+    }
+    if (response.ok) {
+        await cache.put(SEARCH_URL, response.clone());
+        if (cached) {
+            await notifyClients({ type: 'search-updated', url: SEARCH_URL });
+        }
+    }
+    return response;
+}
+
+// Stale-while-revalidate: answer from cache at once (marked X-SW-Cache: hit)
+// and refresh the cache in the background.
+async function searchStaleWhileRevalidate(event) {
+    const cache = await caches.open(API_CACHE_NAME);
+    const cached = await cache.match(SEARCH_URL);
+    const revalidation = revalidateSearch(cache, cached);
+    if (!cached) {
+        return revalidation;
+    }
+    event.waitUntil(revalidation.catch(() => {}));
+    const headers = new Headers(cached.headers);
+    headers.set('X-SW-Cache', 'hit');
+    return new Response(cached.body, { status: cached.status, statusText: cached.statusText, headers });
+}
+
 // Fetch: Network-first for HTML/API, Cache-first for static assets
 self.addEventListener('fetch', (event) => {
     const url = new URL(event.request.url);
@@ -56,7 +105,25 @@ self.addEventListener('fetch', (event) => {
         return;
     }
 
-    // Skip API calls and auth endpoints - always go to network
+    // Cached crawl results (forced re-crawls always go to the network)
+    if (url.pathname === SEARCH_URL && !url.search) {
+        event.respondWith(searchStaleWhileRevalidate(event));
+        return;
+    }
+
+    // Cached payloads belong to the session that fetched them
+    if (url.pathname === '/logout') {
+        event.waitUntil(Promise.all([
+            caches.delete(API_CACHE_NAME),
+            new Promise((resolve) => {
+                const req = indexedDB.deleteDatabase(SNAPSHOT_DB);
+                req.onsuccess = req.onerror = req.onblocked = resolve;
+            }),
+        ]));
+        return;
+    }
+
+    // Skip other API calls and auth endpoints - always go to network
     if (url.pathname.startsWith('/api/') ||
         url.pathname === '/login' ||
         url.pathname === '/logout') {
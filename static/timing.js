@@ -188,7 +188,79 @@ var CrTiming = (() => {
     return hours > 0 ? `${hours}:${pad(minutes)}:${pad(secs)}` : `${pad(minutes)}:${pad(secs)}`;
   }
 
-  return { deriveTiming, formatCountdown, parseCrTime };
+  // Min-heap of each tournament's next phase boundary (`nextAtMs`), so a
+  // once-a-second tick only looks at tournaments whose phase can have changed.
+  function createPhaseSchedule(tournaments, nowMs = Date.now()) {
+    const heap = [];
+    const statuses = new Map();
+
+    function swap(i, j) {
+      const tmp = heap[i];
+      heap[i] = heap[j];
+      heap[j] = tmp;
+    }
+
+    function push(entry) {
+      heap.push(entry);
+      let i = heap.length - 1;
+      while (i > 0) {
+        const parent = (i - 1) >> 1;
+        if (heap[parent].atMs <= heap[i].atMs) break;
+        swap(i, parent);
+        i = parent;
+      }
+    }
+
+    function pop() {
+      const top = heap[0];
+      const last = heap.pop();
+      if (heap.length) {
+        heap[0] = last;
+        let i = 0;
+        for (;;) {
+          const left = 2 * i + 1;
+          const right = left + 1;
+          let smallest = i;
+          if (left < heap.length && heap[left].atMs < heap[smallest].atMs) smallest = left;
+          if (right < heap.length && heap[right].atMs < heap[smallest].atMs) smallest = right;
+          if (smallest === i) break;
+          swap(i, smallest);
+          i = smallest;
+        }
+      }
+      return top;
+    }
+
+    function track(tournament, atNowMs) {
+      const timing = deriveTiming(tournament, atNowMs);
+      statuses.set(tournament.tag, timing.effectiveStatus);
+      if (timing.nextAtMs !== null && timing.nextAtMs > atNowMs) {
+        push({ atMs: timing.nextAtMs, tournament });
+      }
+      return timing.effectiveStatus;
+    }
+
+    (tournaments || []).forEach(t => track(t, nowMs));
+
+    return {
+      status: tag => statuses.get(tag),
+      nextAtMs: () => (heap.length ? heap[0].atMs : null),
+      size: () => heap.length,
+      // Pops every boundary that has passed and returns the phase changes.
+      due(atNowMs = Date.now()) {
+        const changes = [];
+        while (heap.length && heap[0].atMs <= atNowMs) {
+          const { tournament } = pop();
+          const previous = statuses.get(tournament.tag);
+          const status = track(tournament, atNowMs);
+          if (status !== previous) changes.push({ tournament, previous, status });
+        }
+        return changes;
+      },
+    };
+  }
+
+  return { deriveTiming, formatCountdown, parseCrTime, createPhaseSchedule };
 })();
 
 if (typeof module !== 'undefined' && module.exports) {
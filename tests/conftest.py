@@ -0,0 +1,9 @@
+"""Point the app's log and event files at a scratch dir before any test imports it."""
+import atexit
+import os
+import shutil
+import tempfile
+
+_LOGS_DIR = tempfile.mkdtemp(prefix="cr-finder-test-logs-")
+os.environ.setdefault("CR_FINDER_LOGS_DIR", _LOGS_DIR)
+atexit.register(shutil.rmtree, _LOGS_DIR, ignore_errors=True)
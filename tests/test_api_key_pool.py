@@ -0,0 +1,71 @@
+import asyncio
+import os
+import unittest
+from unittest.mock import patch
+
+import app as app_module
+from tools.bench_crawl import run_crawl_benchmark
+from tools.mock_royale_api import MockRoyaleAPI, generate_population
+
+
+class ApiKeyPoolTests(unittest.TestCase):
+    def test_unbudgeted_keys_are_used_round_robin(self):
+        pool = app_module.ApiKeyPool(["a", "b", "c"])
+
+        keys = [pool.try_acquire()[0] for _ in range(6)]
+
+        self.assertEqual(keys, ["a", "b", "c", "a", "b", "c"])
+
+    def test_throttled_key_is_benched_while_others_have_budget(self):
+        pool = app_module.ApiKeyPool(["a", "b"], bench_seconds=60)
+        pool.report("a", 429)
+
+        keys = {pool.try_acquire()[0] for _ in range(5)}
+
+        self.assertEqual(keys, {"b"})
+        self.assertEqual(pool.snapshot()[0]["rateLimits"], 1)
+        self.assertGreater(pool.snapshot()[0]["benchedFor"], 0)
+
+    def test_single_benched_key_is_still_handed_out(self):
+        pool = app_module.ApiKeyPool(["solo"], bench_seconds=60)
+        pool.report("solo", 429)
+
+        self.assertEqual(pool.try_acquire(), ("solo", 0.0))
+
+    def test_exhausted_budget_reports_wait(self):
+        pool = app_module.ApiKeyPool(["a"], rate=2)
+        pool.try_acquire()
+        pool.try_acquire()
+
+        key, wait = pool.try_acquire()
+
+        self.assertIsNone(key)
+        self.assertGreater(wait, 0)
+        self.assertLessEqual(wait, 0.5)
+
+    def test_config_masks_every_key(self):
+        app_module.app.config.update(TESTING=True)
+        client = app_module.app.test_client()
+        keys = "k" * 30 + "AAAAAA," + "shortkey1234"
+        with patch.object(app_module, "APP_PASSWORD", ""), patch.dict(os.environ, {"CR_API_KEY": keys}):
+            data = client.get("/api/config").get_json()
+
+        self.assertEqual(data["key_count"], 2)
+        self.assertEqual(data["masked_key"], "kkkkkkkkkk...AAAAAA, ...1234")
+        self.assertEqual(len(data["key_pool"]), 2)
+
+
+class PooledCrawlTests(unittest.TestCase):
+    def test_crawl_spreads_queries_over_keys_within_their_budget(self):
+        mock = MockRoyaleAPI(generate_population(200, seed=6), key_rate_limit=400)
+
+        report = asyncio.run(run_crawl_benchmark(mock, {"CR_API_KEY": "k1,k2,k3", "API_KEY_RATE": 300}))
+
+        self.assertEqual(report["coverage"], 1.0)
+        self.assertEqual(report["rate_limit_hits"], 0)
+        per_key = [mock.requests_by_key[k] for k in ("k1", "k2", "k3")]
+        self.assertLessEqual(max(per_key) - min(per_key), len(per_key))
+
+
+if __name__ == "__main__":
+    unittest.main()
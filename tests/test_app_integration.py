@@ -103,13 +103,43 @@ class AppIntegrationTests(unittest.TestCase):
         self.assertEqual(result["preparationDuration"], 600)
         self.assertEqual(result["duration"], 1800)
 
+    def test_search_revalidates_with_etag(self):
+        cache = {"tournaments": [], "fetchedAt": "2026-07-14T10:00:00+00:00", "stats": app_module.make_search_stats()}
+        with patch.object(app_module, "APP_PASSWORD", ""), patch.object(
+            app_module, "has_api_key", return_value=True
+        ), patch.object(app_module, "get_fresh_search_cache", return_value=cache), patch.object(
+            app_module, "fetch_tournament_details_for_in_progress", return_value=[]
+        ):
+            first = self.client.get("/api/tournaments/search")
+            etag = first.headers["ETag"]
+            again = self.client.get("/api/tournaments/search", headers={"If-None-Match": f'W/{etag}, "x"'})
+            cache["fetchedAt"] = "2026-07-14T10:03:00+00:00"
+            changed = self.client.get("/api/tournaments/search", headers={"If-None-Match": etag})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.get_data(), b"")
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers["ETag"], etag)
+
     def test_service_worker_version_caches_timing_asset(self):
         service_worker_path = os.path.join(app_module.BASE_DIR, "static", "service-worker.js")
         with open(service_worker_path, "r", encoding="utf-8") as handle:
             source = handle.read()
 
-        self.assertIn("cr-finder-v18", source)
+        self.assertIn("cr-finder-v29", source)
         self.assertIn("'/static/timing.js'", source)
+        self.assertIn("'/static/results-model.js'", source)
+        self.assertIn("'/static/results-worker.js'", source)
+
+    def test_service_worker_drops_cached_payloads_on_logout(self):
+        service_worker_path = os.path.join(app_module.BASE_DIR, "static", "service-worker.js")
+        with open(service_worker_path, "r", encoding="utf-8") as handle:
+            source = handle.read()
+
+        logout = source[source.index("url.pathname === '/logout') {"):]
+        self.assertIn("caches.delete(API_CACHE_NAME)", logout[:400])
+        self.assertIn("indexedDB.deleteDatabase(SNAPSHOT_DB)", logout[:400])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,159 @@
+import asyncio
+import json
+import time
+import unittest
+from unittest.mock import patch
+
+import app as app_module
+import asgi as asgi_module
+
+
+def call_asgi(path, query_string=b""):
+    """Run one GET request through the ASGI app and collect the response."""
+    status, _, body = call_asgi_full(path, query_string)
+    return status, body
+
+
+async def asgi_request(path, query_string=b"", headers=(), disconnect_after=3600):
+    """Send one GET request through the ASGI app and return (status, headers, body)."""
+    sent = []
+    request_done = False
+
+    async def receive():
+        nonlocal request_done
+        if not request_done:
+            request_done = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.sleep(disconnect_after)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("ascii"),
+        "query_string": query_string,
+        "root_path": "",
+        "headers": [(b"host", b"testserver"), *headers],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+    await asyncio.wait_for(asgi_module.app(scope, receive, send), timeout=5)
+    start = next(m for m in sent if m["type"] == "http.response.start")
+    body = b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
+    return start["status"], dict(start["headers"]), body.decode("utf-8")
+
+
+def call_asgi_full(path, query_string=b"", headers=(), disconnect_after=3600):
+    """Like call_asgi(), also sending `headers` and returning the response headers.
+
+    The client disconnects after `disconnect_after` seconds, which ends streams.
+    """
+    return asyncio.run(asgi_request(path, query_string, headers, disconnect_after))
+
+
+class AsgiTests(unittest.TestCase):
+    def setUp(self):
+        self.tournament = {
+            "tag": "#ASGI",
+            "name": "Async fixture",
+            "type": "open",
+            "status": "inPreparation",
+            "capacity": 3,
+            "maxCapacity": 50,
+            "levelCap": 15,
+            "gameMode": {"id": 72000009},
+            "createdTime": "20260714T100000.000Z",
+            "preparationDuration": 600,
+            "duration": 1800,
+        }
+        self.cache = {
+            "tournaments": [self.tournament],
+            "fetchedAt": "2026-07-14T10:00:00+00:00",
+            "stats": app_module.make_search_stats(),
+        }
+
+    def test_stream_is_served_on_the_event_loop(self):
+        with patch.object(app_module, "APP_PASSWORD", ""), patch.object(
+            app_module, "has_api_key", return_value=True
+        ), patch.object(app_module, "get_fresh_search_cache", return_value=self.cache):
+            status, body = call_asgi("/api/tournaments/search/stream")
+
+        self.assertEqual(status, 200)
+        self.assertIn("event: progress", body)
+        done_block = next(block for block in body.split("\n\n") if block.startswith("event: done"))
+        payload = json.loads(done_block.split("data: ", 1)[1])
+        self.assertEqual(payload["tournaments"][0]["tag"], "#ASGI")
+
+    def test_search_answers_304_when_the_etag_matches(self):
+        with patch.object(app_module, "APP_PASSWORD", ""), patch.object(
+            app_module, "has_api_key", return_value=True
+        ), patch.object(app_module, "get_fresh_search_cache", return_value=self.cache), patch.object(
+            app_module, "fetch_tournament_details_for_in_progress_async", return_value=None
+        ):
+            status, headers, body = call_asgi_full("/api/tournaments/search")
+            etag = headers[b"etag"]
+            again, _, empty = call_asgi_full("/api/tournaments/search", headers=[(b"if-none-match", etag)])
+            stale, _, _ = call_asgi_full("/api/tournaments/search", headers=[(b"if-none-match", b'"old"')])
+
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)["tournaments"][0]["tag"], "#ASGI")
+        self.assertEqual(headers[b"cache-control"], b"private, no-cache")
+        self.assertEqual((again, empty), (304, ""))
+        self.assertEqual(stale, 200)
+
+    def test_favorites_stream_sends_a_snapshot_of_watched_tags(self):
+        with patch.object(app_module, "APP_PASSWORD", ""), patch.object(app_module, "_SEARCH_CACHE", self.cache):
+            status, headers, body = call_asgi_full(
+                "/api/favorites/stream", b"tags=ASGI,%23NOPE", disconnect_after=0.2
+            )
+
+        self.assertEqual(status, 200)
+        self.assertEqual(headers[b"content-type"], b"text/event-stream")
+        snapshot = next(block for block in body.split("\n\n") if block.startswith("event: snapshot"))
+        payload = json.loads(snapshot.split("data: ", 1)[1])
+        self.assertEqual([t["tag"] for t in payload["tournaments"]], ["#ASGI"])
+        self.assertEqual(app_module._TAG_WATCH_HUB.watched_tags(), [])
+
+    def test_search_requires_session_when_password_is_set(self):
+        with patch.object(app_module, "APP_PASSWORD", "secret"):
+            status, body = call_asgi("/api/tournaments/search")
+
+        self.assertEqual(status, 401)
+        self.assertEqual(json.loads(body), {"error": "Unauthorized"})
+
+    def test_other_routes_fall_through_to_flask(self):
+        with patch.object(app_module, "APP_PASSWORD", ""):
+            status, body = call_asgi("/api/game-modes")
+
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)["72000009"], "Normal")
+
+    def test_flask_routes_do_not_queue_behind_each_other(self):
+        view = app_module.app.view_functions["api_game_modes"]
+
+        def slow_view(*args, **kwargs):
+            time.sleep(0.3)
+            return view(*args, **kwargs)
+
+        async def four_at_once():
+            return await asyncio.gather(*(asgi_request("/api/game-modes") for _ in range(4)))
+
+        with patch.object(app_module, "APP_PASSWORD", ""), \
+                patch.dict(app_module.app.view_functions, {"api_game_modes": slow_view}):
+            started = time.perf_counter()
+            responses = asyncio.run(four_at_once())
+            elapsed = time.perf_counter() - started
+
+        self.assertEqual([status for status, _, _ in responses], [200] * 4)
+        self.assertLess(elapsed, 0.9)
+
+
+if __name__ == "__main__":
+    unittest.main()
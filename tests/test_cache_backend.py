@@ -0,0 +1,273 @@
+import asyncio
+import socket
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import app as app_module
+from tools.kv_server import KVServer
+
+
+def tournament(tag, capacity=3):
+    return {"tag": tag, "name": f"Cup {tag}", "status": "inPreparation", "capacity": capacity, "maxCapacity": 50}
+
+
+class KVServerThread:
+    """Runs tools.kv_server on a background event loop for the duration of a test."""
+
+    def __init__(self, server=None):
+        self.server = server or KVServer()
+
+    def __enter__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.url = asyncio.run_coroutine_threadsafe(self.server.start(), self.loop).result(5)
+        return self
+
+    def __exit__(self, *exc):
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+        self.loop.close()
+
+
+class LocalCacheBackendTests(unittest.TestCase):
+    def test_values_expire(self):
+        backend = app_module.LocalCacheBackend()
+        backend.set("k", b"v", 0.05)
+
+        self.assertEqual(backend.get("k"), b"v")
+        time.sleep(0.06)
+        self.assertIsNone(backend.get("k"))
+
+    def test_lock_is_exclusive_until_released_by_its_token(self):
+        backend = app_module.LocalCacheBackend()
+        token = backend.acquire_lock("lock", 10)
+
+        self.assertIsNone(backend.acquire_lock("lock", 10))
+        self.assertFalse(backend.release_lock("lock", "someone-else"))
+        self.assertTrue(backend.release_lock("lock", token))
+        self.assertIsNotNone(backend.acquire_lock("lock", 10))
+
+    def test_only_the_holder_renews_its_lease(self):
+        backend = app_module.LocalCacheBackend()
+        token = backend.acquire_lock("lock", 0.05)
+
+        self.assertFalse(backend.renew_lock("lock", "someone-else", 10))
+        self.assertTrue(backend.renew_lock("lock", token, 10))
+        time.sleep(0.06)
+        self.assertIsNone(backend.acquire_lock("lock", 10))
+
+
+class DropsLockReplies(KVServer):
+    """Takes every SET NX but drops the connection instead of replying."""
+
+    def __init__(self):
+        super().__init__()
+        self.lock_requests = 0
+
+    def execute(self, args):
+        reply = super().execute(args)
+        if args[0].upper() == b"SET" and b"NX" in [a.upper() for a in args]:
+            self.lock_requests += 1
+            raise ConnectionResetError("reply lost")
+        return reply
+
+
+class RespCacheBackendTests(unittest.TestCase):
+    def setUp(self):
+        self.server = KVServerThread().__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.backend = app_module.make_cache_backend(self.server.url)
+
+    def test_get_set_with_expiry(self):
+        self.backend.set("k", b"\x00binary\r\n", 0.05)
+
+        self.assertEqual(self.backend.get("k"), b"\x00binary\r\n")
+        time.sleep(0.06)
+        self.assertIsNone(self.backend.get("missing"))
+        self.assertIsNone(self.backend.get("k"))
+
+    def test_lock_lease_and_compare_and_delete(self):
+        token = self.backend.acquire_lock("lock", 10)
+
+        self.assertIsNotNone(token)
+        self.assertIsNone(self.backend.acquire_lock("lock", 10))
+        self.assertFalse(self.backend.release_lock("lock", "stale-token"))
+        self.assertTrue(self.backend.release_lock("lock", token))
+
+    def test_lease_renewal_compares_the_token(self):
+        token = self.backend.acquire_lock("lock", 0.05)
+
+        self.assertFalse(self.backend.renew_lock("lock", "stale-token", 10))
+        self.assertTrue(self.backend.renew_lock("lock", token, 10))
+        time.sleep(0.06)
+        self.assertIsNone(self.backend.acquire_lock("lock", 10))
+
+    def test_lost_lock_reply_is_not_resent(self):
+        server = DropsLockReplies()
+        with KVServerThread(server) as kv:
+            backend = app_module.make_cache_backend(kv.url)
+            backend.get("warm-up")
+
+            with self.assertRaises(app_module.CacheBackendError):
+                backend.acquire_lock("lock", 10)
+
+        self.assertEqual(server.lock_requests, 1)
+
+    def test_reconnects_after_a_dropped_connection(self):
+        self.backend.set("k", b"v", 10)
+        self.backend._local.conn[0].shutdown(socket.SHUT_RDWR)
+
+        self.assertEqual(self.backend.get("k"), b"v")
+
+    def test_unreachable_server_raises_backend_error(self):
+        backend = app_module.RespCacheBackend("redis://127.0.0.1:1/0", timeout=0.5)
+
+        with self.assertRaises(app_module.CacheBackendError):
+            backend.get("k")
+
+
+class SharedSearchCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.server = KVServerThread().__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.backend = app_module.make_cache_backend(self.server.url)
+        self.crawls = []
+
+        def crawl(progress_cb=None):
+            self.crawls.append(time.time())
+            return [tournament("#MINE")]
+
+        for p in (patch.object(app_module, "_CACHE_BACKEND", self.backend),
+                  patch.object(app_module, "CRAWL_LOCK_POLL_SECONDS", 0.02),
+                  patch.object(app_module, "_SEARCH_CACHE", None),
+                  patch.object(app_module, "_SEARCH_FETCH_IN_PROGRESS", False),
+                  patch.object(app_module, "_TAG_WATCH_HUB", app_module.TagWatchHub()),
+                  patch.object(app_module, "fetch_all_tournaments", crawl)):
+            p.start()
+            self.addCleanup(p.stop)
+
+    def peer_publishes(self, tournaments, ttl=180):
+        fetched_at = time.time()
+        app_module._share_search_cache({"tournaments": tournaments, "fetchedAt": "peer",
+                                        "fetched_at_ts": fetched_at, "revised_at_ts": fetched_at, "stats": {}}, ttl)
+
+    def test_crawl_is_shared_and_lock_released(self):
+        cache = app_module.get_cached_search_results()
+
+        self.assertEqual(len(self.crawls), 1)
+        self.assertEqual(app_module.load_shared_search_cache(180, 0)["tournaments"], cache["tournaments"])
+        self.assertIsNotNone(self.backend.acquire_lock(app_module.CRAWL_LOCK_KEY, 10))
+
+    def test_fresh_peer_crawl_is_adopted_without_crawling(self):
+        self.peer_publishes([tournament("#PEER")])
+
+        cache = app_module.get_cached_search_results()
+
+        self.assertEqual(self.crawls, [])
+        self.assertEqual([t["tag"] for t in cache["tournaments"]], ["#PEER"])
+        self.assertIs(app_module.get_fresh_search_cache(), cache)
+
+    def test_waits_for_the_peer_holding_the_crawl_lock(self):
+        token = self.backend.acquire_lock(app_module.CRAWL_LOCK_KEY, 10)
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(app_module.get_cached_search_results(force_refresh=True)))
+        waiter.start()
+        time.sleep(0.1)
+        self.peer_publishes([tournament("#PEER")])
+        self.backend.release_lock(app_module.CRAWL_LOCK_KEY, token)
+        waiter.join(5)
+
+        self.assertEqual(self.crawls, [])
+        self.assertEqual([t["tag"] for t in results[0]["tournaments"]], ["#PEER"])
+
+    def test_async_variant_waits_for_the_peer_too(self):
+        token = self.backend.acquire_lock(app_module.CRAWL_LOCK_KEY, 10)
+
+        async def scenario():
+            task = asyncio.create_task(app_module.get_cached_search_results_async())
+            await asyncio.sleep(0.1)
+            self.peer_publishes([tournament("#PEER")])
+            self.backend.release_lock(app_module.CRAWL_LOCK_KEY, token)
+            return await task
+
+        cache = asyncio.run(scenario())
+
+        self.assertEqual([t["tag"] for t in cache["tournaments"]], ["#PEER"])
+
+    def test_stops_waiting_on_a_dead_peer_and_serves_the_stale_cache(self):
+        stale = {"tournaments": [tournament("#OLD")], "fetchedAt": "earlier", "fetched_at_ts": time.time() - 600,
+                 "revised_at_ts": time.time() - 600, "expires_at_ts": time.time() - 420, "stats": {}}
+        self.backend.acquire_lock(app_module.CRAWL_LOCK_KEY, 10)  # holder never comes back
+
+        with patch.object(app_module, "CRAWL_LOCK_WAIT_SECONDS", 0.1), \
+                patch.object(app_module, "_SEARCH_CACHE", stale):
+            cache = asyncio.run(app_module.get_cached_search_results_async())
+
+        self.assertIs(cache, stale)
+        self.assertEqual(self.crawls, [])
+
+    def test_stops_waiting_on_a_dead_peer_and_crawls_when_nothing_is_cached(self):
+        self.backend.acquire_lock(app_module.CRAWL_LOCK_KEY, 10)
+
+        with patch.object(app_module, "CRAWL_LOCK_WAIT_SECONDS", 0.1):
+            cache = app_module.get_cached_search_results()
+
+        self.assertEqual([t["tag"] for t in cache["tournaments"]], ["#MINE"])
+        self.assertEqual(len(self.crawls), 1)
+
+    def test_lease_is_renewed_while_crawling(self):
+        peer_claims = []
+
+        def slow_crawl(progress_cb=None):
+            time.sleep(0.4)
+            peer_claims.append(self.backend.acquire_lock(app_module.CRAWL_LOCK_KEY, 10))
+            return [tournament("#MINE")]
+
+        with patch.object(app_module, "CRAWL_LOCK_TTL_SECONDS", 0.15), \
+                patch.object(app_module, "fetch_all_tournaments", slow_crawl):
+            app_module.get_cached_search_results()
+
+        self.assertEqual(peer_claims, [None])
+
+    def test_unreachable_backend_falls_back_to_a_local_crawl(self):
+        with patch.object(app_module, "_CACHE_BACKEND", app_module.RespCacheBackend("redis://127.0.0.1:1/0", 0.5)):
+            cache = app_module.get_cached_search_results()
+
+        self.assertEqual([t["tag"] for t in cache["tournaments"]], ["#MINE"])
+
+
+class SharedDetailCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.server = KVServerThread().__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.calls = []
+
+        async def fetch(session, tag, span=None):
+            self.calls.append(tag)
+            return tournament(tag, capacity=7)
+
+        for p in (patch.object(app_module, "_CACHE_BACKEND", app_module.make_cache_backend(self.server.url)),
+                  patch.object(app_module, "fetch_tournament_detail_async", fetch),
+                  patch.object(app_module, "_TAG_WATCH_HUB", app_module.TagWatchHub()),
+                  patch.dict(app_module._DETAIL_CACHE, clear=True)):
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_details_fetched_by_one_instance_serve_the_others(self):
+        detail = asyncio.run(app_module._get_cached_tournament_detail_async(None, "#A"))
+        app_module._DETAIL_CACHE.clear()  # another instance: empty local cache
+
+        again = asyncio.run(app_module._get_cached_tournament_detail_async(None, "#A"))
+        too_old = asyncio.run(app_module._get_cached_tournament_detail_async(None, "#A", max_age=-1))
+
+        self.assertEqual(again, detail)
+        self.assertEqual(too_old, detail)
+        self.assertEqual(self.calls, ["#A", "#A"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from collections import defaultdict
+
+import app as app_module
+from tools.bench_crawl import run_crawl_benchmark
+from tools.crawl_shards import merge_files, shard_result_to_json
+from tools.mock_royale_api import MockRoyaleAPI, generate_population
+
+
+def shard_result(tournaments, passes=0, retried=(), unresolved=(), saturated=(), **counters):
+    stats = app_module.make_search_stats()
+    stats.update(counters, verification_passes=passes)
+    return {
+        "tournaments": {t["tag"]: t for t in tournaments},
+        "stats": stats,
+        "retried": set(retried),
+        "unresolved": set(unresolved),
+        "saturated": set(saturated),
+    }
+
+
+def tournament(tag, mode_id):
+    return {"tag": tag, "name": tag, "gameMode": {"id": mode_id}}
+
+
+class ShardQueriesTests(unittest.TestCase):
+    def test_shards_partition_seed_queries_by_first_character(self):
+        queries = app_module.build_seed_queries()
+
+        shards = app_module.shard_queries(queries, 4)
+
+        self.assertEqual(sorted(q for shard in shards for q in shard), sorted(queries))
+        owners = defaultdict(set)
+        for index, shard in enumerate(shards):
+            for query in shard:
+                owners[query[0]].add(index)
+        self.assertTrue(all(len(o) == 1 for o in owners.values()))
+        sizes = [len(shard) for shard in shards]
+        self.assertLess(max(sizes) - min(sizes), 30)
+
+
+class MergeCrawlResultsTests(unittest.TestCase):
+    def test_merge_dedupes_tags_and_recomputes_derived_stats(self):
+        first = shard_result([tournament("#A", 1), tournament("#B", 2)], passes=1, retried={"ab"},
+                             queries_completed=10, drill_downs=2, rate_limits=3)
+        second = shard_result([tournament("#B", 2), tournament("#C", 2)], passes=2, unresolved={"zz"},
+                              saturated={"qqqq"}, queries_completed=5, api_errors=1)
+
+        tournaments, stats, unresolved, saturated = app_module.merge_crawl_results([first, second])
+
+        self.assertEqual(sorted(tournaments), ["#A", "#B", "#C"])
+        self.assertEqual(stats["queries_completed"], 15)
+        self.assertEqual(stats["drill_downs"], 2)
+        self.assertEqual(stats["rate_limits"], 3)
+        self.assertEqual(stats["api_errors"], 1)
+        self.assertEqual(stats["verification_passes"], 2)
+        self.assertEqual(stats["queries_retried"], 1)
+        self.assertEqual(stats["failed_queries"], 1)
+        self.assertEqual(stats["saturated_queries"], 1)
+        self.assertEqual(dict(stats["tournaments_by_mode"]), {"1": 1, "2": 2})
+        self.assertEqual(stats["search_confidence"], "low")
+
+    def test_merge_cli_reads_shard_files_and_reports_missing_shards(self):
+        results = [shard_result([tournament("#A", 1)], queries_completed=4),
+                   shard_result([tournament("#A", 1), tournament("#B", 1)], queries_completed=6)]
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for index, result in enumerate(results):
+                paths.append(os.path.join(tmp, f"shard-{index}.json"))
+                with open(paths[-1], "w", encoding="utf-8") as f:
+                    json.dump(shard_result_to_json(result, index, 3), f)
+
+            merged = merge_files(paths)
+
+        self.assertEqual(len(merged["tournaments"]), 2)
+        self.assertEqual(merged["stats"]["queries"], 10)
+        self.assertEqual(merged["stats"]["confidence"], "high")
+        self.assertEqual(merged["missingShards"], [2])
+
+
+def crawl(settings):
+    return asyncio.run(run_crawl_benchmark(MockRoyaleAPI(generate_population(400, seed=9)), settings))
+
+
+def search_requests_observed():
+    series = app_module.API_REQUEST_DURATION.export()
+    return sum(s["count"] for key, s in series.items() if key[0] == "search")
+
+
+class ShardedCrawlTests(unittest.TestCase):
+    def test_process_sharded_crawl_matches_single_process(self):
+        single = crawl({})
+        sharded = crawl({"CRAWL_SHARDS": 2})
+
+        self.assertEqual(sharded["found"], single["found"])
+        self.assertEqual(sharded["requests"], single["requests"])
+        self.assertEqual(sharded["drill_downs"], single["drill_downs"])
+        self.assertEqual(sharded["confidence"], single["confidence"])
+
+    def test_shard_pool_is_kept_and_worker_metrics_reach_the_parent(self):
+        before = search_requests_observed()
+
+        first = crawl({"CRAWL_SHARDS": 2})
+        pool = app_module._SHARD_POOL
+        second = crawl({"CRAWL_SHARDS": 2})
+
+        self.assertIs(app_module._SHARD_POOL, pool)
+        self.assertEqual(second["found"], first["found"])
+        self.assertEqual(search_requests_observed() - before, first["requests"] + second["requests"])
+
+
+if __name__ == "__main__":
+    unittest.main()
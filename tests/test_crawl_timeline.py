@@ -0,0 +1,72 @@
+import asyncio
+import os
+import unittest
+from collections import deque
+from unittest.mock import patch
+
+import app as app_module
+from tools.bench_crawl import crawler_environment, run_crawl_benchmark
+from tools.mock_royale_api import MockRoyaleAPI, generate_population
+
+
+class CrawlTimelineTests(unittest.TestCase):
+    def setUp(self):
+        app_module.app.config.update(TESTING=True)
+        self.client = app_module.app.test_client()
+        patcher = patch.object(app_module, "_CRAWL_TIMELINES", deque(maxlen=4))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_crawl_spans_split_http_and_backoff_time(self):
+        mock = MockRoyaleAPI(generate_population(200, seed=4), rate_limit_rate=0.02, seed=4)
+        with patch.dict(os.environ, {"CRAWL_TIMELINE": "1"}):
+            report = asyncio.run(run_crawl_benchmark(mock, {"SEARCH_WORKERS": 10}))
+
+        trace = app_module.export_chrome_trace(app_module._CRAWL_TIMELINES)
+        events = trace["traceEvents"]
+        queries = [e for e in events if e.get("cat") == "crawl" and "queue_wait_ms" in e.get("args", {})]
+        http = [e for e in events if e["name"] == "http"]
+        backoffs = [e for e in events if e["name"] == "backoff"]
+
+        self.assertEqual(events[0]["ph"], "M")
+        self.assertEqual(len(queries), report["requests"] - report["rate_limit_hits"])
+        self.assertEqual(len(http), report["requests"])
+        self.assertEqual(len(backoffs), report["rate_limit_hits"])
+        self.assertTrue({e["tid"] for e in queries} <= set(range(1, 11)))
+        self.assertTrue(any(e["name"] == "crawl" and e["tid"] == 0 for e in events))
+
+    def test_detail_batch_and_debug_endpoint(self):
+        population = generate_population(30, seed=2)
+        in_progress = [dict(t) for t in population if t["status"] == "inProgress"]
+        mock = MockRoyaleAPI(population)
+
+        async def run():
+            api_base = await mock.start()
+            try:
+                with crawler_environment(api_base, {"DETAIL_WORKERS": 4}):
+                    await app_module.fetch_tournament_details_batch_async(in_progress)
+            finally:
+                await mock.stop()
+
+        with patch.dict(os.environ, {"CRAWL_TIMELINE": "1"}), patch.dict(app_module._DETAIL_CACHE, clear=True):
+            asyncio.run(run())
+
+        with patch.object(app_module, "APP_PASSWORD", ""):
+            resp = self.client.get("/api/debug/trace?download=1")
+
+        events = resp.get_json()["traceEvents"]
+        tags = {e["name"] for e in events if e.get("cat") == "details" and "sem_wait_ms" in e.get("args", {})}
+        self.assertIn("attachment", resp.headers["Content-Disposition"])
+        self.assertEqual(tags, {t["tag"] for t in in_progress})
+        self.assertTrue({e["tid"] for e in events if e.get("cat") == "details"} <= set(range(1, 5)))
+
+    def test_endpoint_explains_how_to_enable_tracing(self):
+        with patch.object(app_module, "APP_PASSWORD", ""):
+            resp = self.client.get("/api/debug/trace")
+
+        self.assertEqual(resp.status_code, 404)
+        self.assertIn("CRAWL_TIMELINE", resp.get_json()["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
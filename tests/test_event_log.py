@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import app as app_module
+
+
+class TournamentEventLogTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "events.jsonl")
+        self.index_path = os.path.join(self.tmp.name, "events.idx")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_lookup_reads_only_indexed_events_across_rotation(self):
+        log = app_module.TournamentEventLog(self.path, self.index_path, max_bytes=300)
+        for i in range(6):
+            log.record_many([
+                ({"event": "crawl", "n": i}, ()),
+                ({"event": "seen", "tag": "#AAA", "n": i}, ("#AAA",)),
+                ({"event": "seen", "tag": "#BBB", "n": i}, ("bbb",)),
+            ])
+            self.assertTrue(log.flush())
+
+        self.assertTrue(os.path.exists(log.path + ".1"))
+        events = log.lookup("#aaa")
+        self.assertTrue(events)
+        self.assertTrue(all(e["tag"] == "#AAA" for e in events))
+        self.assertEqual(events[-1]["n"], 5)
+        self.assertEqual([e["n"] for e in events], sorted(e["n"] for e in events))
+        self.assertEqual(log.lookup("#BBB", limit=1), [{"event": "seen", "tag": "#BBB", "n": 5}])
+
+        # A fresh instance rebuilds the same view from the on-disk indexes.
+        reopened = app_module.TournamentEventLog(self.path, self.index_path, max_bytes=300)
+        self.assertEqual(reopened.lookup("#AAA"), events)
+
+    def test_lookup_merges_the_files_of_every_process(self):
+        log = app_module.TournamentEventLog(self.path, self.index_path)
+        log.record({"ts": "2026-01-01T00:00:02", "tag": "#AAA", "by": "self"}, tags=("#AAA",))
+        self.assertTrue(log.flush())
+        self.assertEqual(log.lookup("#AAA")[0]["by"], "self")
+
+        # Another worker appending its own pair of files (offsets into its own log).
+        other = app_module.TournamentEventLog(self.path, self.index_path)
+        other.path, other.index_path = (other._process_path(p, 99999999) for p in (self.path, self.index_path))
+        other.record({"ts": "2026-01-01T00:00:01", "tag": "#AAA", "by": "peer"}, tags=("#AAA",))
+        self.assertTrue(other.flush())
+
+        self.assertEqual([e["by"] for e in log.lookup("#AAA")], ["peer", "self"])
+
+    def test_full_queue_drops_and_counts_batches(self):
+        log = app_module.TournamentEventLog(self.path, self.index_path, queue_size=1)
+        log._thread = object()  # no writer draining the queue
+        log.record({"event": "a"}, tags=("#A",))
+        log.record_many([({"event": "b"}, ()), ({"event": "c"}, ())])
+
+        self.assertEqual(log.dropped, 2)
+
+    def test_crawls_log_only_new_tags_and_status_changes(self):
+        crawl = {"#A": {"tag": "#A", "status": "inPreparation"}, "#B": {"tag": "#B", "status": "inProgress"}}
+        with patch.object(app_module, "_LAST_SEEN_STATUS", {}):
+            first = app_module.seen_events("t1", crawl)
+            again = app_module.seen_events("t2", crawl)
+            changed = app_module.seen_events("t3", dict(crawl, **{"#A": {"tag": "#A", "status": "inProgress"}}))
+
+        self.assertEqual([tags for _, tags in first], [("#A",), ("#B",)])
+        self.assertEqual(again, [])
+        self.assertEqual([(event["ts"], event["status"]) for event, _ in changed], [("t3", "inProgress")])
+
+    def test_events_endpoint_rejects_a_non_numeric_limit(self):
+        app_module.app.config.update(TESTING=True)
+        with patch.object(app_module, "APP_PASSWORD", ""):
+            response = app_module.app.test_client().get("/api/events?tag=q2c&limit=abc")
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_events_endpoint_normalizes_tag(self):
+        log = app_module.TournamentEventLog(self.path, self.index_path)
+        log.record({"event": "match", "tag": "#Q2C"}, tags=("#Q2C",))
+        self.assertTrue(log.flush())
+
+        app_module.app.config.update(TESTING=True)
+        with patch.object(app_module, "APP_PASSWORD", ""), patch.object(app_module, "event_log", log):
+            data = app_module.app.test_client().get("/api/events?tag=q2c").get_json()
+
+        self.assertEqual(data["tag"], "#Q2C")
+        self.assertEqual(data["events"], [{"event": "match", "tag": "#Q2C"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
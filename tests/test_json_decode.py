@@ -0,0 +1,48 @@
+import asyncio
+import json
+import unittest
+
+import app as app_module
+from tools.bench_crawl import run_crawl_benchmark
+from tools.mock_royale_api import MockRoyaleAPI, generate_population
+
+
+class DecodeSearchPageTests(unittest.TestCase):
+    def test_items_are_trimmed_to_kept_fields(self):
+        body = json.dumps({
+            "items": [{
+                "tag": "#A", "name": "Çok", "status": "inPreparation", "capacity": 3,
+                "description": "x" * 500, "creatorTag": "#C", "gameMode": {"id": 1},
+            }],
+            "paging": {"cursors": {"after": "abc"}},
+        }).encode()
+
+        items, has_next = app_module.decode_search_page(body)
+
+        self.assertEqual(items, [{"tag": "#A", "name": "Çok", "status": "inPreparation",
+                                  "capacity": 3, "gameMode": {"id": 1}}])
+        self.assertTrue(has_next)
+
+    def test_last_page_has_no_next_cursor(self):
+        items, has_next = app_module.decode_search_page(b'{"items": [], "paging": {"cursors": {}}}')
+
+        self.assertEqual(items, [])
+        self.assertFalse(has_next)
+
+
+class DecodeModeCrawlTests(unittest.TestCase):
+    def test_every_decode_mode_finds_the_same_tournaments(self):
+        def crawl(mode):
+            mock = MockRoyaleAPI(generate_population(300, seed=11))
+            return asyncio.run(run_crawl_benchmark(mock, {"JSON_DECODE_MODE": mode}))
+
+        inline = crawl("inline")
+        for mode in ("thread", "process"):
+            with self.subTest(mode=mode):
+                report = crawl(mode)
+                self.assertEqual(report["coverage"], 1.0)
+                self.assertEqual(report["requests"], inline["requests"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from tools.loadtest import LoadStats, build_parser, percentile, run_scenarios
+
+
+class LoadStatsTests(unittest.TestCase):
+    def test_nearest_rank_percentiles(self):
+        values = [i / 1000 for i in range(1, 101)]
+
+        self.assertEqual(percentile(values, 50), 0.05)
+        self.assertEqual(percentile(values, 99), 0.099)
+        self.assertEqual(percentile([0.2], 95), 0.2)
+        self.assertIsNone(percentile([], 50))
+
+    def test_failures_count_as_errors_not_latency(self):
+        stats = LoadStats()
+        stats.record("tournaments", 0.1, 200)
+        stats.record("tournaments", 9.0, "timeout")
+        stats.in_flight_samples.extend([1, 3])
+
+        summary = stats.summary(duration=2.0)
+
+        self.assertEqual(summary["endpoints"]["tournaments"]["errors"], 1)
+        self.assertEqual(summary["endpoints"]["tournaments"]["p99_ms"], 100.0)
+        self.assertEqual(summary["endpoints"]["tournaments"]["throughput_rps"], 0.5)
+        self.assertEqual(summary["busy_threads"], {"samples": 2, "mean": 2.0, "max": 3})
+
+
+class LoadTestRunTests(unittest.TestCase):
+    def test_warm_scenario_against_gunicorn(self):
+        args = build_parser().parse_args([
+            "--tournaments", "150", "--latency-ms", "0", "--jitter-ms", "0",
+            "--browsers", "3", "--duration", "3", "--ramp", "0.5", "--poll-interval", "0.5",
+            "--workers", "1", "--threads", "4", "--scenarios", "warm",
+        ])
+
+        summary = run_scenarios(args)["warm"]
+
+        self.assertEqual(summary["endpoints"]["stream"]["requests"], 3)
+        self.assertEqual(summary["endpoints"]["stream"]["errors"], 0)
+        self.assertGreater(summary["endpoints"]["tournaments"]["requests"], 0)
+        self.assertEqual(summary["endpoints"]["tournaments"]["errors"], 0)
+        self.assertGreater(summary["busy_threads"]["samples"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import logging
+import os
+import queue
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import app as app_module
+
+
+class LogTailTests(unittest.TestCase):
+    def setUp(self):
+        app_module.app.config.update(TESTING=True)
+        self.client = app_module.app.test_client()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.tmp.name, "tournament_finder.log")
+        with open(self.log_file, "w", encoding="utf-8") as f:
+            for i in range(1, 201):
+                f.write(f"2026-07-14 10:00:00 INFO line {i} {'#TAG' if i % 50 == 0 else ''}\n")
+        with open(self.log_file + ".1", "w", encoding="utf-8") as f:
+            f.write("2026-07-13 09:00:00 INFO rotated #TAG émoji ✓\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_reverse_reader_handles_lines_spanning_blocks(self):
+        lines = list(app_module.iter_log_lines_reversed(self.log_file, block_size=7))
+        self.assertEqual(len(lines), 200)
+        self.assertIn("line 200", lines[0])
+        self.assertIn("line 1 ", lines[-1])
+
+    def test_tail_returns_last_lines_in_order(self):
+        with patch.object(app_module, "APP_PASSWORD", ""), patch.object(app_module, "LOG_FILE", self.log_file):
+            data = self.client.get("/api/logs?lines=3").get_json()
+
+        self.assertEqual([line.split(" INFO ")[1].strip() for line in data["logs"]],
+                         ["line 198", "line 199", "line 200 #TAG"])
+        self.assertTrue(data["more"])
+
+    def test_search_stops_early_and_optionally_reads_rotated_files(self):
+        with patch.object(app_module, "APP_PASSWORD", ""), patch.object(app_module, "LOG_FILE", self.log_file):
+            limited = self.client.get("/api/logs?search=%23tag&lines=2").get_json()
+            everything = self.client.get("/api/logs?search=%23tag&rotated=1").get_json()
+
+        self.assertEqual(limited["total_matches"], 2)
+        self.assertTrue(limited["more"])
+        self.assertIn("line 200", limited["logs"][-1])
+        self.assertEqual(everything["total_matches"], 5)
+        self.assertFalse(everything["more"])
+        self.assertIn("rotated #TAG émoji ✓", everything["logs"][0])
+
+
+class QueueLoggingTests(unittest.TestCase):
+    def test_full_queue_drops_records_instead_of_blocking(self):
+        handler = app_module.DroppingQueueHandler(queue.Queue(maxsize=1))
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "msg %s", ("x",), None)
+        handler.handle(record)
+        handler.handle(record)
+
+        self.assertEqual(handler.queue.qsize(), 1)
+        self.assertEqual(handler.dropped, 1)
+        self.assertEqual(handler.queue.get_nowait().getMessage(), "msg x")
+
+    def test_drops_from_many_threads_are_all_counted(self):
+        handler = app_module.DroppingQueueHandler(queue.Queue(maxsize=1))
+        handler.queue.put_nowait(None)
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "msg", (), None)
+
+        def overflow():
+            for _ in range(2000):
+                handler.enqueue(record)
+
+        threads = [threading.Thread(target=overflow) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(handler.dropped, 16000)
+
+    def test_module_logger_writes_through_the_queue(self):
+        self.assertIsInstance(app_module.logger.handlers[0], app_module.DroppingQueueHandler)
+
+
+if __name__ == "__main__":
+    unittest.main()
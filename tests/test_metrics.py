@@ -0,0 +1,64 @@
+import os
+import unittest
+from unittest.mock import patch
+
+import app as app_module
+
+
+class MetricTypeTests(unittest.TestCase):
+    def test_histogram_buckets_are_cumulative(self):
+        hist = app_module.Histogram("t_seconds", "test", buckets=(1, 5), label_names=("phase",))
+        for value in (0.5, 2, 10):
+            hist.observe(value, phase="crawl")
+
+        lines = hist.render()
+        self.assertIn('t_seconds_bucket{phase="crawl",le="1"} 1', lines)
+        self.assertIn('t_seconds_bucket{phase="crawl",le="5"} 2', lines)
+        self.assertIn('t_seconds_bucket{phase="crawl",le="+Inf"} 3', lines)
+        self.assertIn('t_seconds_sum{phase="crawl"} 12.5', lines)
+        self.assertIn('t_seconds_count{phase="crawl"} 3', lines)
+
+    def test_counter_escapes_label_values(self):
+        counter = app_module.Counter("t_total", "test", label_names=("route",))
+        counter.inc(route='a"b')
+        counter.inc(2, route='a"b')
+
+        self.assertIn('t_total{route="a\\"b"} 3', counter.render())
+
+
+class MetricsEndpointTests(unittest.TestCase):
+    def setUp(self):
+        app_module.app.config.update(TESTING=True)
+        self.client = app_module.app.test_client()
+
+    def test_exposes_route_latency_and_cache_metrics(self):
+        with patch.object(app_module, "APP_PASSWORD", ""), patch.dict(os.environ, {"METRICS_TOKEN": ""}):
+            self.client.get("/api/game-modes")
+            app_module.get_fresh_search_cache()
+            resp = self.client.get("/metrics")
+
+        body = resp.get_data(as_text=True)
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.mimetype.startswith("text/plain"))
+        self.assertIn('crfinder_http_request_duration_seconds_count{route="/api/game-modes",method="GET",status="200"}', body)
+        self.assertIn('crfinder_cache_requests_total{cache="search",result="miss"}', body)
+        self.assertIn("crfinder_http_requests_in_flight 1", body)
+        self.assertIn("# TYPE crfinder_log_records_dropped_total counter", body)
+
+    def test_bearer_token_replaces_session_auth(self):
+        with patch.object(app_module, "APP_PASSWORD", "secret"), patch.dict(os.environ, {"METRICS_TOKEN": "tok"}):
+            denied = self.client.get("/metrics")
+            allowed = self.client.get("/metrics", headers={"Authorization": "Bearer tok"})
+
+        self.assertEqual(denied.status_code, 401)
+        self.assertEqual(allowed.status_code, 200)
+
+    def test_non_ascii_authorization_header_is_rejected_not_an_error(self):
+        with patch.dict(os.environ, {"METRICS_TOKEN": "tok"}):
+            resp = self.client.get("/metrics", headers={"Authorization": "Bearer tök"})
+
+        self.assertEqual(resp.status_code, 401)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import asyncio
+import glob
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from tools.bench_crawl import run_crawl_benchmark
+from tools.crawl_tuner import TraceProfile, pick_best, tune
+from tools.mock_royale_api import MockRoyaleAPI, generate_population
+
+
+def tournament(tag, name):
+    return {"tag": tag, "name": name, "status": "inPreparation", "gameMode": {"id": 72000009}}
+
+
+class MockRoyaleApiTests(unittest.TestCase):
+    def test_word_prefix_search_without_accent_folding(self):
+        mock = MockRoyaleAPI([
+            tournament("#A", "Çok Güzel"),
+            tournament("#B", "Cok Fun"),
+            tournament("#C", "super COKE"),
+        ])
+
+        self.assertEqual([t["tag"] for t in mock.search("cok")], ["#B", "#C"])
+        self.assertEqual([t["tag"] for t in mock.search("çok")], ["#A"])
+        self.assertEqual(mock.search("uper"), [])
+
+    def test_results_are_capped_at_one_hundred(self):
+        mock = MockRoyaleAPI([tournament(f"#{i}", f"open {i}") for i in range(250)])
+
+        self.assertEqual(len(mock.search("open", limit=500)), 100)
+        self.assertEqual(len(mock.search("open", limit=10)), 10)
+
+    def test_population_is_reproducible_from_seed(self):
+        first = generate_population(50, seed=7)
+        second = generate_population(50, seed=7)
+
+        self.assertEqual([t["name"] for t in first], [t["name"] for t in second])
+        self.assertEqual(len({t["tag"] for t in first}), 50)
+
+
+class CrawlBenchmarkTests(unittest.TestCase):
+    def test_real_crawler_finds_the_whole_mock_population(self):
+        mock = MockRoyaleAPI(generate_population(400, seed=3))
+
+        report = asyncio.run(run_crawl_benchmark(mock, {"SEARCH_WORKERS": 25}))
+
+        self.assertEqual(report["actual"], 400)
+        self.assertEqual(report["coverage"], 1.0)
+        self.assertEqual(report["rate_limit_hits"], 0)
+        self.assertGreater(report["requests"], 700)
+
+
+    def test_drill_down_follows_truncation_not_a_fixed_threshold(self):
+        def crawl(settings):
+            return asyncio.run(run_crawl_benchmark(MockRoyaleAPI(generate_population(1500, seed=8)), settings))
+
+        default = crawl({})
+        eager = crawl({"QUERY_DRILLDOWN_THRESHOLD": 20})
+
+        self.assertEqual(default["coverage"], 1.0)
+        self.assertEqual(eager["coverage"], 1.0)
+        self.assertLess(default["requests"], eager["requests"])
+        self.assertLess(default["drill_downs"], eager["drill_downs"])
+
+
+class CrawlTunerTests(unittest.TestCase):
+    def test_recorded_trace_replays_and_yields_a_recommendation(self):
+        with tempfile.TemporaryDirectory() as trace_dir:
+            with patch.dict(os.environ, {"CRAWL_TRACE_DIR": trace_dir}):
+                asyncio.run(run_crawl_benchmark(MockRoyaleAPI(generate_population(300, seed=5))))
+            traces = glob.glob(os.path.join(trace_dir, "crawl-*.jsonl.gz"))
+            self.assertEqual(len(traces), 1)
+            profile = TraceProfile(traces)
+
+        self.assertEqual(len(profile.population), 300)
+        self.assertEqual(profile.rate_limit_rate, 0.0)
+
+        results = asyncio.run(tune(profile, {"QUERY_DRILLDOWN_THRESHOLD": [20, 100]}))
+        best = pick_best(results, target_coverage=1.0)
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(best["coverage"], 1.0)
+        self.assertEqual(best["requests"], min(r["requests"] for r in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import unittest
+from collections import deque
+from unittest.mock import patch
+
+import app as app_module
+
+
+class RouteProfilingTests(unittest.TestCase):
+    def setUp(self):
+        app_module.app.config.update(TESTING=True)
+        self.client = app_module.app.test_client()
+        patcher = patch.object(app_module, "_PROFILES", deque(maxlen=5))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        cache = {"tournaments": [], "fetchedAt": "2026-07-14T10:00:00+00:00", "stats": {}}
+        for target, value in (("has_api_key", lambda: True), ("get_fresh_search_cache", lambda: cache)):
+            patcher = patch.object(app_module, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_unprofiled_by_default(self):
+        with patch.object(app_module, "APP_PASSWORD", ""), patch.dict(os.environ, {"PROFILE_ROUTES": ""}):
+            self.client.get("/api/tournaments")
+            data = self.client.get("/api/debug/profiles").get_json()
+
+        self.assertEqual(data["profiles"], [])
+
+    def test_header_profiles_one_request_and_keeps_hot_functions(self):
+        with patch.object(app_module, "APP_PASSWORD", ""), patch.dict(os.environ, {"PROFILE_ROUTES": ""}):
+            self.client.get("/api/tournaments", headers={"X-Profile": "1"})
+            self.client.get("/api/tournaments")
+            data = self.client.get("/api/debug/profiles?route=tournaments").get_json()
+
+        self.assertEqual(len(data["profiles"]), 1)
+        profile = data["profiles"][0]
+        self.assertEqual(profile["route"], "tournaments")
+        self.assertLessEqual(len(profile["top"]), app_module.PROFILE_TOP_N)
+        own = [row["ownMs"] for row in profile["top"]]
+        self.assertEqual(own, sorted(own, reverse=True))
+        self.assertEqual(set(profile["top"][0]), {"function", "file", "line", "calls", "ownMs", "cumulativeMs"})
+
+    def test_env_selects_routes_by_name(self):
+        with patch.object(app_module, "APP_PASSWORD", ""), patch.dict(os.environ, {"PROFILE_ROUTES": "search"}):
+            self.client.get("/api/tournaments")
+            self.client.get("/api/tournaments/search")
+            routes = [p["route"] for p in self.client.get("/api/debug/profiles").get_json()["profiles"]]
+
+        self.assertEqual(routes, ["search"])
+
+    def test_header_ignored_without_session_when_password_set(self):
+        with app_module.app.test_request_context(headers={"X-Profile": "1"}):
+            with patch.object(app_module, "APP_PASSWORD", "secret"):
+                self.assertFalse(app_module.profiling_requested("tournaments"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+
+const { createModel, createSearchIndex, foldText, normalizeQuery, matchesFilters } = require('../static/results-model.js');
+
+const NOW = Date.parse('2026-07-14T10:05:00.000Z');
+
+function tournament(tag, overrides = {}) {
+  return {
+    tag,
+    name: `Cup ${tag}`,
+    type: 'open',
+    status: 'inPreparation',
+    createdTime: '20260714T100000.000Z',
+    preparationDuration: 600,
+    duration: 1800,
+    players: 10,
+    maxPlayers: 50,
+    levelCap: 11,
+    gameModeId: 72000009,
+    gameModeName: 'Classic',
+    ...overrides,
+  };
+}
+
+test('query returns only the requested slice with full counts', () => {
+  const model = createModel();
+  model.setData(Array.from({ length: 50 }, (_, i) => tournament(`#T${i}`, { players: i })));
+
+  const view = model.query({ sort: { by: 'players', dir: 'desc' }, offset: 5, limit: 10 }, NOW);
+
+  assert.equal(view.items.length, 10);
+  assert.equal(view.matched, 50);
+  assert.equal(view.total, 50);
+  assert.deepEqual(view.items.map(t => t.players), [44, 43, 42, 41, 40, 39, 38, 37, 36, 35]);
+  assert.equal(view.items[0].effectiveStatus, 'inPreparation');
+  assert.equal(view.items[0].remainingSec, 300);
+});
+
+test('ended tournaments are excluded from results and counts', () => {
+  const model = createModel();
+  model.setData([
+    tournament('#LIVE', { status: 'inProgress', startedTime: '20260714T100100.000Z' }),
+    tournament('#OLD', { status: 'ended', endedTime: '20260714T090000.000Z' }),
+  ]);
+
+  const view = model.query({}, NOW);
+
+  assert.deepEqual(view.items.map(t => t.tag), ['#LIVE']);
+  assert.equal(view.counts.all, 1);
+});
+
+test('filters accept Sets or arrays and report saved view counts', () => {
+  const model = createModel();
+  model.setData([
+    tournament('#A', { levelCap: 15, type: 'passwordProtected' }),
+    tournament('#B', { levelCap: 11, name: 'Çok Güzel' }),
+    tournament('#C', { levelCap: 15, gameModeId: 1 }),
+  ]);
+
+  const view = model.query({
+    favorites: ['#B', '#C'],
+    filters: { levelCaps: new Set([15]), modes: ['72000009'] },
+  }, NOW);
+
+  assert.deepEqual(view.items.map(t => t.tag), ['#A']);
+  assert.deepEqual(view.counts, { all: 3, favorites: 2, 'high-lvl': 2 });
+  assert.deepEqual(model.query({ search: 'güz' }, NOW).items.map(t => t.tag), ['#B']);
+  assert.equal(model.query({ filters: { access: 'open' } }, NOW).matched, 2);
+});
+
+test('selected tag is located in the full match list, not just the slice', () => {
+  const model = createModel();
+  model.setData(Array.from({ length: 30 }, (_, i) => tournament(`#T${i}`, { players: i })));
+
+  const view = model.query({ sort: { by: 'players', dir: 'asc' }, limit: 5, selectedTag: '#T20' }, NOW);
+
+  assert.equal(view.selectedIndex, 20);
+  assert.equal(view.firstTag, '#T0');
+  assert.equal(model.query({ quick: 'live', selectedTag: '#T20' }, NOW).selectedIndex, -1);
+});
+
+test('matchesFilters works on a normalized query', () => {
+  const q = normalizeQuery({ quick: 'prep', filters: { minPlayers: 5 } });
+
+  assert.equal(matchesFilters({ effectiveStatus: 'inPreparation', players: 6 }, q), true);
+  assert.equal(matchesFilters({ effectiveStatus: 'inPreparation', players: 4 }, q), false);
+  assert.equal(matchesFilters({ effectiveStatus: 'inProgress', players: 6 }, q), false);
+});
+
+test('a window past the end of a shrunken list snaps back to the last rows', () => {
+  const model = createModel();
+  model.setData(Array.from({ length: 12 }, (_, i) => tournament(`#T${i}`, { players: i })));
+
+  const view = model.query({ sort: { by: 'players', dir: 'asc' }, offset: 40, limit: 5 }, NOW);
+
+  assert.equal(view.offset, 7);
+  assert.deepEqual(view.items.map(t => t.players), [7, 8, 9, 10, 11]);
+});
+
+test('search folds accents on both sides and matches substrings anywhere', () => {
+  const model = createModel();
+  model.setData([
+    tournament('#CK1', { name: 'Çok Güzel Turnuva' }),
+    tournament('#CK2', { name: 'Cok fun' }),
+    tournament('#PL', { name: 'Łódź Cup', gameModeName: 'Triple Elixir' }),
+  ]);
+  const search = text => model.query({ search: text }, NOW).items.map(t => t.tag).sort();
+
+  assert.deepEqual(search('cok'), ['#CK1', '#CK2']);
+  assert.deepEqual(search('ÇOK'), ['#CK1', '#CK2']);
+  assert.deepEqual(search('guzel tur'), ['#CK1']);
+  assert.deepEqual(search('lodz'), ['#PL']);
+  assert.deepEqual(search('elixir'), ['#PL']);
+  assert.deepEqual(search('#ck'), ['#CK1', '#CK2']);
+  assert.deepEqual(search('z'), ['#CK1', '#PL']);
+});
+
+test('index confirms long queries instead of trusting scattered trigrams', () => {
+  const index = createSearchIndex([{ name: 'abc xbcd' }, { name: 'zabcd' }]);
+
+  assert.deepEqual(index.lookup(foldText('ABCD')), [1]);
+  assert.deepEqual(index.lookup('abc'), [0, 1]);
+  assert.deepEqual(index.lookup('qqqq'), []);
+  assert.equal(index.lookup(''), null);
+});
+
+test('patch replaces tournaments by tag and reindexes renamed ones', () => {
+  const model = createModel();
+  model.setData([tournament('#A', { players: 1 }), tournament('#B')]);
+
+  model.patch([tournament('#A', { players: 40 }), tournament('#UNKNOWN')]);
+  assert.equal(model.query({ search: '#a' }, NOW).items[0].players, 40);
+  assert.equal(model.query({}, NOW).matched, 2);
+
+  model.patch([tournament('#B', { name: 'Renamed Gauntlet' })]);
+  assert.deepEqual(model.query({ search: 'gauntlet' }, NOW).items.map(t => t.tag), ['#B']);
+});
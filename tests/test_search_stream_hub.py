@@ -0,0 +1,121 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+import app as app_module
+
+
+class SearchStreamHubTests(unittest.TestCase):
+    def test_late_joiner_shares_job_and_gets_latest_progress(self):
+        hub = app_module.SearchStreamHub()
+        started = []
+        first, second = [], []
+
+        hub.subscribe(first.append, started.append)
+        hub.publish("progress", {"phase": "crawl", "completed": 1})
+        hub.publish("progress", {"phase": "crawl", "completed": 2})
+        hub.subscribe(second.append, started.append)
+        hub.publish("done", {"total": 0})
+        hub.finish()
+
+        self.assertEqual(len(started), 1)
+        self.assertEqual(len(first), 4)
+        self.assertIsNone(first[-1])
+        self.assertEqual(len(second), 3)
+        self.assertIn('"completed":2', second[0])
+        self.assertTrue(second[1].startswith("event: done"))
+        self.assertIsNone(second[-1])
+
+    def test_last_unsubscribe_stops_job_and_next_subscribe_restarts(self):
+        hub = app_module.SearchStreamHub()
+        stop_events = []
+        first, second = [], []
+
+        hub.subscribe(first.append, stop_events.append)
+        hub.unsubscribe(first.append)
+        self.assertTrue(stop_events[0].is_set())
+
+        hub.finish()
+        hub.subscribe(second.append, stop_events.append)
+        self.assertEqual(len(stop_events), 2)
+        self.assertFalse(stop_events[1].is_set())
+
+    def test_joiner_of_a_stopping_job_gets_a_fresh_job(self):
+        hub = app_module.SearchStreamHub()
+        jobs = []
+        leaver, joiner = [], []
+
+        hub.subscribe(leaver.append, jobs.append)
+        hub.unsubscribe(leaver.append)
+        hub.subscribe(joiner.append, jobs.append)
+        # The stopped job winding down must not reach the new subscriber.
+        hub.publish("done", {"total": 0}, job=jobs[0])
+        hub.finish(job=jobs[0])
+        hub.publish("done", {"total": 1}, job=jobs[1])
+        hub.finish(job=jobs[1])
+
+        self.assertEqual(len(jobs), 2)
+        self.assertFalse(jobs[1].is_set())
+        self.assertEqual(len(joiner), 2)
+        self.assertIn('"total":1', joiner[0])
+        self.assertIsNone(joiner[-1])
+
+    def test_forced_joiner_supersedes_an_unforced_job(self):
+        hub = app_module.SearchStreamHub()
+        jobs = []
+        first, second, third = [], [], []
+
+        hub.subscribe(first.append, jobs.append)
+        hub.subscribe(second.append, jobs.append, force=True)
+        hub.subscribe(third.append, jobs.append, force=True)
+        hub.publish("done", {"total": 2}, job=jobs[1])
+
+        self.assertEqual(len(jobs), 2)
+        self.assertTrue(jobs[0].is_set())
+        self.assertTrue(all(len(sink) == 1 for sink in (first, second, third)))
+
+
+class CrawlProgressFanOutTests(unittest.TestCase):
+    def tearDown(self):
+        with app_module._SEARCH_CACHE_COND:
+            app_module._SEARCH_CACHE = None
+            app_module._SEARCH_FETCH_IN_PROGRESS = False
+            app_module._SEARCH_PROGRESS_LISTENERS.clear()
+
+    def test_waiting_caller_receives_live_crawl_progress(self):
+        crawl_started = threading.Event()
+        waiter_attached = threading.Event()
+        release_crawl = threading.Event()
+        waiter_events = []
+
+        def fake_fetch(progress_cb=None, stop_event=None):
+            crawl_started.set()
+            self.assertTrue(waiter_attached.wait(timeout=2))
+            progress_cb({"phase": "crawl", "completed": 5})
+            self.assertTrue(release_crawl.wait(timeout=2))
+            return [{"tag": "#TEST"}]
+
+        def waiter_cb(payload):
+            waiter_events.append(payload)
+            waiter_attached.set()
+
+        with patch.object(app_module, "fetch_all_tournaments", side_effect=fake_fetch):
+            crawler = threading.Thread(target=app_module.get_cached_search_results)
+            crawler.start()
+            self.assertTrue(crawl_started.wait(timeout=2))
+            waiter = threading.Thread(
+                target=app_module.get_cached_search_results,
+                kwargs={"progress_cb": waiter_cb},
+            )
+            waiter.start()
+            self.assertTrue(waiter_attached.wait(timeout=2))
+            release_crawl.set()
+            crawler.join(timeout=2)
+            waiter.join(timeout=2)
+
+        self.assertEqual([e["phase"] for e in waiter_events], ["wait", "crawl"])
+        self.assertEqual(app_module._SEARCH_PROGRESS_LISTENERS, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
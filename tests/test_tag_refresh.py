@@ -0,0 +1,132 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import app as app_module
+
+
+def tournament(tag, status="inPreparation", capacity=3):
+    return {"tag": tag, "name": f"Cup {tag}", "status": status, "capacity": capacity, "maxCapacity": 50,
+            "gameMode": {"id": 72000009}}
+
+
+class FakeDetailApi:
+    def __init__(self, details):
+        self.details = details
+        self.calls = []
+
+    async def __call__(self, session, tag, span=None):
+        self.calls.append(tag)
+        await asyncio.sleep(0.05)
+        return self.details.get(tag)
+
+
+class SharedLocalBackend(app_module.LocalCacheBackend):
+    """The in-process backend, treated as shared across instances."""
+
+    shared = True
+
+
+class RefreshTournamentsTests(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeDetailApi({"#A": tournament("#A", "inProgress", 9), "#B": tournament("#B")})
+        now = time.time()
+        self.cache = {"tournaments": [tournament("#A"), tournament("#C")], "fetchedAt": "crawl", "fetched_at_ts": now,
+                      "expires_at_ts": now + 180, "revised_at_ts": now, "stats": {}}
+        for p in (patch.object(app_module, "fetch_tournament_detail_async", self.api),
+                  patch.object(app_module, "_SEARCH_CACHE", self.cache),
+                  patch.dict(app_module._DETAIL_CACHE, clear=True)):
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_concurrent_refreshes_of_a_tag_share_one_request(self):
+        async def both():
+            return await asyncio.gather(app_module.refresh_tournaments_async(["#A", "#B", "#GONE"]),
+                                        app_module.refresh_tournaments_async(["#A"]))
+
+        (merged, unmerged, missing), (again, _, _) = asyncio.run(both())
+
+        self.assertEqual(sorted(self.api.calls), ["#A", "#B", "#GONE"])
+        self.assertEqual([t["tag"] for t in merged], ["#A"])
+        self.assertEqual([t["tag"] for t in unmerged], ["#B"])
+        self.assertEqual(missing, ["#GONE"])
+        self.assertEqual(again[0]["capacity"], 9)
+        self.assertEqual(app_module._DETAIL_INFLIGHT, {})
+
+    def test_recent_details_are_reused_and_older_ones_refetched(self):
+        now = time.time()
+        app_module._DETAIL_CACHE["#A"] = {"fetched_at": now, "expires_at": now + 300, "detail": tournament("#A")}
+        app_module._DETAIL_CACHE["#B"] = {"fetched_at": now - 60, "expires_at": now + 300, "detail": tournament("#B")}
+
+        asyncio.run(app_module.refresh_tournaments_async(["#A", "#B"], max_age=10))
+
+        self.assertEqual(self.api.calls, ["#B"])
+
+    def test_details_merge_into_the_cached_crawl(self):
+        asyncio.run(app_module.refresh_tournaments_async(["#A", "#B"]))
+
+        tournaments = app_module._SEARCH_CACHE["tournaments"]
+        self.assertEqual([t["tag"] for t in tournaments], ["#A", "#C"])
+        self.assertEqual((tournaments[0]["status"], tournaments[0]["capacity"]), ("inProgress", 9))
+        self.assertEqual(self.cache["tournaments"][0]["capacity"], 3)
+
+    def test_merged_crawl_is_shared_and_stored(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        store = app_module.TournamentStore(os.path.join(tmp.name, "tournaments.db"))
+        self.addCleanup(lambda: store._connect().close())
+        with patch.object(app_module, "_TOURNAMENT_STORE", store), \
+                patch.object(app_module, "_CACHE_BACKEND", SharedLocalBackend()), \
+                patch.object(app_module, "_TAG_WATCH_HUB", app_module.TagWatchHub()):
+            app_module._store_search_cache([tournament("#A"), tournament("#C")], 180)
+            asyncio.run(app_module.refresh_tournaments_async(["#A", "#B"]))
+            shared = app_module.load_shared_search_cache(180, 0)
+
+        self.assertEqual([(t["tag"], t["capacity"]) for t in shared["tournaments"]], [("#A", 9), ("#C", 3)])
+        self.assertEqual([(t["tag"], t["capacity"]) for t in store.query({})], [("#A", 9), ("#C", 3)])
+        self.assertEqual([p["players"] for p in store.history("#A")], [9])
+
+    def test_peers_adopt_a_refresh_of_the_crawl_they_hold(self):
+        backend = SharedLocalBackend()
+        with patch.object(app_module, "_CACHE_BACKEND", backend), \
+                patch.object(app_module, "_TAG_WATCH_HUB", app_module.TagWatchHub()):
+            app_module._share_search_cache(self.cache, 180)
+            asyncio.run(app_module.refresh_tournaments_async(["#A"]))
+            refreshed = app_module._SEARCH_CACHE
+            app_module._SEARCH_CACHE = self.cache  # a peer still holding the crawl
+            app_module.sync_shared_watch_states(["#A"])
+            adopted = app_module._SEARCH_CACHE
+
+        self.assertGreater(refreshed["revised_at_ts"], self.cache["revised_at_ts"])
+        self.assertEqual(float(backend.get(app_module.SEARCH_CACHE_STAMP_KEY)), refreshed["revised_at_ts"])
+        self.assertEqual(adopted["tournaments"][0]["capacity"], 9)
+        self.assertEqual(adopted["fetched_at_ts"], self.cache["fetched_at_ts"])
+
+
+class RefreshRouteTests(unittest.TestCase):
+    def setUp(self):
+        app_module.app.config.update(TESTING=True)
+        self.client = app_module.app.test_client()
+
+    def test_route_returns_only_the_requested_records(self):
+        api = FakeDetailApi({"#A": tournament("#A", "inProgress", 9)})
+        with patch.object(app_module, "APP_PASSWORD", ""), \
+                patch.object(app_module, "has_api_key", return_value=True), \
+                patch.object(app_module, "fetch_tournament_detail_async", api), \
+                patch.object(app_module, "_SEARCH_CACHE", None), \
+                patch.dict(app_module._DETAIL_CACHE, clear=True):
+            response = self.client.post("/api/tournaments/refresh", json={"tags": ["a", "zz"]})
+            empty = self.client.post("/api/tournaments/refresh", json={"tags": []})
+
+        data = response.get_json()
+        self.assertEqual([(t["tag"], t["players"], t["gameModeId"]) for t in data["tournaments"]],
+                         [("#A", 9, "72000009")])
+        self.assertEqual(data["missing"], ["#ZZ"])
+        self.assertEqual(empty.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+import json
+import time
+import unittest
+from unittest.mock import patch
+
+import app as app_module
+
+
+def tournament(tag, status="inPreparation", capacity=3):
+    return {"tag": tag, "name": f"Cup {tag}", "status": status, "capacity": capacity, "maxCapacity": 50}
+
+
+def parse_events(messages):
+    events = []
+    for message in messages:
+        event_line, data_line = message.strip().split("\n")
+        events.append((event_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))))
+    return events
+
+
+class TagWatchHubTests(unittest.TestCase):
+    def setUp(self):
+        self.hub = app_module.TagWatchHub()
+        self.cache = {"tournaments": [tournament("#A"), tournament("#B")]}
+
+    def subscribe(self, tags):
+        received = []
+        with patch.object(app_module, "_SEARCH_CACHE", self.cache):
+            self.hub.subscribe(received.append, tags)
+        return received
+
+    def test_subscriber_gets_snapshot_then_only_changed_watched_tags(self):
+        received = self.subscribe(["#A", "#C"])
+
+        self.hub.publish([tournament("#A"), tournament("#B", capacity=9)])
+        self.hub.publish([tournament("#A", status="inProgress", capacity=7), tournament("#C")])
+
+        events = parse_events(received)
+        self.assertEqual(events[0], ("snapshot", {"tournaments": [app_module.tournament_watch_state(tournament("#A"))]}))
+        self.assertEqual(len(events), 2)
+        name, payload = events[1]
+        self.assertEqual(name, "update")
+        self.assertEqual([(t["tag"], t["status"], t["players"]) for t in payload["tournaments"]],
+                         [("#A", "inProgress", 7), ("#C", "inPreparation", 3)])
+
+    def test_detail_cache_overrides_the_crawl_snapshot(self):
+        detail = tournament("#A", status="inProgress", capacity=20)
+        with patch.dict(app_module._DETAIL_CACHE, {"#A": {"expires_at": 0, "detail": detail}}):
+            received = self.subscribe(["#A"])
+
+        self.assertEqual(parse_events(received)[0][1]["tournaments"][0]["players"], 20)
+
+    def test_crawl_items_without_times_keep_the_times_a_detail_pushed(self):
+        received = self.subscribe(["#A"])
+        detail = dict(tournament("#A", status="inProgress"), startedTime="20260101T000000.000Z")
+
+        self.hub.publish([detail])
+        self.hub.publish([tournament("#A", status="inProgress", capacity=5)])
+
+        events = parse_events(received)
+        self.assertEqual(len(events), 3)
+        self.assertEqual(events[2][1]["tournaments"][0]["players"], 5)
+        self.assertEqual(events[2][1]["tournaments"][0]["startedTime"], "20260101T000000.000Z")
+
+    def test_detail_cache_hits_are_republished(self):
+        detail = tournament("#A", status="inProgress", capacity=20)
+        now = time.time()
+        entry = {"fetched_at": now, "expires_at": now + 60, "detail": detail}
+        with patch.object(app_module, "_TAG_WATCH_HUB", self.hub), \
+                patch.dict(app_module._DETAIL_CACHE, {"#A": entry}):
+            received = self.subscribe(["#A"])
+            self.hub.publish([tournament("#A")])
+            result = app_module.asyncio.run(app_module._get_cached_tournament_detail_async(None, "#A"))
+
+        self.assertIs(result, detail)
+        self.assertEqual(parse_events(received)[-1][1]["tournaments"][0]["players"], 20)
+
+    def test_unsubscribe_forgets_tags_nobody_watches(self):
+        first = self.subscribe(["#A"])
+        second = self.subscribe(["#A", "#B"])
+        self.hub.unsubscribe(second.append)
+
+        self.hub.publish([tournament("#A", capacity=4), tournament("#B", capacity=4)])
+
+        self.assertEqual(self.hub.watched_tags(), ["#A"])
+        self.assertEqual(len(parse_events(second)), 1)
+        self.assertEqual(parse_events(first)[-1][1]["tournaments"][0]["tag"], "#A")
+
+    def test_tags_are_normalized_deduped_and_capped(self):
+        with patch.object(app_module, "FAVORITES_STREAM_MAX_TAGS", 2):
+            self.assertEqual(app_module.parse_watch_tags(" abc,#ABC, , def,ghi"), ["#ABC", "#DEF"])
+
+
+class SharedLocalBackend(app_module.LocalCacheBackend):
+    """The in-process backend, treated as shared across instances."""
+
+    shared = True
+
+
+class SharedWatchStateTests(unittest.TestCase):
+    def test_watchers_pick_up_crawls_and_details_from_other_processes(self):
+        backend = SharedLocalBackend()
+        hub = app_module.TagWatchHub()
+        local = {"tournaments": [tournament("#A")], "fetched_at_ts": 1000.0, "revised_at_ts": 1000.0}
+        with patch.object(app_module, "_CACHE_BACKEND", backend), \
+                patch.object(app_module, "_TAG_WATCH_HUB", hub), \
+                patch.object(app_module, "_SEARCH_CACHE", local), \
+                patch.dict(app_module._DETAIL_CACHE, clear=True):
+            received = []
+            hub.subscribe(received.append, ["#A", "#B"])
+            app_module._share_search_cache({"tournaments": [tournament("#A", capacity=9)], "fetchedAt": "peer",
+                                            "fetched_at_ts": 2000.0, "revised_at_ts": 2000.0, "stats": {}}, 180)
+            backend.set(app_module.DETAIL_CACHE_KEY_PREFIX + "#B", json.dumps(
+                {"fetched_at": time.time(), "detail": tournament("#B", status="inProgress")}).encode(), 300)
+
+            app_module.sync_shared_watch_states(["#A", "#B"])
+            app_module.sync_shared_watch_states(["#A", "#B"])
+            adopted = app_module._SEARCH_CACHE
+
+        updates = [payload["tournaments"][0] for name, payload in parse_events(received)[1:]]
+        self.assertEqual([(t["tag"], t["status"], t["players"]) for t in updates],
+                         [("#A", "inPreparation", 9), ("#B", "inProgress", 3)])
+        self.assertEqual(adopted["fetched_at_ts"], 2000.0)
+
+
+class FavoritesStreamRouteTests(unittest.TestCase):
+    def setUp(self):
+        app_module.app.config.update(TESTING=True)
+        self.client = app_module.app.test_client()
+
+    def test_stream_pushes_crawl_changes_for_watched_tags(self):
+        cache = {"tournaments": [tournament("#A")]}
+        with patch.object(app_module, "APP_PASSWORD", ""), patch.object(app_module, "_SEARCH_CACHE", cache):
+            response = self.client.get("/api/favorites/stream?tags=A")
+            chunks = iter(response.response)
+            self.assertEqual(next(chunks), b"retry: 5000\n\n")
+            snapshot = next(chunks).decode()
+            app_module._TAG_WATCH_HUB.publish([tournament("#A", status="inProgress")])
+            update = next(chunks).decode()
+            response.close()
+
+        self.assertEqual(parse_events([snapshot])[0][0], "snapshot")
+        self.assertEqual(parse_events([update])[0][1]["tournaments"][0]["status"], "inProgress")
+        self.assertEqual(app_module._TAG_WATCH_HUB.watched_tags(), [])
+
+    def test_client_gone_before_the_first_chunk_leaves_no_subscription(self):
+        with patch.object(app_module, "APP_PASSWORD", ""):
+            self.client.get("/api/favorites/stream?tags=A").close()
+            response = self.client.get("/api/favorites/stream?tags=A")
+            first = next(iter(response.response))
+            response.close()
+
+        self.assertEqual(first, b"retry: 5000\n\n")
+        self.assertEqual(app_module._TAG_WATCH_HUB.watched_tags(), [])
+
+    def test_clients_beyond_the_threaded_slots_get_a_snapshot_and_reconnect_later(self):
+        cache = {"tournaments": [tournament("#A")]}
+        with patch.object(app_module, "APP_PASSWORD", ""), patch.object(app_module, "_SEARCH_CACHE", cache), \
+                patch.object(app_module, "_FAVORITES_STREAM_SLOTS", app_module.threading.Semaphore(0)):
+            body = self.client.get("/api/favorites/stream?tags=A").get_data(as_text=True)
+
+        retry, snapshot = body.split("\n\n", 1)
+        self.assertEqual(retry, f"retry: {int(app_module.FAVORITES_POLL_SECONDS * 1000)}")
+        self.assertEqual(parse_events([snapshot])[0][1]["tournaments"][0]["tag"], "#A")
+        self.assertEqual(app_module._TAG_WATCH_HUB.watched_tags(), [])
+
+    def test_tags_are_required(self):
+        with patch.object(app_module, "APP_PASSWORD", ""):
+            response = self.client.get("/api/favorites/stream")
+
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
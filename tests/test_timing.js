@@ -1,7 +1,7 @@
 const test = require('node:test');
 const assert = require('node:assert/strict');
 
-const { deriveTiming, formatCountdown, parseCrTime } = require('../static/timing.js');
+const { createPhaseSchedule, deriveTiming, formatCountdown, parseCrTime } = require('../static/timing.js');
 
 const tournament = {
   status: 'inPreparation',
@@ -66,3 +66,24 @@ test('countdown formatting and CR timestamp validation are stable', () => {
   assert.equal(parseCrTime('not-a-time'), null);
   assert.equal(parseCrTime('20260714T100000.000Z').toISOString(), '2026-07-14T10:00:00.000Z');
 });
+
+test('phase schedule only reports tournaments whose boundary has passed', () => {
+  const created = Date.parse('2026-07-14T10:00:00.000Z');
+  const schedule = createPhaseSchedule([
+    { ...tournament, tag: '#LATE', createdTime: '20260714T100500.000Z' },
+    { ...tournament, tag: '#SOON' },
+    { ...tournament, tag: '#ENDED', status: 'ended' },
+  ], created);
+
+  assert.equal(schedule.size(), 2);
+  assert.equal(schedule.nextAtMs(), created + 600 * 1000);
+  assert.deepEqual(schedule.due(created + 599 * 1000), []);
+
+  const started = schedule.due(created + 600 * 1000);
+  assert.deepEqual(started.map(c => [c.tournament.tag, c.previous, c.status]), [['#SOON', 'inPreparation', 'inProgress']]);
+  assert.equal(schedule.status('#LATE'), 'inPreparation');
+
+  const later = schedule.due(created + 2400 * 1000);
+  assert.deepEqual(later.map(c => [c.tournament.tag, c.status]).sort(), [['#LATE', 'inProgress'], ['#SOON', 'ended']]);
+  assert.equal(schedule.status('#ENDED'), 'ended');
+});
@@ -0,0 +1,156 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import app as app_module
+
+
+def tournament(tag, status="inPreparation", capacity=3, mode_id=72000009, level_cap=11, type_="open"):
+    return {"tag": tag, "name": f"Cup {tag}", "type": type_, "status": status, "capacity": capacity,
+            "maxCapacity": 50, "levelCap": level_cap, "gameMode": {"id": mode_id},
+            "createdTime": "20260714T100000.000Z", "preparationDuration": 600, "duration": 1800}
+
+
+class TournamentStoreTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = app_module.TournamentStore(os.path.join(tmp.name, "tournaments.db"), history_hours=1)
+        self.addCleanup(lambda: self.store._connect().close())
+
+    def test_database_runs_in_wal_mode(self):
+        mode = self.store._connect().execute("PRAGMA journal_mode").fetchone()[0]
+
+        self.assertEqual(mode, "wal")
+
+    def test_query_filters_the_latest_crawl_in_sql(self):
+        first = self.store.record_crawl([tournament("#GONE")], 1000.0, {})
+        latest = self.store.record_crawl([
+            tournament("#A", capacity=10, level_cap=15),
+            tournament("#B", status="inProgress", capacity=10, level_cap=15),
+            tournament("#C", capacity=1, level_cap=15),
+            tournament("#D", capacity=10, level_cap=15, type_="passwordProtected"),
+            tournament("#E", capacity=10, level_cap=11, mode_id=1),
+        ], 1010.0, {})
+
+        def tags(**filters):
+            return [t["tag"] for t in self.store.query(filters)]
+
+        self.assertEqual(tags(), ["#A", "#B", "#C", "#D", "#E"])
+        self.assertEqual(tags(tournament_type="open", status="inPreparation", level_caps=["15"], min_players=5),
+                         ["#A"])
+        self.assertEqual(tags(game_modes=["1"], max_players=10), ["#E"])
+        self.assertEqual(tags(level_caps=["x"]), [])
+        self.assertEqual([t["tag"] for t in self.store.query({}, crawl_id=latest)], tags())
+        self.assertIsNone(self.store.query({}, crawl_id=first))
+
+    def test_history_records_only_changes(self):
+        for ts, capacity in ((1000.0, 3), (1010.0, 3), (1020.0, 25)):
+            self.store.record_crawl([tournament("#A", capacity=capacity), tournament("#B")], ts, {})
+
+        points = self.store.history("#A")
+
+        self.assertEqual([(p["ts"], p["players"]) for p in points], [(1000.0, 3), (1020.0, 25)])
+        self.assertEqual(points[-1]["fillRate"], 0.5)
+        totals = self.store.history()
+        self.assertEqual([t["tournaments"] for t in totals], [2, 2, 2])
+        self.assertAlmostEqual(totals[-1]["fillRate"], (25 / 50 + 3 / 50) / 2)
+
+    def test_old_crawls_and_finished_tournaments_are_pruned(self):
+        self.store.record_crawl([tournament("#OLD")], 1000.0, {})
+        self.store.record_crawl([tournament("#NEW")], 1000.0 + 7200, {"queries_completed": 4})
+
+        self.assertEqual(self.store.history("#OLD"), [])
+        self.assertEqual([t["tournaments"] for t in self.store.history()], [1])
+        tournaments, ts, stats, _ = self.store.load_latest()
+        self.assertEqual([t["tag"] for t in tournaments], ["#NEW"])
+        self.assertEqual((ts, stats), (8200.0, {"queries_completed": 4}))
+
+    def test_search_cache_is_rebuilt_from_the_store(self):
+        crawl_id = self.store.record_crawl([tournament("#A")], 1000.0, {"search_confidence": "high"})
+
+        with patch.object(app_module, "_TOURNAMENT_STORE", self.store):
+            cache = app_module.load_stored_search_cache()
+            tournaments = app_module.search_cache_tournaments(cache)
+
+        self.assertNotIn("tournaments", cache)
+        self.assertEqual((cache["total"], tournaments), (1, [tournament("#A")]))
+        self.assertEqual(cache["crawl_id"], crawl_id)
+        self.assertEqual(cache["fetched_at_ts"], 1000.0)
+        self.assertEqual(cache["stats"]["search_confidence"], "high")
+
+
+class TournamentStoreRouteTests(unittest.TestCase):
+    def setUp(self):
+        app_module.app.config.update(TESTING=True)
+        self.client = app_module.app.test_client()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = app_module.TournamentStore(os.path.join(tmp.name, "tournaments.db"))
+        for p in (patch.object(app_module, "APP_PASSWORD", ""),
+                  patch.object(app_module, "has_api_key", return_value=True),
+                  patch.object(app_module, "_TOURNAMENT_STORE", self.store),
+                  patch.object(app_module, "_SEARCH_CACHE", None),
+                  patch.object(app_module, "_TAG_WATCH_HUB", app_module.TagWatchHub())):
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_filtered_search_reads_the_stored_crawl(self):
+        app_module._store_search_cache([tournament("#A", capacity=10), tournament("#B", capacity=1)], 180)
+
+        with patch.object(app_module, "filter_tournaments", wraps=app_module.filter_tournaments) as spy:
+            response = self.client.get("/api/tournaments?min_players=5&status=inPreparation")
+
+        self.assertEqual([t["tag"] for t in spy.call_args_list[0].args[0]], ["#A"])
+        self.assertEqual(response.get_json()["unfilteredTotal"], 2)
+
+    def test_crawl_is_kept_in_the_store_not_in_memory(self):
+        app_module._store_search_cache([tournament("#A", capacity=10), tournament("#B", capacity=1)], 180)
+
+        self.assertNotIn("tournaments", app_module._SEARCH_CACHE)
+        self.assertEqual(app_module._SEARCH_CACHE["total"], 2)
+        states = app_module.current_watch_states(["#B"])
+        self.assertEqual(states["#B"]["players"], 1)
+
+    def test_search_follows_a_newer_crawl_another_worker_stored(self):
+        app_module._store_search_cache([tournament("#A", capacity=10), tournament("#B", capacity=1)], 180)
+        # Another worker sharing the database records a newer crawl.
+        newer = self.store.record_crawl([tournament("#N", capacity=10)], time.time() + 1, {})
+
+        data = self.client.get("/api/tournaments?min_players=5&status=inPreparation").get_json()
+
+        self.assertEqual(app_module._SEARCH_CACHE["crawl_id"], newer)
+        self.assertEqual([t["tag"] for t in data["tournaments"]], ["#N"])
+        self.assertEqual(data["unfilteredTotal"], 1)
+
+    def test_details_of_stored_matches_reach_the_store(self):
+        live = tournament("#A", status="inProgress", capacity=10)
+        app_module._store_search_cache([live, tournament("#B", capacity=1)], 180)
+        detail = dict(live, startedTime="20260714T101000.000Z")
+
+        async def fetch_detail(session, tag, span=None):
+            return detail
+
+        with patch.object(app_module, "fetch_tournament_detail_async", fetch_detail), \
+                patch.dict(app_module._DETAIL_CACHE, clear=True):
+            self.client.get("/api/tournaments?status=inProgress")
+
+        self.assertEqual(self.store.query({})[0]["startedTime"], "20260714T101000.000Z")
+        self.assertGreater(app_module._SEARCH_CACHE["revised_at_ts"], app_module._SEARCH_CACHE["fetched_at_ts"])
+
+    def test_history_route_returns_change_points(self):
+        now = time.time()
+        self.store.record_crawl([tournament("#A", capacity=3)], now - 60, {})
+        self.store.record_crawl([tournament("#A", capacity=9)], now, {})
+
+        data = self.client.get("/api/tournaments/history?tag=a&hours=1").get_json()
+
+        self.assertEqual(data["tag"], "#A")
+        self.assertEqual([p["players"] for p in data["points"]], [3, 9])
+        self.assertTrue(data["points"][0]["ts"].endswith("+00:00"))
+
+
+if __name__ == "__main__":
+    unittest.main()
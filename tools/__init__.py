@@ -0,0 +1 @@
+"""Developer tooling: local API stand-ins, benchmarks and load tests."""
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Offline crawl benchmark against the local mock Royale API.
+
+Runs the real fetch_all_tournaments_async() against tools.mock_royale_api for
+every combination of the given crawler settings and reports wall time,
+request count, rate-limit hits and coverage (found / actual).
+
+    python -m tools.bench_crawl --tournaments 5000 --workers 10,25,50 --threshold 20,100
+
+--shards and --json-decode are crossed like the other settings, but they
+interact: with CRAWL_SHARDS > 1 every shard process decodes its own
+responses, so JSON_DECODE_MODE=process starts a decode pool inside each
+shard (shards x JSON_DECODE_WORKERS processes). Compare decode modes at
+--shards 1 unless that nesting is what you want to measure.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+import app as finder
+from tools.mock_royale_api import build_arg_parser, mock_from_args
+
+SETTING_FLAGS = {
+    'workers': 'SEARCH_WORKERS',
+    'verify_workers': 'VERIFY_WORKERS',
+    'threshold': 'QUERY_DRILLDOWN_THRESHOLD',
+    'max_query_len': 'MAX_QUERY_LEN',
+    'max_cyrillic_len': 'MAX_CYRILLIC_QUERY_LEN',
+    'max_arabic_len': 'MAX_ARABIC_QUERY_LEN',
+    'verification_passes': 'MAX_VERIFICATION_PASSES',
+    'shards': 'CRAWL_SHARDS',
+    'json_decode': 'JSON_DECODE_MODE',
+}
+STRING_SETTINGS = {'json_decode'}
+SETTING_HELP = {
+    'shards': "comma-separated CRAWL_SHARDS values (each shard decodes with JSON_DECODE_MODE itself)",
+}
+
+
+@contextmanager
+def crawler_environment(api_base, settings):
+    """Point the crawler at `api_base` with env `settings`, restoring everything afterwards."""
+    overrides = dict(settings)
+    overrides.setdefault('CR_API_KEY', os.environ.get('CR_API_KEY') or 'benchmark')
+    # Keep the environment in step with finder.API_BASE (tools read either).
+    overrides['CR_API_BASE'] = api_base
+    saved_env = {key: os.environ.get(key) for key in overrides}
+    saved_api_base = finder.API_BASE
+    saved_event_log = finder.event_log
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep synthetic tags out of the real tournament event log.
+        finder.event_log = finder.TournamentEventLog(
+            os.path.join(tmp, 'events.jsonl'), os.path.join(tmp, 'events.idx')
+        )
+        os.environ.update({key: str(value) for key, value in overrides.items()})
+        finder.API_BASE = api_base
+        try:
+            yield
+        finally:
+            finder.event_log.flush()
+            finder.API_BASE = saved_api_base
+            finder.event_log = saved_event_log
+            for key, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+
+async def run_crawl_benchmark(mock, settings=None):
+    """Crawl `mock` once with env `settings` and return the measurements."""
+    settings = settings or {}
+    api_base = await mock.start()
+    mock.reset_counters()
+    try:
+        with crawler_environment(api_base, settings):
+            started = time.perf_counter()
+            found = await finder.fetch_all_tournaments_async()
+            wall_time = time.perf_counter() - started
+            stats = finder._snapshot_search_stats()
+    finally:
+        await mock.stop()
+
+    actual = mock.reachable_tags()
+    found_tags = {t['tag'] for t in found}
+    return {
+        'settings': dict(settings),
+        'wall_time_sec': round(wall_time, 3),
+        'requests': mock.search_requests,
+        'rate_limit_hits': mock.rate_limited,
+        'injected_errors': mock.errors,
+        'found': len(found_tags & actual),
+        'actual': len(actual),
+        'coverage': round(len(found_tags & actual) / len(actual), 4) if actual else 1.0,
+        'drill_downs': stats['drill_downs'],
+        'failed_queries': stats['failed_queries'],
+        'saturated_queries': stats['saturated_queries'],
+        'confidence': stats['search_confidence'],
+    }
+
+
+def _int_list(value):
+    return [int(v) for v in value.split(',') if v.strip()]
+
+
+def _str_list(value):
+    return [v.strip() for v in value.split(',') if v.strip()]
+
+
+def settings_matrix(args):
+    """Cartesian product of every setting given on the command line."""
+    axes = [
+        [(env_name, v) for v in getattr(args, flag)]
+        for flag, env_name in SETTING_FLAGS.items()
+        if getattr(args, flag)
+    ]
+    return [dict(combo) for combo in itertools.product(*axes)] if axes else [{}]
+
+
+def format_table(results):
+    header = f"{'settings':<66} {'wall s':>8} {'requests':>9} {'429s':>6} {'coverage':>9} {'found/actual':>13}"
+    lines = [header, '-' * len(header)]
+    for r in results:
+        label = ' '.join(f"{k}={v}" for k, v in r['settings'].items()) or '(defaults)'
+        lines.append(
+            f"{label:<66} {r['wall_time_sec']:>8.2f} {r['requests']:>9} {r['rate_limit_hits']:>6} "
+            f"{r['coverage']:>9.2%} {r['found']:>6}/{r['actual']:<6}"
+        )
+    return '\n'.join(lines)
+
+
+async def run_matrix(args):
+    results = []
+    for settings in settings_matrix(args):
+        # A fresh mock per run so RNG-driven fault injection is reproducible.
+        results.append(await run_crawl_benchmark(mock_from_args(args), settings))
+    return results
+
+
+def main():
+    parser = build_arg_parser()
+    for flag, env_name in SETTING_FLAGS.items():
+        parser.add_argument(f"--{flag.replace('_', '-')}", dest=flag, default=[],
+                            type=_str_list if flag in STRING_SETTINGS else _int_list,
+                            help=SETTING_HELP.get(flag, f"comma-separated {env_name} values"))
+    parser.add_argument('--json', action='store_true', help='print raw JSON results')
+    args = parser.parse_args()
+
+    results = asyncio.run(run_matrix(args))
+    print(json.dumps(results, indent=2) if args.json else format_table(results))
+
+
+if __name__ == '__main__':
+    main()
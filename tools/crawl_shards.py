@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Run crawl shards on separate machines and merge them.
+
+The seed queries are split by first character exactly as CRAWL_SHARDS does
+in-process (app.shard_queries), so shards never overlap. Each node runs one
+shard with its own API key and environment:
+
+    python -m tools.crawl_shards run --shard 0 --of 3 --out shard-0.json
+    python -m tools.crawl_shards run --shard 1 --of 3 --out shard-1.json
+    python -m tools.crawl_shards run --shard 2 --of 3 --out shard-2.json
+
+Then one node merges them (tags deduped, stats combined like a single crawl):
+
+    python -m tools.crawl_shards merge shard-*.json --out tournaments.json
+"""
+
+import argparse
+import json
+
+import app as finder
+
+
+def shard_result_to_json(result, shard, of):
+    return {
+        "shard": shard,
+        "of": of,
+        "tournaments": list(result["tournaments"].values()),
+        "stats": {k: v for k, v in result["stats"].items() if k != 'tournaments_by_mode'},
+        "retried": sorted(result["retried"]),
+        "unresolved": sorted(result["unresolved"]),
+        "saturated": sorted(result["saturated"]),
+    }
+
+
+def shard_result_from_json(data):
+    return {
+        "tournaments": {t['tag']: t for t in data["tournaments"]},
+        "stats": data["stats"],
+        "retried": set(data["retried"]),
+        "unresolved": set(data["unresolved"]),
+        "saturated": set(data["saturated"]),
+    }
+
+
+def run_shard(shard, of):
+    queries = finder.shard_queries(finder.build_seed_queries(), of)[shard]
+    # A shard on its own node gets the node's full worker and key budget.
+    result = finder.run_crawl_shard(queries, shard_count=1, shard_index=shard)
+    return shard_result_to_json(result, shard, of)
+
+
+def merge_files(paths):
+    shards = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            shards.append(json.load(f))
+    expected = {s["of"] for s in shards}
+    if len(expected) != 1:
+        raise SystemExit(f"Shard files come from different splits: of={sorted(expected)}")
+    missing = set(range(expected.pop())) - {s["shard"] for s in shards}
+    tournaments, stats, _, _ = finder.merge_crawl_results([shard_result_from_json(s) for s in shards])
+    return {
+        "tournaments": list(tournaments.values()),
+        "stats": finder.build_search_stats_payload(stats),
+        "missingShards": sorted(missing),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run or merge crawl shards.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run = commands.add_parser('run', help='crawl one shard with this machine\'s environment')
+    run.add_argument('--shard', type=int, required=True)
+    run.add_argument('--of', type=int, required=True)
+    run.add_argument('--out', required=True)
+    merge = commands.add_parser('merge', help='merge shard files into one crawl result')
+    merge.add_argument('paths', nargs='+')
+    merge.add_argument('--out', required=True)
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        if not 0 <= args.shard < args.of:
+            raise SystemExit('--shard must be between 0 and --of - 1')
+        output = run_shard(args.shard, args.of)
+        print(f"Shard {args.shard}/{args.of}: {len(output['tournaments'])} tournaments, "
+              f"{output['stats']['queries_completed']} queries")
+    else:
+        output = merge_files(args.paths)
+        if output["missingShards"]:
+            print(f"WARNING: missing shards {output['missingShards']}; coverage is partial")
+        print(f"Merged {len(args.paths)} shards: {len(output['tournaments'])} tournaments, "
+              f"confidence {output['stats']['confidence']}")
+
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(output, f, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Offline crawl auto-tuner built on recorded crawl traces.
+
+Record traces from real crawls with CRAWL_TRACE_DIR=/some/dir, then:
+
+    python -m tools.crawl_tuner /some/dir/crawl-*.jsonl.gz --target-coverage 0.99
+
+Every tag/name pair seen in the traces becomes the replay population for the
+mock Royale API, so the real crawler can be run against it with other
+settings. Latency replays the recorded median. 429s replay the recorded rate,
+scaled linearly with SEARCH_WORKERS relative to the recorded worker count;
+that scaling is a model, not a measurement. Coverage is measured against the
+union of everything the traces saw.
+
+The tuner picks the cheapest settings (fewest requests, then wall time) that
+reach the target coverage and prints them as environment values.
+"""
+
+import argparse
+import asyncio
+import gzip
+import itertools
+import json
+import statistics
+
+import app as finder
+from tools.bench_crawl import SETTING_FLAGS, STRING_SETTINGS, _int_list, _str_list, format_table, run_crawl_benchmark
+from tools.mock_royale_api import MockRoyaleAPI
+
+DEFAULT_GRID = {
+    'SEARCH_WORKERS': [10, 25, 50],
+    'QUERY_DRILLDOWN_THRESHOLD': [20, 100],
+    'MAX_QUERY_LEN': [3, 4],
+}
+
+# Settings of one crawler process; CRAWL_SHARDS multiplies processes, which
+# the replay's 429 model (scaled by SEARCH_WORKERS) does not account for.
+TUNER_FLAGS = {flag: env_name for flag, env_name in SETTING_FLAGS.items() if env_name != 'CRAWL_SHARDS'}
+
+
+def load_trace(path):
+    """Return (meta, query records, summary) from one gzip JSON-lines trace."""
+    meta, queries, summary = {}, [], {}
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            record = json.loads(line)
+            if record.get('type') == 'meta':
+                meta = record
+            elif record.get('type') == 'summary':
+                summary = record
+            elif record.get('type') == 'query':
+                queries.append(record)
+    return meta, queries, summary
+
+
+class TraceProfile:
+    """What the replay needs from one or more traces."""
+
+    def __init__(self, paths):
+        self.population = {}
+        latencies = []
+        attempts = 0
+        rate_limits = 0
+        workers = []
+        for path in paths:
+            meta, queries, summary = load_trace(path)
+            for q in queries:
+                attempts += q.get('attempts', 1)
+                if q.get('ok'):
+                    latencies.append(q['elapsed'] / max(1, q.get('attempts', 1)))
+                for tag, name in q.get('items', []):
+                    if tag:
+                        self.population[tag] = name or ''
+            rate_limits += int(summary.get('rateLimits', 0) or 0)
+            recorded_workers = (meta.get('settings') or {}).get('SEARCH_WORKERS')
+            workers.append(int(recorded_workers or 25))
+        self.latency = statistics.median(latencies) if latencies else 0.0
+        self.rate_limit_rate = rate_limits / attempts if attempts else 0.0
+        self.recorded_workers = max(workers) if workers else 25
+
+    def tournaments(self):
+        return [
+            {'tag': tag, 'name': name, 'status': 'inPreparation', 'gameMode': {'id': 72000009}}
+            for tag, name in sorted(self.population.items())
+        ]
+
+    def rate_limit_rate_for(self, workers):
+        return min(0.9, self.rate_limit_rate * workers / max(1, self.recorded_workers))
+
+
+def candidate_settings(grid):
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+
+
+def pick_best(results, target_coverage):
+    """Cheapest run meeting the target; the best-covering run if none does."""
+    eligible = [r for r in results if r['coverage'] >= target_coverage]
+    if eligible:
+        return min(eligible, key=lambda r: (r['requests'], r['wall_time_sec']))
+    return max(results, key=lambda r: (r['coverage'], -r['requests']))
+
+
+async def tune(profile, grid, latency_scale=1.0, seed=0):
+    tournaments = profile.tournaments()
+    results = []
+    for settings in candidate_settings(grid):
+        workers = int(settings.get('SEARCH_WORKERS', 25))
+        mock = MockRoyaleAPI(
+            tournaments,
+            latency=profile.latency * latency_scale,
+            rate_limit_rate=profile.rate_limit_rate_for(workers),
+            seed=seed,
+        )
+        results.append(await run_crawl_benchmark(mock, settings))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Recommend crawler settings from recorded crawl traces.')
+    parser.add_argument('traces', nargs='+', help='crawl-*.jsonl.gz files written via CRAWL_TRACE_DIR')
+    parser.add_argument('--target-coverage', type=float, default=0.99)
+    parser.add_argument('--latency-scale', type=float, default=0.1,
+                        help='multiply replayed latency (lower = faster tuning, same request counts)')
+    parser.add_argument('--seed', type=int, default=0)
+    for flag, env_name in TUNER_FLAGS.items():
+        parser.add_argument(f"--{flag.replace('_', '-')}", dest=flag, default=None,
+                            type=_str_list if flag in STRING_SETTINGS else _int_list,
+                            help=f"comma-separated {env_name} candidates")
+    args = parser.parse_args()
+
+    grid = dict(DEFAULT_GRID)
+    for flag, env_name in TUNER_FLAGS.items():
+        values = getattr(args, flag)
+        if values:
+            grid[env_name] = values
+
+    profile = TraceProfile(args.traces)
+    finder.logger.setLevel('WARNING')
+    print(f"Replaying {len(profile.population)} tournaments, median latency {profile.latency * 1000:.0f} ms, "
+          f"429 rate {profile.rate_limit_rate:.2%} at {profile.recorded_workers} workers")
+
+    results = asyncio.run(tune(profile, grid, latency_scale=args.latency_scale, seed=args.seed))
+    print(format_table(results))
+
+    best = pick_best(results, args.target_coverage)
+    if best['coverage'] < args.target_coverage:
+        print(f"\nNo candidate reached {args.target_coverage:.2%} coverage; best was {best['coverage']:.2%}.")
+    print(f"\n# Recommended ({best['requests']} requests, {best['coverage']:.2%} coverage)")
+    for name, value in best['settings'].items():
+        print(f"{name}={value}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Local Redis-protocol key-value server for the shared cache backend.
+
+Implements just what app.RespCacheBackend sends, in memory:
+  - PING, AUTH (any password), SELECT (one keyspace)
+  - GET, SET with EX/PX/NX/XX, DEL
+  - EVAL of the lock compare-and-delete and compare-and-pexpire scripts (no general Lua)
+
+    python -m tools.kv_server --port 6379
+    CACHE_BACKEND_URL=redis://127.0.0.1:6379/0 python app.py
+"""
+
+import argparse
+import asyncio
+import time
+
+
+class KVServer:
+    def __init__(self):
+        self.data = {}  # key -> (value, expires_at or None)
+        self._server = None
+        self._clients = {}  # handler task -> writer
+
+    def _get(self, key):
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self.data[key]
+            return None
+        return value
+
+    def _set(self, args):
+        key, value, options = args[0], args[1], [a.upper() for a in args[2:]]
+        expires_at = None
+        if b'EX' in options:
+            expires_at = time.time() + int(args[2 + options.index(b'EX') + 1])
+        if b'PX' in options:
+            expires_at = time.time() + int(args[2 + options.index(b'PX') + 1]) / 1000
+        exists = self._get(key) is not None
+        if (b'NX' in options and exists) or (b'XX' in options and not exists):
+            return None
+        self.data[key] = (value, expires_at)
+        return 'OK'
+
+    def _eval(self, args):
+        script, numkeys = args[0].decode(), int(args[1])
+        keys, argv = args[2:2 + numkeys], args[2 + numkeys:]
+        if "redis.call('get', KEYS[1]) == ARGV[1]" not in script:
+            raise ValueError('only the lock scripts are supported')
+        if "redis.call('del', KEYS[1])" in script:
+            if self._get(keys[0]) == argv[0]:
+                del self.data[keys[0]]
+                return 1
+            return 0
+        if "redis.call('pexpire', KEYS[1], ARGV[2])" in script:
+            if self._get(keys[0]) == argv[0]:
+                self.data[keys[0]] = (argv[0], time.time() + int(argv[1]) / 1000)
+                return 1
+            return 0
+        raise ValueError('only the lock scripts are supported')
+
+    def execute(self, args):
+        """Run one command; returns a reply value or raises ValueError for an error reply."""
+        name = args[0].upper()
+        if name == b'PING':
+            return 'PONG'
+        if name in (b'AUTH', b'SELECT'):
+            return 'OK'
+        if name == b'GET':
+            return self._get(args[1])
+        if name == b'SET':
+            return self._set(args[1:])
+        if name == b'DEL':
+            return sum(1 for key in args[1:] if self._get(key) is not None and self.data.pop(key))
+        if name == b'EVAL':
+            return self._eval(args[1:])
+        raise ValueError(f"unknown command '{name.decode()}'")
+
+    @staticmethod
+    def encode(reply):
+        if reply is None:
+            return b'$-1\r\n'
+        if isinstance(reply, int):
+            return b':%d\r\n' % reply
+        if isinstance(reply, str):
+            return f'+{reply}\r\n'.encode()
+        return b'$%d\r\n%s\r\n' % (len(reply), reply)
+
+    async def handle(self, reader, writer):
+        self._clients[asyncio.current_task()] = writer
+        try:
+            while True:
+                header = await reader.readline()
+                if not header:
+                    break
+                if not header.startswith(b'*'):
+                    writer.write(b'-ERR inline commands are not supported\r\n')
+                    break
+                args = []
+                for _ in range(int(header[1:])):
+                    length = int((await reader.readline())[1:])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+                try:
+                    writer.write(self.encode(self.execute(args)))
+                except (ValueError, IndexError) as e:
+                    writer.write(f'-ERR {e}\r\n'.encode())
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._clients.pop(asyncio.current_task(), None)
+            writer.close()
+
+    async def start(self, host='127.0.0.1', port=0):
+        """Start serving on the running loop and return a CACHE_BACKEND_URL for it."""
+        self._server = await asyncio.start_server(self.handle, host, port)
+        bound_port = self._server.sockets[0].getsockname()[1]
+        return f"redis://{host}:{bound_port}/0"
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            for writer in self._clients.values():
+                writer.close()
+            await asyncio.gather(*self._clients, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+
+async def serve(host, port):
+    server = KVServer()
+    url = await server.start(host, port)
+    print(f"Key-value server at {url}")
+    await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=6379)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Concurrent-user load test for the gunicorn deployment.
+
+Starts the mock Royale API, launches gunicorn the way the Procfile does
+(pointed at the mock through CR_API_BASE) and simulates N browsers. Each
+browser opens /api/tournaments/search/stream until the search finishes, then
+polls /api/tournaments with varied filters and sends heartbeats until the
+scenario ends. Scenarios:
+
+  cold    fresh server; browsers arrive while the first crawl runs
+  warm    the cache is primed before browsers arrive
+  expiry  short SEARCH_CACHE_TTL_SECONDS, so the cache expires under load
+
+Reported per scenario: p50/p95/p99 latency and throughput per endpoint,
+plus busy worker threads sampled from /metrics (an open SSE stream pins a
+thread under gthread, so it counts as busy). The `metrics` row is the
+scrape's own latency, i.e. how long a trivial request waits for a thread.
+
+    python -m tools.loadtest --browsers 50 --duration 30 --workers 2 --threads 4
+    python -m tools.loadtest --worker-class uvicorn.workers.UvicornWorker --app asgi:app
+"""
+
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+
+import aiohttp
+
+from tools.mock_royale_api import BASE_DIR, build_arg_parser, load_game_mode_ids, mock_from_args
+
+SCENARIOS = ('cold', 'warm', 'expiry')
+IN_FLIGHT_METRIC = 'crfinder_http_requests_in_flight'
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile; None for an empty sample."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class LoadStats:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.in_flight_samples = []
+
+    def record(self, endpoint, seconds, status):
+        self.statuses[endpoint][status] += 1
+        if status == 200:
+            self.latencies[endpoint].append(seconds)
+
+    def summary(self, duration):
+        endpoints = {}
+        for endpoint in sorted(self.statuses):
+            latencies = self.latencies[endpoint]
+            total = sum(self.statuses[endpoint].values())
+            endpoints[endpoint] = {
+                'requests': total,
+                'errors': total - self.statuses[endpoint][200],
+                'statuses': {str(k): v for k, v in self.statuses[endpoint].items()},
+                'p50_ms': _ms(percentile(latencies, 50)),
+                'p95_ms': _ms(percentile(latencies, 95)),
+                'p99_ms': _ms(percentile(latencies, 99)),
+                'throughput_rps': round(len(latencies) / duration, 2) if duration else 0.0,
+            }
+        samples = self.in_flight_samples
+        return {
+            'duration_sec': round(duration, 2),
+            'endpoints': endpoints,
+            'busy_threads': {
+                'samples': len(samples),
+                'mean': round(sum(samples) / len(samples), 2) if samples else None,
+                'max': max(samples) if samples else None,
+            },
+        }
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+def random_filters(rng, mode_ids):
+    """Query params resembling what the UI sends to /api/tournaments."""
+    params = [('status', rng.choice(['all', 'all', 'inPreparation', 'inProgress'])),
+              ('tournament_type', rng.choice(['open', 'open', 'all', 'password']))]
+    if mode_ids and rng.random() < 0.5:
+        params.extend(('game_modes', str(m)) for m in rng.sample(mode_ids, k=min(len(mode_ids), rng.randint(1, 3))))
+    if rng.random() < 0.3:
+        params.append(('level_caps', str(rng.choice([11, 13, 14, 15]))))
+    if rng.random() < 0.3:
+        params.append(('min_players', str(rng.choice([5, 20, 50]))))
+    if rng.random() < 0.3:
+        params.append(('max_remaining_minutes', str(rng.choice([10, 30, 60]))))
+    return params
+
+
+async def _timed(stats, endpoint, request_cm):
+    started = time.perf_counter()
+    try:
+        async with request_cm as resp:
+            await resp.read()
+            stats.record(endpoint, time.perf_counter() - started, resp.status)
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        stats.record(endpoint, time.perf_counter() - started, 'error')
+
+
+async def open_search_stream(session, base_url, stats, deadline):
+    """Read the SSE stream until `done`/`fail`, like app.js does on page load."""
+    started = time.perf_counter()
+    outcome = 'timeout'
+    try:
+        timeout = aiohttp.ClientTimeout(total=max(1.0, deadline - time.monotonic()))
+        async with session.get(f"{base_url}/api/tournaments/search/stream", timeout=timeout) as resp:
+            if resp.status != 200:
+                outcome = resp.status
+            else:
+                async for raw in resp.content:
+                    line = raw.decode('utf-8', 'replace').strip()
+                    if line == 'event: done':
+                        outcome = 200
+                        break
+                    if line == 'event: fail':
+                        outcome = 'fail'
+                        break
+    except asyncio.TimeoutError:
+        outcome = 'timeout'
+    except aiohttp.ClientError:
+        outcome = 'error'
+    stats.record('stream', time.perf_counter() - started, outcome)
+
+
+async def simulate_browser(session, base_url, stats, deadline, rng, mode_ids, poll_interval, heartbeat_interval):
+    await open_search_stream(session, base_url, stats, deadline)
+    next_poll = time.monotonic() + rng.uniform(0, poll_interval)
+    next_heartbeat = time.monotonic() + rng.uniform(0, heartbeat_interval)
+    while True:
+        now = time.monotonic()
+        wake = min(next_poll, next_heartbeat)
+        if wake >= deadline:
+            return
+        if wake > now:
+            await asyncio.sleep(wake - now)
+        if next_poll <= next_heartbeat:
+            params = random_filters(rng, mode_ids)
+            await _timed(stats, 'tournaments', session.get(f"{base_url}/api/tournaments", params=params))
+            next_poll = time.monotonic() + poll_interval * rng.uniform(0.5, 1.5)
+        else:
+            await _timed(stats, 'heartbeat', session.post(f"{base_url}/api/heartbeat"))
+            next_heartbeat = time.monotonic() + heartbeat_interval
+
+
+async def sample_busy_threads(session, base_url, stats, deadline, interval=0.5):
+    """Poll the in-flight gauge (minus the scrape itself).
+
+    /metrics does no work, so its latency is recorded too: it is the time a
+    request spends queued for a free thread.
+    """
+    while time.monotonic() < deadline:
+        started = time.perf_counter()
+        try:
+            async with session.get(f"{base_url}/metrics") as resp:
+                body = await resp.text()
+            stats.record('metrics', time.perf_counter() - started, resp.status)
+            for line in body.splitlines():
+                if line.startswith(IN_FLIGHT_METRIC + ' '):
+                    stats.in_flight_samples.append(max(0, int(float(line.split()[1])) - 1))
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            stats.record('metrics', time.perf_counter() - started, 'error')
+        await asyncio.sleep(interval)
+
+
+async def run_load(base_url, args, seed, prime=False):
+    """Drive one scenario against an already running server."""
+    rng = random.Random(seed)
+    mode_ids = load_game_mode_ids()
+    stats = LoadStats()
+    connector = aiohttp.TCPConnector(limit=0)
+    timeout = aiohttp.ClientTimeout(total=args.request_timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        if prime:
+            async with session.get(f"{base_url}/api/tournaments/search",
+                                   timeout=aiohttp.ClientTimeout(total=None)) as resp:
+                await resp.read()
+        started = time.monotonic()
+        deadline = started + args.duration
+        tasks = [asyncio.create_task(sample_busy_threads(session, base_url, stats, deadline))]
+        for i in range(args.browsers):
+            tasks.append(asyncio.create_task(_arrive(
+                i * args.ramp / max(1, args.browsers),
+                simulate_browser(session, base_url, stats, deadline, random.Random(rng.random()), mode_ids,
+                                 args.poll_interval, args.heartbeat_interval),
+            )))
+        await asyncio.gather(*tasks)
+        return stats.summary(time.monotonic() - started)
+
+
+async def _arrive(delay, coro):
+    await asyncio.sleep(delay)
+    await coro
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+class MockApiThread:
+    """Run the mock Royale API on its own loop so client load can't slow it down."""
+
+    def __init__(self, mock):
+        self.mock = mock
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return asyncio.run_coroutine_threadsafe(self.mock.start(), self.loop).result()
+
+    def __exit__(self, *exc):
+        asyncio.run_coroutine_threadsafe(self.mock.stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+
+class GunicornServer:
+    """gunicorn with the Procfile's flags, pointed at the mock API."""
+
+    def __init__(self, args, api_base, log_dir, cache_ttl):
+        self.port = _free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self.command = [
+            sys.executable, '-m', 'gunicorn', args.app,
+            '--worker-class', args.worker_class,
+            '--workers', str(args.workers),
+            '--threads', str(args.threads),
+            '--timeout', '180',
+            '--bind', f'127.0.0.1:{self.port}',
+        ]
+        self.env = dict(
+            os.environ,
+            CR_API_BASE=api_base,
+            CR_API_KEY='loadtest',
+            CR_FINDER_PASSWORD='',
+            CR_FINDER_LOGS_DIR=log_dir,
+            METRICS_TOKEN='',
+            SEARCH_CACHE_TTL_SECONDS=str(cache_ttl),
+        )
+        self.output_path = os.path.join(log_dir, f'gunicorn-{self.port}.out')
+        self.proc = None
+
+    def __enter__(self):
+        self._output = open(self.output_path, 'wb')
+        self.proc = subprocess.Popen(self.command, cwd=BASE_DIR, env=self.env,
+                                     stdout=self._output, stderr=subprocess.STDOUT)
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if self.proc.poll() is not None:
+                raise RuntimeError(f"gunicorn exited with {self.proc.returncode}; see {self.output_path}")
+            try:
+                with socket.create_connection(('127.0.0.1', self.port), timeout=0.5):
+                    return self
+            except OSError:
+                time.sleep(0.2)
+        raise RuntimeError(f"gunicorn did not start listening; see {self.output_path}")
+
+    def __exit__(self, *exc):
+        self.proc.terminate()
+        try:
+            self.proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+        self._output.close()
+
+
+def run_scenarios(args):
+    results = {}
+    mock = mock_from_args(args)
+    with tempfile.TemporaryDirectory() as log_dir, MockApiThread(mock) as api_base:
+        for offset, scenario in enumerate(args.scenarios):
+            ttl = args.expiry_ttl if scenario == 'expiry' else args.cache_ttl
+            with GunicornServer(args, api_base, log_dir, ttl) as server:
+                mock.reset_counters()
+                summary = asyncio.run(run_load(server.base_url, args, args.seed + offset, prime=scenario != 'cold'))
+            summary['api_requests'] = mock.requests
+            summary['cache_ttl_sec'] = ttl
+            results[scenario] = summary
+    return results
+
+
+def format_report(results, args):
+    capacity = f"{args.workers} worker(s) x {args.threads} thread(s)"
+    lines = [f"{args.browsers} browsers for {args.duration:g}s against {capacity} ({args.worker_class})", '']
+    header = f"{'scenario':<8} {'endpoint':<12} {'reqs':>6} {'errs':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'req/s':>8}"
+    lines.extend([header, '-' * len(header)])
+    fmt = lambda v: f"{v:>9.1f}" if v is not None else f"{'-':>9}"
+    for scenario, summary in results.items():
+        for endpoint, e in summary['endpoints'].items():
+            lines.append(f"{scenario:<8} {endpoint:<12} {e['requests']:>6} {e['errors']:>5} "
+                         f"{fmt(e['p50_ms'])} {fmt(e['p95_ms'])} {fmt(e['p99_ms'])} {e['throughput_rps']:>8.2f}")
+        busy = summary['busy_threads']
+        lines.append(f"{scenario:<8} busy threads per sampled worker: mean {busy['mean']}, max {busy['max']} "
+                     f"of {args.threads}; {summary['api_requests']} mock API requests")
+    return '\n'.join(lines)
+
+
+def build_parser():
+    parser = build_arg_parser()
+    parser.description = 'Simulate concurrent browsers against gunicorn + the mock Royale API.'
+    parser.set_defaults(latency_ms=60.0, jitter_ms=30.0)
+    parser.add_argument('--browsers', type=int, default=20)
+    parser.add_argument('--duration', type=float, default=20.0, help='seconds of load per scenario')
+    parser.add_argument('--ramp', type=float, default=2.0, help='seconds over which browsers arrive')
+    parser.add_argument('--poll-interval', type=float, default=3.0, help='mean seconds between /api/tournaments polls')
+    parser.add_argument('--heartbeat-interval', type=float, default=5.0)
+    parser.add_argument('--request-timeout', type=float, default=120.0)
+    parser.add_argument('--scenarios', type=lambda v: [s for s in v.split(',') if s], default=list(SCENARIOS),
+                        help=f"comma-separated subset of {','.join(SCENARIOS)}")
+    parser.add_argument('--cache-ttl', type=int, default=180)
+    parser.add_argument('--expiry-ttl', type=int, default=5, help='SEARCH_CACHE_TTL_SECONDS for the expiry scenario')
+    parser.add_argument('--app', default=os.environ.get('GUNICORN_APP', 'wsgi:app'))
+    parser.add_argument('--worker-class', default=os.environ.get('GUNICORN_WORKER_CLASS', 'gthread'))
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('WEB_CONCURRENCY', 2)))
+    parser.add_argument('--threads', type=int, default=int(os.environ.get('GUNICORN_THREADS', 4)))
+    parser.add_argument('--json', action='store_true', help='print raw JSON results')
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        raise SystemExit(f"Unknown scenario(s): {', '.join(sorted(unknown))}")
+    results = run_scenarios(args)
+    print(json.dumps(results, indent=2) if args.json else format_report(results, args))
+
+
+if __name__ == '__main__':
+    main()
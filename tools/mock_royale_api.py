@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for proxy.royaleapi.dev/v1/tournaments.
+
+Serves a synthetic, seed-reproducible tournament population with the search
+semantics the crawler relies on:
+  - word-prefix matching, case-insensitive, WITHOUT accent folding
+  - at most `limit` (capped at 100) items per response
+  - optional 429s, 5xx errors and latency injection
+  - optional per-key rate limit (token bucket per Authorization header)
+
+    python -m tools.mock_royale_api --tournaments 5000 --port 8765
+    CR_API_BASE=http://127.0.0.1:8765/v1 CR_API_KEY=mock python app.py
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from aiohttp import web
+
+RESULT_LIMIT = 100
+MAX_INDEXED_PREFIX = 8
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Word pools roughly shaped like real tournament names: lots of common Latin
+# words, plus accented, Cyrillic and Arabic words and bare numbers.
+LATIN_WORDS = [
+    'torneo', 'tornei', 'tournoi', 'turnier', 'free', 'open', 'join', 'clan',
+    'war', 'pro', 'noob', 'legend', 'champ', 'master', 'elite', 'draft',
+    'mega', 'super', 'test', 'fun', 'king', 'royal', 'cup', 'league', 'team',
+    'best', 'top', 'vs', 'gg', 'only', 'fast', 'chill', 'friends', 'family',
+]
+ACCENTED_WORDS = ['çok', 'élite', 'ñandú', 'über', 'şampiyon', 'ödül', 'ésport', 'ławka']
+CYRILLIC_WORDS = ['турнир', 'клан', 'для', 'всех', 'война', 'лига', 'быстрый', 'друзья']
+ARABIC_WORDS = ['بطولة', 'صالح', 'الملك', 'كلان', 'للجميع', 'حرب']
+NUMBER_WORDS = ['1000', '500', '100', '2026', '15', '7']
+SYLLABLES = ['ka', 'lo', 'mi', 'ra', 'zu', 'ne', 'to', 'bi', 'ex', 'qu', 'ly', 'or', 'an', 'vi', 'so']
+
+TAG_ALPHABET = '0289PYLQGRJCUV'
+
+
+def load_game_mode_ids():
+    try:
+        with open(os.path.join(BASE_DIR, 'game_modes.json'), 'r') as f:
+            return [int(mode_id) for mode_id in json.load(f)]
+    except (OSError, ValueError):
+        return [72000009]
+
+
+def format_cr_time(dt):
+    return dt.strftime('%Y%m%dT%H%M%S.000Z')
+
+
+def _random_word(rng):
+    roll = rng.random()
+    if roll < 0.45:
+        return rng.choice(LATIN_WORDS)
+    if roll < 0.75:
+        return ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4)))
+    if roll < 0.82:
+        return rng.choice(ACCENTED_WORDS)
+    if roll < 0.90:
+        return rng.choice(CYRILLIC_WORDS)
+    if roll < 0.95:
+        return rng.choice(ARABIC_WORDS)
+    return rng.choice(NUMBER_WORDS)
+
+
+def generate_population(count, seed=0, now=None):
+    """Build `count` synthetic tournaments; the same seed gives the same population."""
+    rng = random.Random(seed)
+    now = now or datetime.now(timezone.utc)
+    mode_ids = load_game_mode_ids()
+    tags = set()
+    tournaments = []
+    while len(tournaments) < count:
+        tag = '#' + ''.join(rng.choice(TAG_ALPHABET) for _ in range(rng.randint(8, 9)))
+        if tag in tags:
+            continue
+        tags.add(tag)
+
+        words = [_random_word(rng) for _ in range(rng.randint(1, 4))]
+        name = ' '.join(w.upper() if rng.random() < 0.15 else w.capitalize() for w in words)
+        max_capacity = rng.choice([50, 100, 200, 1000])
+        preparation = rng.choice([600, 1800, 3600])
+        duration = rng.choice([1800, 3600, 7200, 14400])
+        status = rng.choices(['inPreparation', 'inProgress', 'ended'], weights=[6, 3, 1])[0]
+        if status == 'inPreparation':
+            created = now - timedelta(seconds=rng.randint(0, preparation))
+        elif status == 'inProgress':
+            created = now - timedelta(seconds=preparation + rng.randint(0, duration))
+        else:
+            created = now - timedelta(seconds=preparation + duration + rng.randint(0, 3600))
+
+        tournaments.append({
+            'tag': tag,
+            'type': 'passwordProtected' if rng.random() < 0.2 else 'open',
+            'status': status,
+            'creatorTag': '#' + ''.join(rng.choice(TAG_ALPHABET) for _ in range(8)),
+            'name': name,
+            'description': '',
+            'levelCap': rng.choice([11, 13, 14, 15]),
+            'firstPlaceCardPrize': 0,
+            'capacity': rng.randint(0, max_capacity),
+            'maxCapacity': max_capacity,
+            'preparationDuration': preparation,
+            'duration': duration,
+            'createdTime': format_cr_time(created),
+            'gameMode': {'id': rng.choice(mode_ids)},
+        })
+    return tournaments
+
+
+class MockRoyaleAPI:
+    """aiohttp application emulating the tournament search and detail endpoints.
+
+    Counters (`requests`, `search_requests`, `rate_limited`, `errors`,
+    `requests_by_key`) are plain attributes so benchmarks can read them after
+    a run.
+    """
+
+    def __init__(self, tournaments, rate_limit_rate=0.0, error_rate=0.0, latency=0.0,
+                 latency_jitter=0.0, retry_after=None, max_concurrency=None, seed=0,
+                 key_rate_limit=None):
+        self.tournaments = list(tournaments)
+        self.by_tag = {t['tag']: t for t in self.tournaments}
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.retry_after = retry_after
+        self.max_concurrency = max_concurrency
+        self.key_rate_limit = key_rate_limit
+        self._key_buckets = {}
+        self._rng = random.Random(seed)
+        self._in_flight = 0
+        self._runner = None
+        self._prefix_index = self._build_prefix_index()
+        self.reset_counters()
+
+    def reset_counters(self):
+        self.requests = 0
+        self.search_requests = 0
+        self.detail_requests = 0
+        self.rate_limited = 0
+        self.errors = 0
+        self.requests_by_key = Counter()
+
+    def _build_prefix_index(self):
+        # Position in the population doubles as the API's (unknown) result order.
+        index = {}
+        for position, t in enumerate(self.tournaments):
+            for word in t['name'].lower().split():
+                for n in range(1, min(len(word), MAX_INDEXED_PREFIX) + 1):
+                    index.setdefault(word[:n], set()).add(position)
+        return index
+
+    def _matching_positions(self, query):
+        query = query.strip().lower()
+        if not query:
+            return []
+        if len(query) <= MAX_INDEXED_PREFIX:
+            return sorted(self._prefix_index.get(query, ()))
+        return sorted(
+            p for p in self._prefix_index.get(query[:MAX_INDEXED_PREFIX], ())
+            if any(w.startswith(query) for w in self.tournaments[p]['name'].lower().split())
+        )
+
+    def search_page(self, query, limit=RESULT_LIMIT):
+        """Return (items, truncated) for a word-prefix search without accent folding."""
+        positions = self._matching_positions(query)
+        limit = max(1, min(int(limit), RESULT_LIMIT))
+        return [self.tournaments[p] for p in positions[:limit]], len(positions) > limit
+
+    def search(self, query, limit=RESULT_LIMIT):
+        """Word-prefix search without accent folding, like the real API."""
+        return self.search_page(query, limit)[0]
+
+    def reachable_tags(self):
+        return set(self.by_tag)
+
+    def _key_over_budget(self, key):
+        if not self.key_rate_limit:
+            return False
+        now = time.monotonic()
+        tokens, updated = self._key_buckets.get(key, (self.key_rate_limit, now))
+        tokens = min(self.key_rate_limit, tokens + (now - updated) * self.key_rate_limit)
+        if tokens < 1:
+            self._key_buckets[key] = (tokens, now)
+            return True
+        self._key_buckets[key] = (tokens - 1, now)
+        return False
+
+    async def _inject_faults(self, request):
+        """Return an error response to send instead of the real one, or None."""
+        key = request.headers.get('Authorization', '').removeprefix('Bearer ')
+        self.requests_by_key[key] += 1
+        if self.latency or self.latency_jitter:
+            await asyncio.sleep(max(0.0, self.latency + self._rng.uniform(-1, 1) * self.latency_jitter))
+        over_limit = self.max_concurrency is not None and self._in_flight > self.max_concurrency
+        if over_limit or self._key_over_budget(key) or self._rng.random() < self.rate_limit_rate:
+            self.rate_limited += 1
+            headers = {'Retry-After': str(self.retry_after)} if self.retry_after is not None else {}
+            return web.json_response({'reason': 'requestThrottled'}, status=429, headers=headers)
+        if self._rng.random() < self.error_rate:
+            self.errors += 1
+            return web.json_response({'reason': 'unknownException'}, status=503)
+        return None
+
+    async def handle_search(self, request):
+        self.requests += 1
+        self.search_requests += 1
+        self._in_flight += 1
+        try:
+            failure = await self._inject_faults(request)
+            if failure is not None:
+                return failure
+            items, truncated = self.search_page(request.query.get('name', ''), request.query.get('limit', RESULT_LIMIT))
+            # Like the real API, a cut-off result set comes with an `after` cursor.
+            return web.json_response({'items': items, 'paging': {'cursors': {'after': 'next'} if truncated else {}}})
+        finally:
+            self._in_flight -= 1
+
+    async def handle_detail(self, request):
+        self.requests += 1
+        self.detail_requests += 1
+        self._in_flight += 1
+        try:
+            failure = await self._inject_faults(request)
+            if failure is not None:
+                return failure
+            t = self.by_tag.get(request.match_info['tag'])
+            if t is None:
+                return web.json_response({'reason': 'notFound'}, status=404)
+            detail = dict(t)
+            if t['status'] in ('inProgress', 'ended'):
+                created = datetime.strptime(t['createdTime'], '%Y%m%dT%H%M%S.%fZ')
+                detail['startedTime'] = format_cr_time(created + timedelta(seconds=t['preparationDuration']))
+            return web.json_response(detail)
+        finally:
+            self._in_flight -= 1
+
+    def make_app(self):
+        application = web.Application()
+        application.router.add_get('/v1/tournaments', self.handle_search)
+        application.router.add_get('/v1/tournaments/{tag}', self.handle_detail)
+        return application
+
+    async def start(self, host='127.0.0.1', port=0):
+        """Start serving on the running loop and return the API base URL."""
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = site._server.sockets[0].getsockname()[1]
+        return f"http://{host}:{bound_port}/v1"
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tournaments', type=int, default=3000, help='population size')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='fraction of requests answered 429')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered 503')
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--retry-after', type=float, default=None, help='Retry-After seconds on 429s')
+    parser.add_argument('--max-concurrency', type=int, default=None, help='429 above this many in-flight requests')
+    parser.add_argument('--key-rate', type=float, default=None, help='requests/s allowed per API key')
+    return parser
+
+
+def mock_from_args(args):
+    return MockRoyaleAPI(
+        generate_population(args.tournaments, seed=args.seed),
+        rate_limit_rate=args.rate_limit,
+        error_rate=args.error_rate,
+        latency=args.latency_ms / 1000.0,
+        latency_jitter=args.jitter_ms / 1000.0,
+        retry_after=args.retry_after,
+        max_concurrency=args.max_concurrency,
+        seed=args.seed,
+        key_rate_limit=args.key_rate,
+    )
+
+
+def main():
+    parser = build_arg_parser()
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+    mock = mock_from_args(args)
+    print(f"Mock Royale API with {len(mock.tournaments)} tournaments at http://{args.host}:{args.port}/v1")
+    web.run_app(mock.make_app(), host=args.host, port=args.port, access_log=None, print=None)
+
+
+if __name__ == '__main__':
+    main()